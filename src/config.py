@@ -13,10 +13,22 @@ class Config:
     """Base configuration for personal use"""
     # Database
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # SQLite pragmas applied to every new connection (see DatabaseManager._create_engine).
+    # WAL lets the background jobs write while requests read; set to None to keep SQLite defaults.
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',  # Safe with WAL, only the last commits may be lost on power failure
+        'cache_size': -64000,  # Negative means KiB, i.e. 64MB of page cache
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,  # Milliseconds to wait for a lock before raising "database is locked"
+    }
     
     # Paths
     MEDIA_ROOT = str(BASE_DIR / 'media')
     BACKUP_ROOT = str(BASE_DIR / 'backups')
+    AUDIO_CACHE_ROOT = str(INSTANCE_DIR / 'audio_cache')  # Decoded reference recordings, memory-mapped by evaluations
     
     # Media settings
     MAX_AUDIO_SIZE = 10 * 1024 * 1024  # 10MB
@@ -37,19 +49,37 @@ class Config:
     # Text Generation settings
     TEXT_GEN_INTERVAL_MINUTES = 20 # Generate text examples every 20 minutes while app is running
 
+    # Grammar scoring settings
+    LANGUAGE_TOOL_BACKEND = 'server'  # 'stub' checks without starting Java, finding no errors
+    LANGUAGE_TOOL_MAX_LANGUAGES = 2  # Each loaded language keeps a LanguageTool server in memory
+    LANGUAGE_TOOL_HEALTH_CHECK_SECONDS = 300  # Probe an instance before use after this much idle time
+    SPACY_MAX_MODELS = 4  # spaCy pipelines kept loaded, the least recently used is released first
+    SPACY_WARM_LANGUAGES = []  # ISO 639-1 codes whose spaCy pipeline is loaded at startup, e.g. ['fr']
+
+    # Evaluation models inference settings
+    INFERENCE_MAX_CONCURRENCY = 2  # Model batches running at once, over all evaluation models
+    INFERENCE_MAX_LATENCY_MS = 10  # How long a request waits for others to share its batch
+
+    # Asynchronous evaluation settings
+    EVALUATION_WORKERS = 2  # Evaluations running at once in async mode
+    EVALUATION_JOB_TTL_SECONDS = 600  # Finished jobs are kept this long for polling
+
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
     MEDIA_ROOT = str(BASE_DIR / 'media_dev')
     BACKUP_ROOT = str(BASE_DIR / 'backups_dev')
+    AUDIO_CACHE_ROOT = str(INSTANCE_DIR / 'audio_cache_dev')
     SQLALCHEMY_DATABASE_URI = f'sqlite:///{INSTANCE_DIR}/dev_languages.db'
     ENV = 'development'
 
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
+    LANGUAGE_TOOL_BACKEND = 'stub'
     MEDIA_ROOT = str(BASE_DIR / 'media_test')
     BACKUP_ROOT = str(BASE_DIR / 'backups_test')
+    AUDIO_CACHE_ROOT = str(INSTANCE_DIR / 'audio_cache_test')
     SQLALCHEMY_DATABASE_URI = f'sqlite:///{INSTANCE_DIR}/test_languages.db'
     ENV = 'testing'
 
@@ -1,5 +1,6 @@
 import logging
 import os
+import click
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flasgger import Swagger
@@ -73,6 +74,16 @@ def initialize_extensions(app: Flask) -> None:
     # Initialize database
     init_db(app)
 
+    # Configure the audio decoding, model batching, LanguageTool instances and spaCy pipelines used by evaluations
+    from ..utils.audio import audio_frontend
+    from ..utils.inference import inference_scheduler
+    from ..utils.language_tool import language_tool_pool
+    from ..utils.spacy_model import spacy_registry
+    audio_frontend.init_app(app)
+    inference_scheduler.init_app(app)
+    language_tool_pool.init_app(app)
+    spacy_registry.init_app(app)
+
     # Initialize centralized scheduler (handles ALL background tasks including backups)
     from ..core.scheduler import init_scheduler
     scheduler = init_scheduler(app)
@@ -92,6 +103,7 @@ def register_blueprints(app: Flask) -> None:
         media_bp,
         backup_bp,
         evaluate_bp,
+        review_bp,
     )
     
     # Register blueprints
@@ -105,6 +117,7 @@ def register_blueprints(app: Flask) -> None:
         media_bp,
         backup_bp,
         evaluate_bp,
+        review_bp,
     ]
     
     for blueprint in blueprints:
@@ -174,6 +187,24 @@ def register_commands(app: Flask) -> None:
         else:
             print("❌ Restore failed")
 
+    @app.cli.command()
+    def repair_scores():
+        """Rebuild the unit and language score aggregates."""
+        from ..core.database import db_manager
+        from ..core.migrations import rebuild_score_aggregates
+        with db_manager.engine.begin() as connection:
+            rebuild_score_aggregates(connection)
+        print("✅ Scores rebuilt")
+
+    @app.cli.command()
+    @click.argument('name', default='schedule')
+    @click.option('--chunk-size', default=2000, help='Rows recomputed per batch')
+    def recompute_features(name, chunk_size):
+        """Recompute a derived column of every feature table (default: the review schedule)."""
+        from .. import tasks
+        total = tasks.recompute_features(name, chunk_size=chunk_size)
+        print(f"✅ Recomputed {total} rows")
+
 
 # Health check endpoint
 def register_health_check(app: Flask) -> None:
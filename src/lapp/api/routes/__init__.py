@@ -7,6 +7,7 @@ from .exercise import bp as exercise_bp
 from .media import bp as media_bp
 from .backup import bp as backup_bp
 from .evaluate import bp as evaluate_bp
+from .review import bp as review_bp
 
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     media_bp,
     backup_bp,
     evaluate_bp,
+    review_bp,
 ]
\ No newline at end of file
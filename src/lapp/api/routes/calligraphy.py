@@ -2,7 +2,8 @@ from flask import Blueprint, request, jsonify
 from pydantic import ValidationError
 
 from ...services import CalligraphyService
-from ...schemas import CalligraphyDict
+from ...core.database import db_manager
+from ...schemas import CalligraphyDict, PageQuery
 
 bp = Blueprint('calligraphy', __name__, url_prefix='/api/calligraphy')
 calligraphy_service = CalligraphyService()
@@ -20,6 +21,22 @@ def get_all_calligraphy_from_language(language_id: str):
           required: true
           description: The ID of the language to retrieve calligraphy from
           example: "lang_L1"
+        - name: after
+          in: query
+          type: string
+          required: false
+          description: ID of the last calligraphy of the previous page; returns the page that follows it
+        - name: limit
+          in: query
+          type: integer
+          required: false
+          description: Maximum number of items per page (1-500). When after or limit is given the response is a page object.
+        - name: fields
+          in: query
+          type: string
+          required: false
+          description: Comma-separated keys to return for each calligraphy, e.g. "id,score,last_seen"
+          example: "id,score"
     responses:
         200:
             description: List of calligraphy
@@ -29,7 +46,20 @@ def get_all_calligraphy_from_language(language_id: str):
                     type: object
                     description: calligraphy object
     """
-    calligraphy = calligraphy_service.get_all(language_id=language_id, as_dict=True)
+    try:
+        query = PageQuery(**request.args)
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    if query.is_paginated or query.fields:
+        try:
+            page = calligraphy_service.get_page(language_id=language_id, after=query.after, limit=query.limit, fields=query.fields)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        # Without after/limit the response keeps the plain list shape
+        return jsonify(page if query.is_paginated else page["items"])
+
+    calligraphy = calligraphy_service.get_all(language_id=language_id, as_dict=True, load_profile="card")
     return jsonify(calligraphy)
 
 
@@ -55,7 +85,7 @@ def get_all_calligraphy_from_unit(unit_id: str):
                     type: object
                     description: calligraphy object    
     """
-    calligraphy = calligraphy_service.get_all(unit_id=unit_id, as_dict=True)
+    calligraphy = calligraphy_service.get_all(unit_id=unit_id, as_dict=True, load_profile="card")
     return jsonify(calligraphy)
 
 
@@ -79,7 +109,7 @@ def get_calligraphy(calligraphy_id: str):
                 type: object
                 description: calligraphy object
     """
-    calligraphy = calligraphy_service.get_by_id(calligraphy_id, as_dict=True)
+    calligraphy = calligraphy_service.get_by_id(calligraphy_id, as_dict=True, load_profile="card")
     
     if not calligraphy:
         return jsonify({'error': 'calligraphy not found'}), 404
@@ -208,7 +238,8 @@ def create_calligraphy():
         data = CalligraphyDict(**request.json)
         
         # Create calligraphy
-        calligraphy = calligraphy_service.create(data, as_dict=True)
+        with db_manager.unit_of_work():
+            calligraphy = calligraphy_service.create(data, as_dict=True)
         
         if calligraphy:
             return jsonify({
@@ -346,7 +377,8 @@ def update_calligraphy(calligraphy_id: str):
     try:
         data = CalligraphyDict(**request.json)
         
-        calligraphy = calligraphy_service.update(calligraphy_id, data, as_dict=True)
+        with db_manager.unit_of_work():
+            calligraphy = calligraphy_service.update(calligraphy_id, data, as_dict=True)
         
         if calligraphy:
             return jsonify({
@@ -379,7 +411,8 @@ def delete_calligraphy(calligraphy_id: str):
         404:
             description: calligraphy not found
     """
-    success = calligraphy_service.delete(calligraphy_id)
+    with db_manager.unit_of_work():
+        success = calligraphy_service.delete(calligraphy_id)
     
     if success:
         return jsonify({'success': True}), 204
@@ -422,7 +455,8 @@ def score_calligraphy():
     calligraphy_id = data['calligraphy_id']
     score = float(data['score'])
 
-    calligraphy = calligraphy_service.update_score(calligraphy_id, score, as_dict=True, include_relations=False)
+    with db_manager.unit_of_work():
+        calligraphy = calligraphy_service.update_score(calligraphy_id, score, as_dict=True, include_relations=False)
     
     if calligraphy:
         return jsonify({
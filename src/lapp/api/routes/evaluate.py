@@ -1,9 +1,22 @@
-from flask import Blueprint, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
-from ...services import EvaluatorService
+from ...services import EvaluatorService, EvaluationJobService
 
 bp = Blueprint('evaluate', __name__, url_prefix='/api/evaluate')
 evaluator_service = EvaluatorService()
+evaluation_job_service = EvaluationJobService()
+
+
+def _is_async() -> bool:
+    return request.args.get('async', '').lower() in ('1', 'true', 'yes')
+
+
+def _job_accepted(job_id: str):
+    return jsonify({
+        'job_id': job_id,
+        'status_url': f'/api/evaluate/jobs/{job_id}',
+        'events_url': f'/api/evaluate/jobs/{job_id}/events',
+    }), 202
 
 @bp.route('/text', methods=['POST'])
 def evaluate_text():
@@ -12,6 +25,12 @@ def evaluate_text():
     tags:
         - Evaluation
     parameters:
+        - name: async
+          in: query
+          type: boolean
+          required: false
+          description: "If true, return a job ID right away (202) instead of waiting for the result"
+          example: true
         - name: body
           in: body
           required: true
@@ -30,6 +49,8 @@ def evaluate_text():
                     description: "The user's text answer to evaluate"
                     required: true
     responses:
+        202:
+            description: Evaluation job started (async mode); returns job_id, status_url and events_url
         200:
             description: Text evaluated successfully
             schema:
@@ -40,6 +61,13 @@ def evaluate_text():
     """
     data = request.json
 
+    if _is_async():
+        return _job_accepted(evaluation_job_service.submit(
+            ex_id=data['exercise_id'],
+            user_input=data['user_text'],
+            input_type='text'
+        ))
+
     return evaluator_service.evaluate(
         ex_id=data['exercise_id'],
         user_input=data['user_text'],
@@ -53,6 +81,12 @@ def evaluate_speech():
     tags:
         - Evaluation
     parameters:
+        - name: async
+          in: query
+          type: boolean
+          required: false
+          description: "If true, return a job ID right away (202) instead of waiting for the result"
+          example: true
         - name: body
           in: body
           required: true
@@ -73,6 +107,8 @@ def evaluate_speech():
                     example: "/path/to/audio1.mp3"
                     description: "URL of the user's audio answer to evaluate"
     responses:
+        202:
+            description: Evaluation job started (async mode); returns job_id, status_url and events_url
         200:
             description: Speech evaluated successfully
             schema:
@@ -83,9 +119,77 @@ def evaluate_speech():
     """
     data = request.json
 
+    if _is_async():
+        return _job_accepted(evaluation_job_service.submit(
+            ex_id=data['exercise_id'],
+            user_input=data['user_audio_url'],
+            input_type='speech',
+            correct_audio_index=data.get('correct_audio_index', 0)
+        ))
+
     return evaluator_service.evaluate(
         ex_id=data['exercise_id'],
         user_input=data['user_audio_url'],
         input_type='speech',
         correct_audio_index=data.get('correct_audio_index', 0)
+    )
+
+
+@bp.route('/jobs/<job_id>', methods=['GET'])
+def get_evaluation_job(job_id):
+    """Get the state of an evaluation job started in async mode.
+    ---
+    tags:
+        - Evaluation
+    parameters:
+        - name: job_id
+          in: path
+          type: string
+          required: true
+          description: The ID of the evaluation job
+    responses:
+        200:
+            description: |
+                Job state. status is "pending", then "scored" once correct and score are set,
+                then "done" once feedback is set, or "failed" with an error
+            schema:
+                type: object
+        404:
+            description: Unknown or expired job
+    """
+    job = evaluation_job_service.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Evaluation job not found'}), 404
+    return jsonify(job)
+
+
+@bp.route('/jobs/<job_id>/events', methods=['GET'])
+def stream_evaluation_job(job_id):
+    """Stream the results of an evaluation job as server-sent events.
+    ---
+    tags:
+        - Evaluation
+    produces:
+        - text/event-stream
+    parameters:
+        - name: job_id
+          in: path
+          type: string
+          required: true
+          description: The ID of the evaluation job
+    responses:
+        200:
+            description: |
+                A "score" event with correct and score, then a "feedback" event with the feedback,
+                or an "error" event. The stream ends after the last event
+        404:
+            description: Unknown or expired job
+    """
+    if evaluation_job_service.get(job_id) is None:
+        return jsonify({'error': 'Evaluation job not found'}), 404
+
+    return Response(
+        stream_with_context(evaluation_job_service.stream(job_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
     )
\ No newline at end of file
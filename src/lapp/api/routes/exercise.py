@@ -2,7 +2,8 @@ from flask import Blueprint, request, jsonify
 from pydantic import ValidationError
 
 from ...services import ExerciseService
-from ...schemas import ExerciseDict
+from ...core.database import db_manager
+from ...schemas import ExerciseDict, PageQuery
 
 bp = Blueprint('exercise', __name__, url_prefix='/api/exercise')
 exercise_service = ExerciseService()
@@ -20,6 +21,22 @@ def get_all_exercise_from_language(language_id: str):
           required: true
           description: The ID of the language to retrieve exercise from
           example: "lang_L1"
+        - name: after
+          in: query
+          type: string
+          required: false
+          description: ID of the last exercise of the previous page; returns the page that follows it
+        - name: limit
+          in: query
+          type: integer
+          required: false
+          description: Maximum number of items per page (1-500). When after or limit is given the response is a page object.
+        - name: fields
+          in: query
+          type: string
+          required: false
+          description: Comma-separated keys to return for each exercise, e.g. "id,score,last_seen"
+          example: "id,score"
     responses:
         200:
             description: List of exercise
@@ -29,7 +46,20 @@ def get_all_exercise_from_language(language_id: str):
                     type: object
                     description: Exercise object
     """
-    exercise = exercise_service.get_all(language_id=language_id, as_dict=True)
+    try:
+        query = PageQuery(**request.args)
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    if query.is_paginated or query.fields:
+        try:
+            page = exercise_service.get_page(language_id=language_id, after=query.after, limit=query.limit, fields=query.fields)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        # Without after/limit the response keeps the plain list shape
+        return jsonify(page if query.is_paginated else page["items"])
+
+    exercise = exercise_service.get_all(language_id=language_id, as_dict=True, load_profile="card")
     return jsonify(exercise)
 
 
@@ -55,7 +85,7 @@ def get_all_exercise_from_unit(unit_id: str):
                     type: object
                     description: Exercise object
     """
-    exercise = exercise_service.get_all(unit_id=unit_id, as_dict=True)
+    exercise = exercise_service.get_all(unit_id=unit_id, as_dict=True, load_profile="card")
     return jsonify(exercise)
 
 
@@ -81,7 +111,7 @@ def get_exercise(exercise_id: str):
         404:
             description: Exercise not found
     """
-    exercise = exercise_service.get_by_id(exercise_id, as_dict=True)
+    exercise = exercise_service.get_by_id(exercise_id, as_dict=True, load_profile="card")
     
     if not exercise:
         return jsonify({'error': 'exercise not found'}), 404
@@ -177,7 +207,8 @@ def create_exercise():
         data = ExerciseDict(**request.json)
         
         # Create exercise
-        exercise = exercise_service.create(data, as_dict=True)
+        with db_manager.unit_of_work():
+            exercise = exercise_service.create(data, as_dict=True)
         
         if exercise:
             return jsonify({
@@ -283,7 +314,8 @@ def update_exercise(exercise_id: str):
     try:
         data = ExerciseDict(**request.json)
         
-        exercise = exercise_service.update(exercise_id, data, as_dict=True)
+        with db_manager.unit_of_work():
+            exercise = exercise_service.update(exercise_id, data, as_dict=True)
         
         if exercise:
             return jsonify({
@@ -316,7 +348,8 @@ def delete_exercise(exercise_id: str):
         404:
             description: Exercise not found
     """
-    success = exercise_service.delete(exercise_id)
+    with db_manager.unit_of_work():
+        success = exercise_service.delete(exercise_id)
     
     if success:
         return jsonify({'success': True}), 204
@@ -360,7 +393,8 @@ def score_exercise():
     exercise_id = data['exercise_id']
     score = float(data['score'])
 
-    exercise = exercise_service.update_score(exercise_id, score, as_dict=True, include_relations=False)
+    with db_manager.unit_of_work():
+        exercise = exercise_service.update_score(exercise_id, score, as_dict=True, include_relations=False)
     
     if exercise:
         return jsonify({
@@ -2,7 +2,8 @@ from flask import Blueprint, request, jsonify
 from pydantic import ValidationError
 
 from ...services import GrammarService
-from ...schemas import GrammarDict
+from ...core.database import db_manager
+from ...schemas import GrammarDict, PageQuery
 
 bp = Blueprint('grammar', __name__, url_prefix='/api/grammar')
 grammar_service = GrammarService()
@@ -20,6 +21,22 @@ def get_all_grammar_from_language(language_id: str):
           required: true
           description: The ID of the language to retrieve grammar for
           example: "lang_L1"
+        - name: after
+          in: query
+          type: string
+          required: false
+          description: ID of the last grammar item of the previous page; returns the page that follows it
+        - name: limit
+          in: query
+          type: integer
+          required: false
+          description: Maximum number of items per page (1-500). When after or limit is given the response is a page object.
+        - name: fields
+          in: query
+          type: string
+          required: false
+          description: Comma-separated keys to return for each grammar item, e.g. "id,score,last_seen"
+          example: "id,score"
     responses:
         200:
             description: A list of grammar items
@@ -29,7 +46,20 @@ def get_all_grammar_from_language(language_id: str):
                     type: object
                     description: "A Grammar object"
     """
-    grammar = grammar_service.get_all(language_id=language_id, as_dict=True)
+    try:
+        query = PageQuery(**request.args)
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    if query.is_paginated or query.fields:
+        try:
+            page = grammar_service.get_page(language_id=language_id, after=query.after, limit=query.limit, fields=query.fields)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        # Without after/limit the response keeps the plain list shape
+        return jsonify(page if query.is_paginated else page["items"])
+
+    grammar = grammar_service.get_all(language_id=language_id, as_dict=True, load_profile="card")
     return jsonify(grammar)
 
 
@@ -55,7 +85,7 @@ def get_all_grammar_from_unit(unit_id: str):
                     type: object
                     description: "A Grammar object"
     """
-    grammar = grammar_service.get_all(unit_id=unit_id, as_dict=True)
+    grammar = grammar_service.get_all(unit_id=unit_id, as_dict=True, load_profile="card")
     return jsonify(grammar)
 
 
@@ -80,7 +110,7 @@ def get_grammar(grammar_id: str):
         404:
             description: Grammar not found
     """
-    grammar = grammar_service.get_by_id(grammar_id, as_dict=True)
+    grammar = grammar_service.get_by_id(grammar_id, as_dict=True, load_profile="card")
     
     if not grammar:
         return jsonify({'error': 'grammar not found'}), 404
@@ -173,7 +203,8 @@ def create_grammar():
         data = GrammarDict(**request.json)
         
         # Create grammar
-        grammar = grammar_service.create(data, as_dict=True)
+        with db_manager.unit_of_work():
+            grammar = grammar_service.create(data, as_dict=True)
         
         if grammar:
             return jsonify({
@@ -278,7 +309,8 @@ def update_grammar(grammar_id: str):
     try:
         data = GrammarDict(**request.json)
         
-        grammar = grammar_service.update(grammar_id, data, as_dict=True)
+        with db_manager.unit_of_work():
+            grammar = grammar_service.update(grammar_id, data, as_dict=True)
         
         if grammar:
             return jsonify({
@@ -311,7 +343,8 @@ def delete_grammar(grammar_id: str):
         404:
             description: grammar not found
     """
-    success = grammar_service.delete(grammar_id)
+    with db_manager.unit_of_work():
+        success = grammar_service.delete(grammar_id)
     
     if success:
         return jsonify({'success': True}), 204
@@ -350,7 +383,8 @@ def score_grammar():
     grammar_id = data['grammar_id']
     score = float(data['score'])
 
-    grammar = grammar_service.update_score(grammar_id, score, as_dict=True, include_relations=False)
+    with db_manager.unit_of_work():
+        grammar = grammar_service.update_score(grammar_id, score, as_dict=True, include_relations=False)
     
     if grammar:
         return jsonify({
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from pydantic import ValidationError
 
 from ...services import LanguageService
+from ...core.database import db_manager
 from ...schemas.containers import LanguageDict
 
 bp = Blueprint('language', __name__, url_prefix='/api/languages')
@@ -22,7 +23,7 @@ def get_all_languages():
           items:
             type: object
     """
-    languages = language_service.get_all(as_dict=True)
+    languages = language_service.get_all(as_dict=True, load_profile="card")
     return jsonify(languages)
 
 
@@ -47,7 +48,7 @@ def get_language(language_id: str):
       404:
         description: Language not found
     """
-    language = language_service.get_by_id(language_id, as_dict=True)
+    language = language_service.get_by_id(language_id, as_dict=True, load_profile="card")
     
     if not language:
         return jsonify({'error': 'Language not found'}), 404
@@ -74,6 +75,10 @@ def create_language():
                 native_name:
                     type: string
                     example: "Français"
+                iso1:
+                    type: string
+                    example: "fr"
+                    description: "ISO 639-1 code, used to evaluate answers and generate audio in this language"
                 level:
                     type: string
                     example: "A1"
@@ -99,7 +104,8 @@ def create_language():
         data = LanguageDict(**request.json)
         
         # Create language
-        language = language_service.create(data, as_dict=True)
+        with db_manager.unit_of_work():
+            language = language_service.create(data, as_dict=True)
         
         if language:
             return jsonify({
@@ -137,6 +143,10 @@ def update_language(language_id: str):
                 native_name:
                     type: string
                     example: "Français"
+                iso1:
+                    type: string
+                    example: "fr"
+                    description: "ISO 639-1 code, used to evaluate answers and generate audio in this language"
                 level:
                     type: string
                     example: "A1"
@@ -176,7 +186,8 @@ def update_language(language_id: str):
     try:
         data = LanguageDict(**request.json)
         
-        language = language_service.update(language_id, data, as_dict=True)
+        with db_manager.unit_of_work():
+            language = language_service.update(language_id, data, as_dict=True)
         
         if language:
             return jsonify({
@@ -208,7 +219,8 @@ def delete_language(language_id: str):
         404:
             description: Language not found
     """
-    success = language_service.delete(language_id)
+    with db_manager.unit_of_work():
+        success = language_service.delete(language_id)
     
     if success:
         return jsonify({'success': True}), 204
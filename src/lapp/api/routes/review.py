@@ -0,0 +1,188 @@
+from flask import Blueprint, request, jsonify
+from pydantic import ValidationError
+
+from ...services import ReviewService
+from ...core.database import db_manager
+from ...schemas import ReviewSessionQuery, ReviewBatch
+
+bp = Blueprint('review', __name__, url_prefix='/api/review')
+review_service = ReviewService()
+
+@bp.route('/session', methods=['GET'])
+def get_review_session():
+    """Get a review session: the items of a language or unit most due for review.
+    ---
+    tags:
+        - Review
+    parameters:
+        - name: language_id
+          in: query
+          type: string
+          required: false
+          description: The ID of the language to review (exclusive with unit_id)
+          example: "lang_L1"
+        - name: unit_id
+          in: query
+          type: string
+          required: false
+          description: The ID of the unit to review (exclusive with language_id)
+          example: "unit_U1"
+        - name: types
+          in: query
+          type: string
+          required: false
+          description: Comma-separated feature types among vocabulary, grammar, calligraphy and exercise (defaults to vocabulary,grammar,calligraphy)
+          example: "vocabulary"
+        - name: limit
+          in: query
+          type: integer
+          required: false
+          description: Maximum number of items in the session (1-100, defaults to 20)
+          example: 20
+    responses:
+        200:
+            description: Items ordered from most to least due, each with its "type" and "priority"
+            schema:
+                type: array
+                items:
+                    type: object
+                    description: Feature object
+        400:
+            description: Invalid query parameters
+    """
+    try:
+        query = ReviewSessionQuery(**request.args)
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    if bool(query.language_id) == bool(query.unit_id):
+        return jsonify({'error': 'Exactly one of language_id and unit_id is required'}), 400
+
+    try:
+        items = review_service.build_session(
+            language_id=query.language_id,
+            unit_id=query.unit_id,
+            types=query.types,
+            limit=query.limit
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(items)
+
+
+@bp.route('/due', methods=['GET'])
+def get_due_items():
+    """Get the items of a language or unit that are due for review, most overdue first.
+    ---
+    tags:
+        - Review
+    parameters:
+        - name: language_id
+          in: query
+          type: string
+          required: false
+          description: The ID of the language to review (exclusive with unit_id)
+          example: "lang_L1"
+        - name: unit_id
+          in: query
+          type: string
+          required: false
+          description: The ID of the unit to review (exclusive with language_id)
+          example: "unit_U1"
+        - name: types
+          in: query
+          type: string
+          required: false
+          description: Comma-separated feature types among vocabulary, grammar, calligraphy and exercise (defaults to vocabulary,grammar,calligraphy)
+          example: "vocabulary"
+        - name: limit
+          in: query
+          type: integer
+          required: false
+          description: Maximum number of items returned (1-100, defaults to 20)
+          example: 20
+    responses:
+        200:
+            description: Due items ordered by due date, each with its "type"
+            schema:
+                type: array
+                items:
+                    type: object
+                    description: Feature object
+        400:
+            description: Invalid query parameters
+    """
+    try:
+        query = ReviewSessionQuery(**request.args)
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    if bool(query.language_id) == bool(query.unit_id):
+        return jsonify({'error': 'Exactly one of language_id and unit_id is required'}), 400
+
+    try:
+        items = review_service.get_due(
+            language_id=query.language_id,
+            unit_id=query.unit_id,
+            types=query.types,
+            limit=query.limit
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(items)
+
+
+@bp.route('/batch', methods=['POST'])
+def submit_review_batch():
+    """Submit the answers of a review session at once.
+    ---
+    tags:
+        - Review
+    parameters:
+        - name: body
+          in: body
+          required: true
+          schema:
+              type: object
+              properties:
+                  answers:
+                      type: array
+                      required: true
+                      description: Up to 500 answers, applied in answered_at order
+                      items:
+                          type: object
+                          properties:
+                              item_id:
+                                  type: string
+                                  example: "voc_V1"
+                                  required: true
+                                  description: The ID of the vocabulary, grammar, calligraphy or exercise answered
+                              similarity:
+                                  type: number
+                                  example: 0.8
+                                  required: true
+                                  description: Answer quality, from 0.0 (wrong) to 1.0 (perfect)
+                              answered_at:
+                                  type: string
+                                  format: date-time
+                                  example: "2025-01-01T10:00:00"
+                                  description: When the answer was given (defaults to now)
+    responses:
+        200:
+            description: Answers applied; returns the updated items, the affected units and the skipped missing IDs
+            schema:
+                type: object
+        400:
+            description: Invalid answers
+    """
+    try:
+        batch = ReviewBatch(**(request.json or {}))
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    try:
+        with db_manager.unit_of_work():
+            result = review_service.apply_reviews(batch.answers)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'success': True, **result})
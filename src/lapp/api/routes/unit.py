@@ -2,6 +2,8 @@ from flask import Blueprint, request, jsonify
 from pydantic import ValidationError
 
 from ...services import UnitService
+from ...core.database import db_manager
+from ...schemas import PageQuery
 from ...schemas.containers import UnitDict
 
 bp = Blueprint('unit', __name__, url_prefix='/api/units')
@@ -19,6 +21,22 @@ def get_all_units(language_id: str):
           type: string
           required: true
           description: The ID of the language to retrieve units from
+        - name: after
+          in: query
+          type: string
+          required: false
+          description: ID of the last unit of the previous page; returns the page that follows it
+        - name: limit
+          in: query
+          type: integer
+          required: false
+          description: Maximum number of items per page (1-500). When after or limit is given the response is a page object.
+        - name: fields
+          in: query
+          type: string
+          required: false
+          description: Comma-separated keys to return for each unit, e.g. "id,score,last_seen"
+          example: "id,score"
     responses:
         200:
             description: List of units
@@ -28,7 +46,20 @@ def get_all_units(language_id: str):
                     type: object
                     description: Unit object
     """
-    units = unit_service.get_all(language_id=language_id, as_dict=True)
+    try:
+        query = PageQuery(**request.args)
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    if query.is_paginated or query.fields:
+        try:
+            page = unit_service.get_page(language_id=language_id, after=query.after, limit=query.limit, fields=query.fields)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        # Without after/limit the response keeps the plain list shape
+        return jsonify(page if query.is_paginated else page["items"])
+
+    units = unit_service.get_all(language_id=language_id, as_dict=True, load_profile="card")
     return jsonify(units)
 
 
@@ -52,7 +83,7 @@ def get_unit(unit_id: str):
         404:
             description: Unit not found
     """
-    unit = unit_service.get_by_id(unit_id, as_dict=True)
+    unit = unit_service.get_by_id(unit_id, as_dict=True, load_profile="card")
     
     if not unit:
         return jsonify({'error': 'Unit not found'}), 404
@@ -119,7 +150,8 @@ def create_unit():
         data = UnitDict(**request.json)
         
         # Create unit
-        unit = unit_service.create(data, as_dict=True)
+        with db_manager.unit_of_work():
+            unit = unit_service.create(data, as_dict=True)
         
         if unit:
             return jsonify({
@@ -175,7 +207,8 @@ def update_unit(unit_id: str):
     try:
         data = UnitDict(**request.json)
         
-        unit = unit_service.update(unit_id, data, as_dict=True)
+        with db_manager.unit_of_work():
+            unit = unit_service.update(unit_id, data, as_dict=True)
         
         if unit:
             return jsonify({
@@ -207,7 +240,8 @@ def delete_unit(unit_id: str):
         404:
             description: Unit not found
     """
-    success = unit_service.delete(unit_id)
+    with db_manager.unit_of_work():
+        success = unit_service.delete(unit_id)
     
     if success:
         return jsonify({'success': True}), 204
@@ -4,6 +4,8 @@ import logging
 logger = logging.getLogger(__name__)
 
 from ...services import VocabularyService
+from ...core.database import db_manager
+from ...schemas import PageQuery
 from ...schemas.features import VocabularyDict
 
 bp = Blueprint('vocabulary', __name__, url_prefix='/api/vocabulary')
@@ -23,6 +25,22 @@ def get_all_vocabulary_from_language(language_id: str):
           required: true
           description: The ID of the language to retrieve vocabulary from
           example: "lang_L1"
+        - name: after
+          in: query
+          type: string
+          required: false
+          description: ID of the last vocabulary item of the previous page; returns the page that follows it
+        - name: limit
+          in: query
+          type: integer
+          required: false
+          description: Maximum number of items per page (1-500). When after or limit is given the response is a page object.
+        - name: fields
+          in: query
+          type: string
+          required: false
+          description: Comma-separated keys to return for each vocabulary item, e.g. "id,score,last_seen"
+          example: "id,score"
     responses:
         200:
             description: List of vocabulary
@@ -32,7 +50,20 @@ def get_all_vocabulary_from_language(language_id: str):
                     type: object
                     description: Vocabulary object
     """
-    vocabulary = vocabulary_service.get_all(language_id=language_id, as_dict=True)
+    try:
+        query = PageQuery(**request.args)
+    except ValidationError as e:
+        return jsonify({'error': 'Validation failed', 'details': e.errors()}), 400
+
+    if query.is_paginated or query.fields:
+        try:
+            page = vocabulary_service.get_page(language_id=language_id, after=query.after, limit=query.limit, fields=query.fields)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        # Without after/limit the response keeps the plain list shape
+        return jsonify(page if query.is_paginated else page["items"])
+
+    vocabulary = vocabulary_service.get_all(language_id=language_id, as_dict=True, load_profile="card")
     return jsonify(vocabulary)
 
 
@@ -58,7 +89,7 @@ def get_all_vocabulary_from_unit(unit_id: str):
                     type: object
                     description: Vocabulary object
     """
-    vocabulary = vocabulary_service.get_all(unit_id=unit_id, as_dict=True)
+    vocabulary = vocabulary_service.get_all(unit_id=unit_id, as_dict=True, load_profile="card")
     return jsonify(vocabulary)
 
 
@@ -82,7 +113,7 @@ def get_vocabulary(vocabulary_id: str):
         404:
             description: Vocabulary not found
     """
-    vocabulary = vocabulary_service.get_by_id(vocabulary_id, as_dict=True)
+    vocabulary = vocabulary_service.get_by_id(vocabulary_id, as_dict=True, load_profile="card")
     
     if not vocabulary:
         return jsonify({'error': 'Vocabulary not found'}), 404
@@ -198,7 +229,8 @@ def create_vocabulary():
         data = VocabularyDict(**request.json)
         
         # Create vocabulary
-        vocabulary = vocabulary_service.create(data, as_dict=True)
+        with db_manager.unit_of_work():
+            vocabulary = vocabulary_service.create(data, as_dict=True)
         
         if vocabulary:
             return jsonify({
@@ -321,7 +353,8 @@ def update_vocabulary(vocabulary_id: str):
     try:
         data = VocabularyDict(**request.json)
         
-        vocabulary = vocabulary_service.update(vocabulary_id, data, as_dict=True)
+        with db_manager.unit_of_work():
+            vocabulary = vocabulary_service.update(vocabulary_id, data, as_dict=True)
         
         if vocabulary:
             return jsonify({
@@ -353,7 +386,8 @@ def delete_vocabulary(vocabulary_id: str):
         404:
             description: Vocabulary not found    
     """
-    success = vocabulary_service.delete(vocabulary_id)
+    with db_manager.unit_of_work():
+        success = vocabulary_service.delete(vocabulary_id)
     
     if success:
         return jsonify({'success': True}), 204
@@ -395,7 +429,8 @@ def score_vocabulary():
     vocabulary_id = data['vocabulary_id']
     score = float(data['score'])
 
-    vocabulary = vocabulary_service.update_score(vocabulary_id, score, as_dict=True, include_relations=False)
+    with db_manager.unit_of_work():
+        vocabulary = vocabulary_service.update_score(vocabulary_id, score, as_dict=True, include_relations=False)
     
     if vocabulary:
         return jsonify({
@@ -1,10 +1,14 @@
 # src/lapp/core/database.py
 import logging
+import math
+import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Type, TypeVar, Any
+from typing import Iterator, Optional, Type, TypeVar, Any
 
 import sqlalchemy
-from sqlalchemy import create_engine, select
+from sqlalchemy import Column, Integer, String, create_engine, event, func, make_url, select, tuple_, update
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, scoped_session, selectinload
 from sqlalchemy.inspection import inspect
@@ -19,6 +23,47 @@ Base = declarative_base()
 # Type variable for model classes
 model_types = TypeVar('T', bound="Base")
 
+# ID prefixes and letters for each model
+ID_PREFIXES = {
+    "Language": "lang_L",
+    "Unit": "unit_U",
+    "Vocabulary": "voc_V",
+    "Grammar": "gram_G",
+    "Calligraphy": "call_C",
+    "Exercise": "ex_E",
+    "Character": "char_C",
+    "Word": "word_W",
+    "Passage": "pass_P",
+}
+
+# Relationship loading profiles, see DatabaseManager._load_relationships.
+# Each profile maps a model name to the relationships to eager-load with it:
+# None loads the related rows entirely, a list of column names loads only those
+# columns (e.g. ["id"] for relationships serialized as ID lists).
+#   - "ids_only": the row's own columns, no relationships (existence checks, scores, foreign keys)
+#   - "card": exactly what the model's to_dict() reads, used by the API routes
+#   - "full": every relationship fully loaded, for callers walking the object graph
+LOAD_PROFILES: dict[str, dict[str, dict[str, Optional[list[str]]]]] = {
+    "ids_only": {},
+    "card": {
+        "Language": {"unit": ["id"]},
+        "Unit": {"calligraphy": ["id"], "grammar": ["id"], "vocabulary": ["id"], "exercise": ["id"]},
+        "Vocabulary": {"word": None, "example_sentences": None},
+        "Grammar": {"learnable_sentences": None},
+        "Calligraphy": {"character": None, "example_word": None},
+        "Exercise": {"vocabulary_links": None, "calligraphy_links": None, "grammar_links": None},
+        "Word": {"vocabulary": ["id"], "calligraphy": ["id"]},
+        "Character": {"calligraphy": ["id"]},
+    },
+}
+
+class IdSequence(Base):
+    """Last numeric ID allocated for each model, used by DatabaseManager.reserve_ids."""
+    __tablename__ = 'id_sequence'
+
+    model = Column(String, primary_key=True)
+    last_value = Column(Integer, nullable=False, default=0)
+
 class DatabaseManager:
     """
     Manages database connections, sessions, and CRUD operations.
@@ -27,27 +72,40 @@ class DatabaseManager:
     including initialization, session management, and common CRUD methods.
     """
     
-    def __init__(self, database_uri: Optional[str] = None):
+    def __init__(self, database_uri: Optional[str] = None, sqlite_pragmas: Optional[dict[str, Any]] = None):
         """
         Initialize the DatabaseManager.
         
         Args:
             database_uri: SQLAlchemy database URI. If None, will be set later via init_app()
+            sqlite_pragmas: PRAGMA name/value pairs run on every new SQLite connection
         """
         self.engine: Optional[sqlalchemy.engine.Engine] = None
         self.SessionLocal: Optional[sessionmaker] = None
         self._scoped_session: Optional[scoped_session] = None
+        self._unit_of_work = threading.local()  # Nesting depth of unit_of_work() per thread
         
         if database_uri:
-            self._create_engine(database_uri)
+            self._create_engine(database_uri, sqlite_pragmas)
     
-    def _create_engine(self, database_uri: str) -> None:
+    def _create_engine(self, database_uri: str, sqlite_pragmas: Optional[dict[str, Any]] = None) -> None:
         """Create SQLAlchemy engine and session factory."""
+        url = make_url(database_uri)
+        is_sqlite = url.get_backend_name() == 'sqlite'
+        is_sqlite_file = is_sqlite and url.database not in (None, '', ':memory:')
+
         self.engine = create_engine(
             database_uri,
             echo=False,  # Set to True for SQL debugging
-            pool_pre_ping=True,  # Verify connections before using
+            # A local SQLite file cannot drop the connection, so skip the ping on every checkout
+            pool_pre_ping=not is_sqlite_file,
         )
+
+        if is_sqlite and sqlite_pragmas:
+            self._register_sqlite_pragmas(sqlite_pragmas, is_sqlite_file)
+        if is_sqlite:
+            self._register_sqlite_functions()
+
         self.SessionLocal = sessionmaker(
             bind=self.engine,
             autocommit=False,
@@ -55,6 +113,42 @@ class DatabaseManager:
         )
         self._scoped_session = scoped_session(self.SessionLocal)
     
+    def _register_sqlite_pragmas(self, pragmas: dict[str, Any], is_file: bool) -> None:
+        """
+        Run the given PRAGMA statements on every new SQLite connection.
+
+        Args:
+            pragmas: PRAGMA name/value pairs, e.g. {'journal_mode': 'WAL'}
+            is_file: False for in-memory databases, where journal_mode and mmap_size do not apply
+        """
+        if not is_file:
+            pragmas = {name: value for name, value in pragmas.items() if name not in ('journal_mode', 'mmap_size')}
+
+        @event.listens_for(self.engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+        logger.info(f"SQLite pragmas: {pragmas}")
+
+    def _register_sqlite_functions(self) -> None:
+        """
+        Provide the SQL math functions used by ranking queries on SQLite builds without them.
+
+        SQLite only ships log2() when compiled with SQLITE_ENABLE_MATH_FUNCTIONS, so fall back
+        to a Python implementation on every new connection where it is missing.
+        """
+        @event.listens_for(self.engine, "connect")
+        def set_sqlite_functions(dbapi_connection, connection_record):
+            try:
+                dbapi_connection.execute("SELECT log2(1)")
+            except sqlite3.OperationalError:
+                dbapi_connection.create_function("log2", 1, math.log2, deterministic=True)
+
     def init_app(self, app: Flask) -> None:
         """
         Initialize database with Flask app.
@@ -73,7 +167,7 @@ class DatabaseManager:
             db_path.parent.mkdir(parents=True, exist_ok=True)
             logger.info(f"Database path: {db_path}")
         
-        self._create_engine(database_uri)
+        self._create_engine(database_uri, app.config.get('SQLITE_PRAGMAS'))
         
         # Register teardown to close sessions
         @app.teardown_appcontext
@@ -91,6 +185,9 @@ class DatabaseManager:
 
         Base.metadata.create_all(self.engine)
         logger.info("Database tables created successfully")
+
+        from .migrations import apply_migrations
+        apply_migrations(self.engine)
     
     def drop_tables(self) -> None:
         """Drop all tables (use with caution!)."""
@@ -117,27 +214,103 @@ class DatabaseManager:
         if self._scoped_session:
             self._scoped_session.remove()
     
-    def _load_relationships(self, query, model_class: Type[model_types], load_relationships: bool = True):
+    def in_unit_of_work(self) -> bool:
+        """Whether the current thread is inside a unit_of_work() block."""
+        return getattr(self._unit_of_work, 'depth', 0) > 0
+    
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Session]:
+        """
+        Run several service calls in a single transaction.
+        
+        Inside the block, services and CRUD methods called without a session join
+        the current one, and insert/modify/delete only flush. The outermost block
+        commits once on exit, or rolls everything back if an exception escapes.
+        Nested blocks simply join the outer one.
+        
+        Example:
+            with db_manager.unit_of_work():
+                vocabulary_service.create(data)
+        
+        Yields:
+            Session: The session shared by the whole unit of work
+        """
+        session = self.get_session()
+        outermost = not self.in_unit_of_work()
+        self._unit_of_work.depth = getattr(self._unit_of_work, 'depth', 0) + 1
+        
+        try:
+            yield session
+            if outermost:
+                session.commit()
+        except Exception:
+            if outermost:
+                session.rollback()
+            raise
+        finally:
+            self._unit_of_work.depth -= 1
+            if outermost:
+                session.close()
+    
+    def join_session(self, session: Optional[Session] = None) -> tuple[Session, bool]:
+        """
+        Resolve the session a service or CRUD method should work with.
+        
+        Args:
+            session: The session passed by the caller, if any
+        
+        Returns:
+            The session to use, and whether the caller owns it (and so must
+            roll it back on error and close it). A given session or the one of an
+            ongoing unit of work is never owned.
+        """
+        if session is not None:
+            return session, False
+        if self.in_unit_of_work():
+            return self.get_session(), False
+        return self.get_session(), True
+    
+    def commit(self, session: Session) -> None:
+        """Commit the session, or only flush it inside a unit of work."""
+        if self.in_unit_of_work():
+            session.flush()
+        else:
+            session.commit()
+    
+    def _load_relationships(self, query, model_class: Type[model_types], load_relationships: bool | str = True):
         """
         Helper method to add relationship loading to a query.
         
         Args:
             query: SQLAlchemy query object
             model_class: The model class being queried
-            load_relationships: Whether to load relationships
+            load_relationships: A LOAD_PROFILES name, True for "full" or False for "ids_only"
         
         Returns:
             Query with relationship loading options added
         """
-        if not load_relationships:
-            return query
+        if load_relationships is True:
+            load_relationships = "full"
+        elif load_relationships is False:
+            load_relationships = "ids_only"
         
         # Get all relationships for the model
         mapper = inspect(model_class)
         
+        if load_relationships == "full":
+            relationships = {relationship.key: None for relationship in mapper.relationships}
+        elif load_relationships in LOAD_PROFILES:
+            relationships = LOAD_PROFILES[load_relationships].get(model_class.__name__, {})
+        else:
+            raise ValueError(f"Unknown load profile: {load_relationships}")
+        
         # Use selectinload for one-to-many relationships (more efficient for collections)
-        for relationship in mapper.relationships:
-            query = query.options(selectinload(getattr(model_class, relationship.key)))
+        for key, columns in relationships.items():
+            option = selectinload(getattr(model_class, key))
+            if columns is not None:
+                target = mapper.relationships[key].mapper.class_
+                option = option.load_only(*(getattr(target, column) for column in columns))
+            query = query.options(option)
         
         return query
     
@@ -177,28 +350,33 @@ class DatabaseManager:
         Returns:
             The inserted object, or None if failed
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
+        session, close_session = self.join_session(session)
         
         try:
             session.add(obj)
-            session.commit()
-            session.refresh(obj)  # Refresh to get generated IDs
-            
-            # Load all relationships before closing the session
-            if load_relationships:
-                self._eager_load_object_relationships(obj, session)
+            if self.in_unit_of_work():
+                # The session stays open until the unit of work ends, nothing to preload
+                session.flush()
+            else:
+                session.commit()
+                session.refresh(obj)  # Refresh to get generated IDs
+                
+                # Load all relationships before closing the session
+                if load_relationships:
+                    self._eager_load_object_relationships(obj, session)
             
             logger.info(f"Inserted {type(obj).__name__} with id: {obj.id}")
             return obj
         except IntegrityError as e:
+            if self.in_unit_of_work():
+                raise
             session.rollback()
             logger.warning(f"Insert failed due to integrity error: {e}")
             # Attempt to modify existing record
             return self.modify(obj, session, load_relationships)
         except SQLAlchemyError as e:
+            if self.in_unit_of_work():
+                raise
             session.rollback()
             logger.error(f"Insert failed: {e}")
             return None
@@ -218,22 +396,24 @@ class DatabaseManager:
         Returns:
             True if all inserts succeeded, False otherwise
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
+        session, close_session = self.join_session(session)
         
         try:
             session.add_all(objs)
-            session.commit()
-            for obj in objs:
-                session.refresh(obj)
-                # Load all relationships before closing the session
-                if load_relationships:
-                    self._eager_load_object_relationships(obj, session)
+            if self.in_unit_of_work():
+                session.flush()
+            else:
+                session.commit()
+                for obj in objs:
+                    session.refresh(obj)
+                    # Load all relationships before closing the session
+                    if load_relationships:
+                        self._eager_load_object_relationships(obj, session)
             logger.info(f"Inserted {len(objs)} records")
             return True
         except SQLAlchemyError as e:
+            if self.in_unit_of_work():
+                raise
             session.rollback()
             logger.error(f"Bulk insert failed: {e}")
             return False
@@ -241,6 +421,88 @@ class DatabaseManager:
             if close_session:
                 session.close()
     
+    def upsert_many(
+        self,
+        model_class: Type[model_types],
+        rows: list[dict[str, Any]],
+        key: str,
+        session: Optional[Session] = None,
+        chunk_size: int = 500
+    ) -> dict[str, int]:
+        """
+        Insert or update many records in bulk, matching existing ones on a unique column.
+
+        Uses Core INSERT ... ON CONFLICT DO UPDATE statements executed with executemany,
+        so no ORM objects are built or refreshed. New records get their IDs from a single
+        reserve_ids() block; existing records keep theirs and only the provided columns
+        are overwritten. ORM validators and events are bypassed, so rows must already
+        hold column values ready to be stored.
+
+        Args:
+            model_class: The SQLAlchemy model class to write to
+            rows: One dict of column values per record. Rows with the same key are merged, the last one wins.
+            key: Name of the unique column identifying a record (e.g. "word" for Word)
+            session: Optional session. If None, creates a new one.
+            chunk_size: Number of rows per lookup and INSERT statement
+
+        Returns:
+            Dictionary with the number of "inserted" and "updated" records
+        """
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        session, close_session = self.join_session(session)
+
+        try:
+            key_column = getattr(model_class, key)
+            rows_by_key = {row[key]: {k: v for k, v in row.items() if k != 'id'} for row in rows}
+            if not rows_by_key:
+                return {"inserted": 0, "updated": 0}
+
+            # Look up the records that already exist, to reuse their IDs and count updates
+            keys = list(rows_by_key)
+            existing_ids = {}
+            for start in range(0, len(keys), chunk_size):
+                existing_ids.update(session.execute(
+                    select(key_column, model_class.id).where(key_column.in_(keys[start:start + chunk_size]))
+                ).all())
+
+            new_keys = [row_key for row_key in keys if row_key not in existing_ids]
+            new_ids = iter(self.reserve_ids(model_class, len(new_keys), session=session) if new_keys else [])
+            for row_key in new_keys:
+                rows_by_key[row_key]['id'] = next(new_ids)
+            for row_key, record_id in existing_ids.items():
+                rows_by_key[row_key]['id'] = record_id
+
+            # executemany needs the same columns in every row, so group rows by their columns
+            groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+            for row in rows_by_key.values():
+                groups.setdefault(tuple(sorted(row)), []).append(row)
+
+            for columns, group in groups.items():
+                statement = sqlite_insert(model_class)
+                updated_columns = {column: statement.excluded[column] for column in columns if column not in ('id', key)}
+                if updated_columns:
+                    statement = statement.on_conflict_do_update(index_elements=[key_column], set_=updated_columns)
+                else:
+                    statement = statement.on_conflict_do_nothing(index_elements=[key_column])
+                for start in range(0, len(group), chunk_size):
+                    session.execute(statement, group[start:start + chunk_size])
+
+            if close_session:
+                session.commit()
+
+            counts = {"inserted": len(new_keys), "updated": len(existing_ids)}
+            logger.info(f"Upserted {model_class.__name__} records: {counts}")
+            return counts
+        except SQLAlchemyError as e:
+            if close_session:
+                session.rollback()
+            logger.error(f"Bulk upsert failed: {e}")
+            raise
+        finally:
+            if close_session:
+                session.close()
+    
     def modify(self, obj: model_types, session: Optional[Session] = None, load_relationships: bool = True) -> Optional[model_types]:
         """
         Update an existing record or insert if not found.
@@ -255,23 +517,25 @@ class DatabaseManager:
         Returns:
             The merged object, or None if failed
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
+        session, close_session = self.join_session(session)
         
         try:
             merged_obj = session.merge(obj)
-            session.commit()
-            session.refresh(merged_obj)
-            
-            # Load all relationships before closing the session
-            if load_relationships:
-                self._eager_load_object_relationships(merged_obj, session)
+            if self.in_unit_of_work():
+                session.flush()
+            else:
+                session.commit()
+                session.refresh(merged_obj)
+                
+                # Load all relationships before closing the session
+                if load_relationships:
+                    self._eager_load_object_relationships(merged_obj, session)
             
             logger.info(f"Modified {type(merged_obj).__name__} with id: {merged_obj.id}")
             return merged_obj
         except SQLAlchemyError as e:
+            if self.in_unit_of_work():
+                raise
             session.rollback()
             logger.error(f"Modify failed: {e}")
             return None
@@ -290,10 +554,7 @@ class DatabaseManager:
         Returns:
             True if deletion succeeded, False otherwise
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
+        session, close_session = self.join_session(session)
         
         try:
             # Find existing record by primary key with relationships loaded
@@ -304,10 +565,12 @@ class DatabaseManager:
                 return False
             
             session.delete(existing)
-            session.commit()
+            self.commit(session)
             logger.info(f"Deleted {type(obj).__name__} with id: {obj.id}")
             return True
         except SQLAlchemyError as e:
+            if self.in_unit_of_work():
+                raise
             session.rollback()
             logger.error(f"Delete failed: {e}")
             return False
@@ -332,10 +595,7 @@ class DatabaseManager:
         Returns:
             Existing record or None if not found
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
+        session, close_session = self.join_session(session)
         
         try:
             model_class = type(obj)
@@ -361,7 +621,7 @@ class DatabaseManager:
         model_class: Type[model_types],
         attr_values: dict[str, Any],
         session: Optional[Session] = None,
-        load_relationships: bool = True
+        load_relationships: bool | str = True
     ) -> Optional[model_types]:
         """
         Find a record by specific attributes.
@@ -370,15 +630,12 @@ class DatabaseManager:
             model_class: The SQLAlchemy model class to query
             attr_values: Dictionary of attribute names and values
             session: Optional session. If None, creates a new one.
-            load_relationships: If True, eagerly load all relationships
+            load_relationships: Relationships to eager-load, see _load_relationships
         
         Returns:
             The matching record or None if not found
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
+        session, close_session = self.join_session(session)
         
         try:
             query = session.query(model_class).filter_by(**attr_values)
@@ -402,7 +659,7 @@ class DatabaseManager:
         model_class: Type[model_types] | list[Type[model_types]],
         filters: Optional[dict[str, Any]] = None,
         session: Optional[Session] = None,
-        load_relationships: bool = True
+        load_relationships: bool | str = True
     ) -> list[model_types]:
         """
         Find all records matching optional filters.
@@ -411,15 +668,12 @@ class DatabaseManager:
             model_class: The SQLAlchemy model class to query (or list of classes)
             filters: Optional dictionary of filter conditions
             session: Optional session. If None, creates a new one.
-            load_relationships: If True, eagerly load all relationships
+            load_relationships: Relationships to eager-load, see _load_relationships
         
         Returns:
             List of matching records
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
+        session, close_session = self.join_session(session)
         
         try:
             if not isinstance(model_class, list):
@@ -442,12 +696,231 @@ class DatabaseManager:
             if close_session:
                 session.close()
     
+    def find_by_ids(
+        self,
+        model_class: Type[model_types],
+        ids: list[str],
+        session: Optional[Session] = None,
+        load_relationships: bool | str = True
+    ) -> list[model_types]:
+        """
+        Find the records with the given IDs, in the order of `ids`.
+        
+        Args:
+            model_class: The SQLAlchemy model class to query
+            ids: IDs of the records to load. Unknown IDs are skipped.
+            session: Optional session. If None, creates a new one.
+            load_relationships: Relationships to eager-load, see _load_relationships
+        
+        Returns:
+            List of found records
+        """
+        if not ids:
+            return []
+
+        session, close_session = self.join_session(session)
+        
+        try:
+            statement = self._load_relationships(select(model_class).where(model_class.id.in_(ids)), model_class, load_relationships)
+            records = {record.id: record for record in session.scalars(statement)}
+            return [records[record_id] for record_id in ids if record_id in records]
+        finally:
+            if close_session:
+                session.close()
+    
+    def find_all_by_language(
+        self,
+        model_class: Type[model_types],
+        language_id: str,
+        filters: Optional[dict[str, Any]] = None,
+        session: Optional[Session] = None,
+        load_relationships: bool | str = True
+    ) -> list[model_types]:
+        """
+        Find all feature records belonging to any unit of a language.
+        
+        Runs a single query joined on Unit instead of one query per unit, plus one
+        batched eager-load per relationship. Results are ordered by unit, then by
+        record, following ID creation order.
+        
+        Args:
+            model_class: A feature model class with a unit_id column
+            language_id: The ID of the language whose units are searched
+            filters: Optional dictionary of filter conditions on model_class
+            session: Optional session. If None, creates a new one.
+            load_relationships: Relationships to eager-load, see _load_relationships
+        
+        Returns:
+            List of matching records
+        """
+        from ..models.containers import Unit
+
+        session, close_session = self.join_session(session)
+        
+        try:
+            query = (
+                session.query(model_class)
+                .join(Unit, model_class.unit_id == Unit.id)
+                .filter(Unit.language_id == language_id)
+            )
+            
+            # filter_by() would target the joined Unit, so filter on model_class explicitly
+            for key, value in (filters or {}).items():
+                query = query.filter(getattr(model_class, key) == value)
+            
+            # IDs share a prefix per model, so (length, id) sorts them numerically
+            query = query.order_by(
+                func.length(Unit.id), Unit.id,
+                func.length(model_class.id), model_class.id
+            )
+            
+            # Add relationship loading
+            query = self._load_relationships(query, model_class, load_relationships)
+            
+            return query.all()
+        finally:
+            if close_session:
+                session.close()
+    
+    def find_page(
+        self,
+        model_class: Type[model_types],
+        filters: Optional[dict[str, Any]] = None,
+        language_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        columns: Optional[list[str]] = None,
+        session: Optional[Session] = None,
+        load_relationships: bool | str = True
+    ) -> tuple[list[model_types] | list[dict[str, Any]], int, Optional[str]]:
+        """
+        Find one page of records with keyset pagination, plus the total number of matches.
+
+        Records follow ID creation order, grouped by unit first when language_id is
+        given (the same order as find_all_by_language). The page starts right after
+        the record whose ID is `after`, so its cost does not grow with the page number.
+
+        Args:
+            model_class: The SQLAlchemy model class to query
+            filters: Optional dictionary of filter conditions on model_class
+            language_id: If given, only records of this language's units (model_class needs a unit_id column)
+            after: ID of the last record of the previous page, None for the first page
+            limit: Maximum number of records in the page, None for all the remaining ones
+            columns: If given, select only these columns and return plain dicts instead of model instances
+            session: Optional session. If None, creates a new one.
+            load_relationships: Relationships to eager-load, see _load_relationships (ignored with columns)
+
+        Returns:
+            The page of records, the total number of matching records, and the `after` value of the next page (None on the last page)
+
+        Raises:
+            ValueError: If `after` does not match any record
+        """
+        from ..models.containers import Unit
+
+        session, close_session = self.join_session(session)
+
+        try:
+            conditions = [getattr(model_class, key) == value for key, value in (filters or {}).items()]
+            # IDs share a prefix per model, so (length, id) sorts them numerically
+            order_key = [func.length(model_class.id), model_class.id]
+            if language_id is not None:
+                conditions.append(Unit.language_id == language_id)
+                order_key = [func.length(Unit.id), Unit.id] + order_key
+
+            def matching(statement):
+                if language_id is not None:
+                    statement = statement.join(Unit, model_class.unit_id == Unit.id)
+                return statement.where(*conditions)
+
+            total = session.scalar(matching(select(func.count(model_class.id)).select_from(model_class)))
+
+            if columns:
+                statement = matching(select(*(getattr(model_class, column) for column in dict.fromkeys(['id', *columns]))))
+            else:
+                statement = self._load_relationships(matching(select(model_class)), model_class, load_relationships)
+
+            if after is not None:
+                after_key = session.execute(
+                    matching(select(*order_key).select_from(model_class)).where(model_class.id == after)
+                ).first()
+                if after_key is None:
+                    raise ValueError(f"No {model_class.__name__} found to paginate after: {after}")
+                statement = statement.where(tuple_(*order_key) > tuple_(*after_key))
+
+            statement = statement.order_by(*order_key)
+            if limit is not None:
+                # One extra row tells whether there is a next page
+                statement = statement.limit(limit + 1)
+
+            if columns:
+                records = [dict(row._mapping) for row in session.execute(statement)]
+            else:
+                records = list(session.scalars(statement))
+
+            next_after = None
+            if limit is not None and len(records) > limit:
+                records = records[:limit]
+                last = records[-1]
+                next_after = last['id'] if columns else last.id
+
+            return records, total, next_after
+        finally:
+            if close_session:
+                session.close()
+    
+    def find_ranked(
+        self,
+        model_class: Type[model_types],
+        rank,
+        limit: int,
+        filters: Optional[dict[str, Any]] = None,
+        language_id: Optional[str] = None,
+        session: Optional[Session] = None,
+        load_relationships: bool | str = True
+    ) -> list[tuple[model_types, float]]:
+        """
+        Find the records with the highest value of a SQL expression.
+
+        Ranking and limiting happen in the database, so only `limit` records are
+        loaded whatever the size of the table. Ties follow ID creation order.
+
+        Args:
+            model_class: The SQLAlchemy model class to query
+            rank: SQL expression over model_class columns, highest first
+            limit: Maximum number of records to return
+            filters: Optional dictionary of filter conditions on model_class
+            language_id: If given, only records of this language's units (model_class needs a unit_id column)
+            session: Optional session. If None, creates a new one.
+            load_relationships: Relationships to eager-load, see _load_relationships
+
+        Returns:
+            List of (record, rank) pairs, highest rank first
+        """
+        from ..models.containers import Unit
+
+        session, close_session = self.join_session(session)
+
+        try:
+            statement = select(model_class, rank.label('rank'))
+            if language_id is not None:
+                statement = statement.join(Unit, model_class.unit_id == Unit.id).where(Unit.language_id == language_id)
+            statement = statement.where(*(getattr(model_class, key) == value for key, value in (filters or {}).items()))
+
+            statement = self._load_relationships(statement, model_class, load_relationships)
+            statement = statement.order_by(rank.desc(), func.length(model_class.id), model_class.id).limit(limit)
+
+            return [(record, rank_value) for record, rank_value in session.execute(statement)]
+        finally:
+            if close_session:
+                session.close()
+    
     def get_by_id(
         self,
         model_class: Type[model_types],
         id_value: Any,
         session: Optional[Session] = None,
-        load_relationships: bool = True
+        load_relationships: bool | str = True
     ) -> Optional[model_types]:
         """
         Convenience method to get a record by its ID.
@@ -456,7 +929,7 @@ class DatabaseManager:
             model_class: The SQLAlchemy model class to query
             id_value: The ID value to search for
             session: Optional session. If None, creates a new one.
-            load_relationships: If True, eagerly load all relationships
+            load_relationships: Relationships to eager-load, see _load_relationships
         
         Returns:
             The matching record or None if not found
@@ -468,6 +941,95 @@ class DatabaseManager:
             load_relationships
         )
     
+    def _seed_sequence(self, model_class: Type[model_types], session: Session) -> int:
+        """
+        Compute the highest numeric suffix currently used by a model's IDs.
+
+        Only runs the first time a model allocates an ID, to initialise its
+        counter from data created before the sequence table existed.
+        """
+        existing_ids = session.scalars(select(model_class.id)).all()
+
+        numbers = []
+        for id_str in existing_ids:
+            try:
+                # Split by underscore and get the part after the letter
+                # e.g., "voc_V42" -> ["voc", "V42"] -> "42"
+                numbers.append(int(id_str.split("_")[-1][1:]))
+            except (ValueError, IndexError, AttributeError):
+                continue
+
+        return max(numbers) if numbers else 0
+
+    def reserve_ids(
+        self,
+        model_class: Type[model_types],
+        count: int,
+        session: Optional[Session] = None,
+    ) -> list[str]:
+        """
+        Reserve a contiguous block of sequential IDs for a model type.
+
+        The counter lives in the ``id_sequence`` table and is incremented with a
+        single UPDATE inside the caller's transaction, so concurrent writers are
+        serialized by the database and never receive the same ID. If the caller's
+        transaction is rolled back, the reservation is rolled back with it.
+
+        Args:
+            model_class: The model class to generate IDs for
+            count: Number of IDs to reserve
+            session: Optional session. If None, creates a new one and commits the reservation.
+
+        Returns:
+            List of new ID strings (e.g., ["voc_V42", "voc_V43"])
+
+        Raises:
+            ValueError: If the model class is not supported or count is not positive
+        """
+        if model_class.__name__ not in ID_PREFIXES:
+            raise ValueError(f"Unsupported model class: {model_class.__name__}")
+        if count < 1:
+            raise ValueError(f"count must be a positive integer, got: {count}")
+
+        session, close_session = self.join_session(session)
+
+        try:
+            model_name = model_class.__name__
+            prefix = ID_PREFIXES[model_name]
+
+            increment = (
+                update(IdSequence)
+                .where(IdSequence.model == model_name)
+                .values(last_value=IdSequence.last_value + count)
+            )
+
+            if session.execute(increment).rowcount == 0:
+                # First allocation for this model: seed the counter from existing rows.
+                # The savepoint lets a concurrent seeder win without aborting our transaction.
+                try:
+                    with session.begin_nested():
+                        session.add(IdSequence(model=model_name, last_value=self._seed_sequence(model_class, session)))
+                except IntegrityError:
+                    logger.debug(f"Sequence for {model_name} was seeded concurrently")
+                session.execute(increment)
+
+            last_value = session.scalar(
+                select(IdSequence.last_value).where(IdSequence.model == model_name)
+            )
+
+            if close_session:
+                session.commit()
+
+            return [f"{prefix}{n}" for n in range(last_value - count + 1, last_value + 1)]
+        except SQLAlchemyError as e:
+            if close_session:
+                session.rollback()
+            logger.error(f"Failed to reserve {count} id(s) for {model_class.__name__}: {e}")
+            raise
+        finally:
+            if close_session:
+                session.close()
+
     def generate_new_id(
         self,
         model_class: Type[model_types],
@@ -495,59 +1057,9 @@ class DatabaseManager:
             New ID string (e.g., "voc_V42")
         
         Raises:
-            ValueError: If required scope parameters are missing
+            ValueError: If the model class is not supported
         """
-        close_session = False
-        if session is None:
-            session = self.get_session()
-            close_session = True
-        
-        try:
-            # Define ID prefixes and letters for each model
-            id_config = {
-                "Language": "lang_L",
-                "Unit": "unit_U",
-                "Vocabulary": "voc_V",
-                "Grammar": "gram_G",
-                "Calligraphy": "call_C",
-                "Exercise": "ex_E",
-                "Character": "char_C",
-                "Word": "word_W",
-                "Passage": "pass_P",
-            }
-            
-            if model_class.__name__ not in id_config:
-                raise ValueError(f"Unsupported model class: {model_class.__name__}")
-            
-            prefix = id_config[model_class.__name__]
-            
-            # Build query based on scope
-            query = select(model_class.id)
-            
-            # Get all existing IDs
-            existing_ids = session.scalars(query).all()
-            
-            # Extract numeric parts
-            numbers = []
-            for id_str in existing_ids:
-                try:
-                    # Split by underscore and get the part after the letter
-                    # e.g., "voc_V42" -> ["voc", "V42"] -> "42"
-                    num_part = id_str.split("_")[-1][1:]  # Remove the letter prefix
-                    num = int(num_part)
-                    numbers.append(num)
-                except (ValueError, IndexError):
-                    continue
-            
-            # Generate next number
-            next_num = max(numbers) + 1 if numbers else 1
-            
-            # Return formatted ID
-            return f"{prefix}{next_num}"
-            
-        finally:
-            if close_session:
-                session.close()
+        return self.reserve_ids(model_class, 1, session=session)[0]
 
 
 # Global instance
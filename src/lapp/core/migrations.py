@@ -0,0 +1,170 @@
+# src/lapp/core/migrations.py
+import json
+import logging
+from typing import Callable
+
+import sqlalchemy
+from sqlalchemy import inspect, text
+
+logger = logging.getLogger(__name__)
+
+
+def _column_names(connection: sqlalchemy.Connection, table_name: str) -> set[str]:
+    """Return the column names currently present in a table."""
+    return {column["name"] for column in inspect(connection).get_columns(table_name)}
+
+
+def migrate_exercise_associations(connection: sqlalchemy.Connection) -> None:
+    """
+    Move the legacy JSON id lists of the exercise table into the association tables.
+
+    IDs that no longer point to an existing feature are dropped. The JSON columns
+    are removed afterwards so the migration only ever runs once.
+    """
+    legacy_columns = {
+        "vocabulary_ids": ("exercise_vocabulary", "vocabulary_id", "vocabulary"),
+        "calligraphy_ids": ("exercise_calligraphy", "calligraphy_id", "calligraphy"),
+        "grammar_ids": ("exercise_grammar", "grammar_id", "grammar"),
+    }
+
+    present = legacy_columns.keys() & _column_names(connection, "exercise")
+    if not present:
+        return
+
+    for column in sorted(present):
+        link_table, link_column, feature_table = legacy_columns[column]
+
+        existing_ids = set(connection.execute(text(f"SELECT id FROM {feature_table}")).scalars())
+        rows = connection.execute(text(f"SELECT id, {column} FROM exercise WHERE {column} IS NOT NULL"))
+
+        links = set()
+        for exercise_id, raw_ids in rows:
+            try:
+                feature_ids = json.loads(raw_ids) if isinstance(raw_ids, str) else raw_ids
+            except ValueError:
+                logger.warning(f"Skipping malformed {column} on exercise {exercise_id}: {raw_ids!r}")
+                continue
+            links.update(
+                (exercise_id, feature_id)
+                for feature_id in (feature_ids or [])
+                if feature_id in existing_ids
+            )
+
+        if links:
+            connection.execute(
+                text(f"INSERT OR IGNORE INTO {link_table} (exercise_id, {link_column}) VALUES (:exercise_id, :feature_id)"),
+                [{"exercise_id": exercise_id, "feature_id": feature_id} for exercise_id, feature_id in links],
+            )
+        connection.execute(text(f"ALTER TABLE exercise DROP COLUMN {column}"))
+        logger.info(f"Migrated exercise.{column} into {link_table} ({len(links)} links)")
+
+
+def rebuild_score_aggregates(connection: sqlalchemy.Connection) -> None:
+    """
+    Recompute the score aggregates of every unit and language from scratch.
+
+    Sums and counts are rebuilt from the component and unit scores, then the
+    scores and current units are derived from them. Used to initialise the
+    aggregates and to repair them if they ever drift.
+    """
+    component_scores = " UNION ALL ".join(
+        f"SELECT unit_id, score FROM {table}"
+        for table in ("vocabulary", "grammar", "calligraphy", "exercise")
+    )
+    connection.execute(text(f"""
+        UPDATE unit SET
+            score_sum = COALESCE((SELECT SUM(c.score) FROM ({component_scores}) AS c WHERE c.unit_id = unit.id), 0),
+            score_count = (SELECT COUNT(*) FROM ({component_scores}) AS c WHERE c.unit_id = unit.id)
+    """))
+    connection.execute(text("""
+        UPDATE unit SET
+            score = CASE WHEN score_count > 0 THEN ROUND(score_sum / score_count, 2) ELSE 0 END
+    """))
+    connection.execute(text("""
+        UPDATE language SET
+            score_sum = COALESCE((SELECT SUM(unit.score) FROM unit WHERE unit.language_id = language.id), 0),
+            score_count = (SELECT COUNT(*) FROM unit WHERE unit.language_id = language.id)
+    """))
+    connection.execute(text("""
+        UPDATE language SET
+            score = CASE WHEN score_count > 0 THEN ROUND(score_sum / score_count, 2) ELSE 0 END,
+            current_unit = COALESCE(
+                (SELECT unit.id FROM unit WHERE unit.language_id = language.id AND unit.score < 75
+                 ORDER BY LENGTH(unit.id), unit.id LIMIT 1),
+                (SELECT unit.id FROM unit WHERE unit.language_id = language.id
+                 ORDER BY LENGTH(unit.id) DESC, unit.id DESC LIMIT 1)
+            )
+    """))
+    logger.info("Rebuilt unit and language score aggregates")
+
+
+def add_score_aggregates(connection: sqlalchemy.Connection) -> None:
+    """Add the score_sum/score_count columns to unit and language, then fill them."""
+    added = False
+    for table in ("unit", "language"):
+        columns = _column_names(connection, table)
+        if "score_sum" not in columns:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN score_sum FLOAT NOT NULL DEFAULT 0"))
+            added = True
+        if "score_count" not in columns:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN score_count INTEGER NOT NULL DEFAULT 0"))
+            added = True
+
+    if added:
+        rebuild_score_aggregates(connection)
+
+
+def add_review_schedule(connection: sqlalchemy.Connection) -> None:
+    """
+    Add the difficulty/due_at columns and the (unit_id, due_at) index to the feature tables.
+
+    Existing items get the default difficulty and are due from their last review,
+    so everything already studied shows up in the due queue once.
+    """
+    for table in ("vocabulary", "grammar", "calligraphy", "exercise"):
+        columns = _column_names(connection, table)
+        if "difficulty" not in columns:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN difficulty FLOAT NOT NULL DEFAULT 0.5"))
+        if "due_at" not in columns:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN due_at DATE"))
+            connection.execute(text(f"UPDATE {table} SET due_at = COALESCE(last_seen, DATE('now'))"))
+            logger.info(f"Added the review schedule to {table}")
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_unit_id_due_at ON {table} (unit_id, due_at)"))
+
+
+def add_language_iso1(connection: sqlalchemy.Connection) -> None:
+    """
+    Add the iso1 column to language.
+
+    Left empty: languages without a code are resolved from their English name.
+    """
+    if "iso1" not in _column_names(connection, "language"):
+        connection.execute(text("ALTER TABLE language ADD COLUMN iso1 VARCHAR"))
+        logger.info("Added iso1 to language")
+
+
+def add_unit_score_index(connection: sqlalchemy.Connection) -> None:
+    """Add the (language_id, score) index used to find the current unit of a language."""
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_unit_language_id_score ON unit (language_id, score)"))
+
+
+# Applied in order on every startup; each migration must be idempotent
+MIGRATIONS: list[Callable[[sqlalchemy.Connection], None]] = [
+    migrate_exercise_associations,
+    add_score_aggregates,
+    add_review_schedule,
+    add_language_iso1,
+    add_unit_score_index,
+]
+
+
+def apply_migrations(engine: sqlalchemy.Engine) -> None:
+    """
+    Bring an existing database up to date with the current models.
+
+    Base.metadata.create_all() only creates missing tables, so changes to
+    existing tables (new columns, moved data) are applied here in a single transaction.
+    """
+    with engine.begin() as connection:
+        for migration in MIGRATIONS:
+            migration(connection)
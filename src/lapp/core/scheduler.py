@@ -62,6 +62,28 @@ class AppScheduler:
         """Check if scheduler is running."""
         return self._running
     
+    def run_once(self, func, job_id: str, *args) -> bool:
+        """
+        Run a task once in the background, as soon as a worker is free.
+        
+        The task receives the Flask app first, like scheduled tasks. A pending job with
+        the same ID is replaced, so repeated requests for the same work run it once.
+        
+        Returns:
+            False if the scheduler is not running (reloader, testing), True otherwise
+        """
+        if not self._running:
+            return False
+        
+        self.scheduler.add_job(
+            func=func,
+            id=job_id,
+            name=job_id,
+            replace_existing=True,
+            args=[self.app, *args]
+        )
+        return True
+    
     def get_jobs(self):
         """Get all scheduled jobs."""
         return self.scheduler.get_jobs()
@@ -10,6 +10,11 @@ __all__ = [
     "Grammar",
     "Calligraphy",
     "Exercise",
+    "ExerciseVocabulary",
+    "ExerciseCalligraphy",
+    "ExerciseGrammar",
+    "ExerciseReference",
+    "AudioReference",
     "Character",
     "Word",
     "Passage"
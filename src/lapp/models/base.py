@@ -2,7 +2,7 @@ import os
 from flask import current_app
 from typing import Any
 from pathlib import Path
-from sqlalchemy import Column, String, Integer, Date, JSON, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Date, JSON, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship, declared_attr, validates
 from datetime import date
 
@@ -39,10 +39,19 @@ class BaseFeatureModel(BaseContainerModel):
     # Foreign keys - shared by all components
     unit_id: Mapped[str] = mapped_column(ForeignKey("unit.id"))
     
+    # Spaced repetition schedule, updated with the score after every review
+    difficulty = Column(Float, nullable=False, default=0.5)  # 0.0 (easy) to 1.0 (hard)
+    due_at = Column(Date, default=date.today)  # e.g., when the vocabulary should be reviewed next
+    
     # Media files
     image_files = Column(JSON, default=list)
     audio_files = Column(JSON, default=list)
     
+    @declared_attr
+    def __table_args__(cls):
+        """Due queue index, so the items due in a unit are read in due order without a scan."""
+        return (Index(f"ix_{cls.__tablename__}_unit_id_due_at", "unit_id", "due_at"),)
+    
     # Relationships - use declared_attr to dynamically create for each subclass
     @declared_attr
     def unit(cls) -> Mapped["Unit"]:
@@ -57,6 +66,8 @@ class BaseFeatureModel(BaseContainerModel):
     def to_dict(self, include_relations: bool = True) -> dict:
         base_dict = {
             **super().to_dict(),
+            "difficulty": self.difficulty,
+            "due_at": self.due_at.isoformat() if self.due_at else None,
             "image_files": self.image_files,
             "audio_files": self.audio_files
         }
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Float, Integer, String
 from sqlalchemy.orm import relationship, Mapped
 
 from ..base import BaseContainerModel
@@ -8,11 +8,16 @@ class Language(BaseContainerModel):
     __tablename__ = 'language'
 
     name = Column(String, index=True)
+    iso1 = Column(String, nullable=True)  # ISO 639-1 code e.g. "fr", resolves the language without detection
     native_name = Column(String)
     level = Column(String)
     description = Column(String, default="")
     flag = Column(String, default="")
 
+    # Running sum and count of the units scores, maintained incrementally by the services
+    score_sum = Column(Float, nullable=False, default=0.0)
+    score_count = Column(Integer, nullable=False, default=0)
+
     # Foreign key to current unit
     current_unit = Column(String, nullable=True)
 
@@ -27,6 +32,7 @@ class Language(BaseContainerModel):
         base_dict =  {
             **super().to_dict(),
             "name": self.name,
+            "iso1": self.iso1,
             "native_name": self.native_name,
             "level": self.level,
             "description": self.description,
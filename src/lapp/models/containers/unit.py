@@ -1,15 +1,23 @@
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, Float, Index, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from ..base import BaseContainerModel
 
 class Unit(BaseContainerModel):
     __tablename__ = 'unit'
+    __table_args__ = (
+        # Current unit lookup: the units of a language below the mastery threshold
+        Index('ix_unit_language_id_score', 'language_id', 'score'),
+    )
 
     title = Column(String, index=True)
     description = Column(String)
     level = Column(String)
 
+    # Running sum and count of the components scores, maintained incrementally by the services
+    score_sum = Column(Float, nullable=False, default=0.0)
+    score_count = Column(Integer, nullable=False, default=0)
+
     # Foreign key
     language_id: Mapped[str] = mapped_column(ForeignKey('language.id'))
 
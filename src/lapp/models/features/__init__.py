@@ -1,11 +1,16 @@
 from .calligraphy import Calligraphy
 from .vocabulary import Vocabulary
 from .grammar import Grammar
-from .exercise import Exercise
+from .exercise import Exercise, ExerciseVocabulary, ExerciseCalligraphy, ExerciseGrammar, ExerciseReference, AudioReference
 
 __all__ = [
     "Calligraphy",
     "Vocabulary",
     "Grammar",
     "Exercise",
+    "ExerciseVocabulary",
+    "ExerciseCalligraphy",
+    "ExerciseGrammar",
+    "ExerciseReference",
+    "AudioReference",
 ]
\ No newline at end of file
@@ -18,6 +18,11 @@ class Calligraphy(BaseFeatureModel):
         'Word',
         back_populates='calligraphy'
     )
+    exercise_links = relationship(                  # One to Many
+        'ExerciseCalligraphy',
+        back_populates='calligraphy',
+        cascade='all'
+    )
 
     def to_dict(self, include_relations: bool = True) -> dict:
         base_dict = {
@@ -1,7 +1,72 @@
-from sqlalchemy import Column, String, JSON
+from sqlalchemy import Column, ForeignKey, Index, Integer, LargeBinary, String
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import relationship
 
+from ...core.database import Base
 from ..base import BaseFeatureModel
 
+class ExerciseVocabulary(Base):
+    __tablename__ = 'exercise_vocabulary'
+    __table_args__ = (
+        Index('ix_exercise_vocabulary_reverse', 'vocabulary_id', 'exercise_id'),
+    )
+
+    exercise_id = Column(String, ForeignKey('exercise.id', ondelete='CASCADE'), primary_key=True)
+    vocabulary_id = Column(String, ForeignKey('vocabulary.id', ondelete='CASCADE'), primary_key=True)
+
+    # Relations
+    exercise = relationship('Exercise', back_populates='vocabulary_links')         # Many to One
+    vocabulary = relationship('Vocabulary', back_populates='exercise_links')       # Many to One
+
+class ExerciseCalligraphy(Base):
+    __tablename__ = 'exercise_calligraphy'
+    __table_args__ = (
+        Index('ix_exercise_calligraphy_reverse', 'calligraphy_id', 'exercise_id'),
+    )
+
+    exercise_id = Column(String, ForeignKey('exercise.id', ondelete='CASCADE'), primary_key=True)
+    calligraphy_id = Column(String, ForeignKey('calligraphy.id', ondelete='CASCADE'), primary_key=True)
+
+    # Relations
+    exercise = relationship('Exercise', back_populates='calligraphy_links')        # Many to One
+    calligraphy = relationship('Calligraphy', back_populates='exercise_links')     # Many to One
+
+class ExerciseGrammar(Base):
+    __tablename__ = 'exercise_grammar'
+    __table_args__ = (
+        Index('ix_exercise_grammar_reverse', 'grammar_id', 'exercise_id'),
+    )
+
+    exercise_id = Column(String, ForeignKey('exercise.id', ondelete='CASCADE'), primary_key=True)
+    grammar_id = Column(String, ForeignKey('grammar.id', ondelete='CASCADE'), primary_key=True)
+
+    # Relations
+    exercise = relationship('Exercise', back_populates='grammar_links')            # Many to One
+    grammar = relationship('Grammar', back_populates='exercise_links')             # Many to One
+
+class ExerciseReference(Base):
+    """Model outputs computed from an exercise's reference answer, cached between evaluations."""
+    __tablename__ = 'exercise_reference'
+
+    exercise_id = Column(String, ForeignKey('exercise.id', ondelete='CASCADE'), primary_key=True)
+    kind = Column(String, primary_key=True)             # e.g., "text_embedding"
+    source_hash = Column(String, nullable=False)        # hash of the model and reference the vector was computed from
+    vector = Column(LargeBinary, nullable=False)        # float32 array bytes
+
+    # Relations
+    exercise = relationship('Exercise', back_populates='references')               # Many to One
+
+class AudioReference(Base):
+    """Model outputs computed from a reference recording, cached by file content."""
+    __tablename__ = 'audio_reference'
+
+    content_hash = Column(String, primary_key=True)     # sha256 of the audio file bytes
+    model_key = Column(String, nullable=False)          # models the outputs were computed with
+    file_path = Column(String, index=True)              # resolved path of the file, to evict the entry when it is deleted
+    sample_count = Column(Integer, nullable=False)      # length of the 16kHz mono waveform
+    embedding = Column(LargeBinary, nullable=False)     # float32 mean-pooled audio embedding bytes
+    transcription = Column(String, nullable=False)
+
 class Exercise(BaseFeatureModel):
     __tablename__ = 'exercise'
 
@@ -10,10 +75,27 @@ class Exercise(BaseFeatureModel):
     answer = Column(String)
     text_support = Column(String, default="")   # e.g., additional text information
     
-    # Store relationship IDs as JSON arrays
-    vocabulary_ids = Column(JSON, default=list)
-    calligraphy_ids = Column(JSON, default=list)
-    grammar_ids = Column(JSON, default=list)
+    # Relations to the features practiced by the exercise (Many to Many)
+    vocabulary_links = relationship('ExerciseVocabulary', back_populates='exercise', cascade='all, delete-orphan')
+    calligraphy_links = relationship('ExerciseCalligraphy', back_populates='exercise', cascade='all, delete-orphan')
+    grammar_links = relationship('ExerciseGrammar', back_populates='exercise', cascade='all, delete-orphan')
+
+    # Cached reference computations, see ReferenceService (One to Many)
+    references = relationship('ExerciseReference', back_populates='exercise', cascade='all, delete-orphan')
+
+    # Expose the linked IDs as plain lists, e.g. exercise.vocabulary_ids = ["voc_V1"]
+    vocabulary_ids = association_proxy(
+        'vocabulary_links', 'vocabulary_id',
+        creator=lambda vocabulary_id: ExerciseVocabulary(vocabulary_id=vocabulary_id)
+    )
+    calligraphy_ids = association_proxy(
+        'calligraphy_links', 'calligraphy_id',
+        creator=lambda calligraphy_id: ExerciseCalligraphy(calligraphy_id=calligraphy_id)
+    )
+    grammar_ids = association_proxy(
+        'grammar_links', 'grammar_id',
+        creator=lambda grammar_id: ExerciseGrammar(grammar_id=grammar_id)
+    )
     
     def to_dict(self, include_relations: bool = True) -> dict:
         base_dict = {
@@ -22,8 +104,8 @@ class Exercise(BaseFeatureModel):
             "question": self.question,
             "text_support": self.text_support,
             "answer": self.answer,
-            "vocabulary_ids": self.vocabulary_ids,
-            "calligraphy_ids": self.calligraphy_ids,
-            "grammar_ids": self.grammar_ids
+            "vocabulary_ids": list(self.vocabulary_ids),
+            "calligraphy_ids": list(self.calligraphy_ids),
+            "grammar_ids": list(self.grammar_ids)
         }
-        return base_dict
\ No newline at end of file
+        return base_dict
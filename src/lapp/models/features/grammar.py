@@ -15,6 +15,11 @@ class Grammar(BaseFeatureModel):
         back_populates='grammar',
         cascade='all, delete-orphan'
     )
+    exercise_links = relationship(                      # 1 to Many
+        'ExerciseGrammar',
+        back_populates='grammar',
+        cascade='all'
+    )
     
     def to_dict(self, include_relations: bool = True) -> dict:
         base_dict = {
@@ -16,6 +16,11 @@ class Vocabulary(BaseFeatureModel):
         back_populates='vocabulary',
         cascade='all, delete-orphan'
     )
+    exercise_links = relationship(                              # One to Many
+        'ExerciseVocabulary',
+        back_populates='vocabulary',
+        cascade='all'
+    )
 
     def to_dict(self, include_relations: bool = True) -> dict:
         base_dict =  {
@@ -1,6 +1,7 @@
 from .containers import *
 from .components import *
 from .features import *
+from .base import PageQuery, ReviewSessionQuery, ReviewAnswer, ReviewBatch
 
 __all__ = [
     "LanguageDict",
@@ -11,5 +12,9 @@ __all__ = [
     "ExerciseDict",
     "CharacterDict",
     "WordDict",
-    "PassageDict"
+    "PassageDict",
+    "PageQuery",
+    "ReviewSessionQuery",
+    "ReviewAnswer",
+    "ReviewBatch"
 ]
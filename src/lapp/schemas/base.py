@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 
 # High-level base schemas for languages and units containers
 class BaseContainerDict(BaseModel):
@@ -18,4 +18,52 @@ class BaseFeatureDict(BaseContainerDict):
 class BaseComponentDict(BaseModel):
     id: Optional[str] = None
     image_files: Optional[list[str]] = None
-    audio_files: Optional[list[str]] = None
\ No newline at end of file
+    audio_files: Optional[list[str]] = None
+
+# Query parameters of the paginated list endpoints
+class PageQuery(BaseModel):
+    after: Optional[str] = None                                 # e.g. "voc_V42", the last ID of the previous page
+    limit: Optional[int] = Field(default=None, ge=1, le=500)    # None returns the whole collection
+    fields: Optional[list[str]] = None                          # e.g. "id,score,last_seen"
+
+    @field_validator('fields', mode='before')
+    @classmethod
+    def _split_fields(cls, value):
+        if isinstance(value, str):
+            return [field.strip() for field in value.split(',') if field.strip()]
+        return value
+
+    @property
+    def is_paginated(self) -> bool:
+        return self.after is not None or self.limit is not None
+
+# Query parameters of the review session and due queue endpoints
+class ReviewSessionQuery(BaseModel):
+    language_id: Optional[str] = None
+    unit_id: Optional[str] = None
+    types: Optional[list[str]] = None                           # e.g. "vocabulary,grammar"
+    limit: int = Field(default=20, ge=1, le=100)
+
+    @field_validator('types', mode='before')
+    @classmethod
+    def _split_types(cls, value):
+        if isinstance(value, str):
+            return [type_name.strip() for type_name in value.split(',') if type_name.strip()]
+        return value
+
+# One answer of a review batch
+class ReviewAnswer(BaseModel):
+    item_id: str                                                # e.g. "voc_V1", any feature ID
+    similarity: float = Field(ge=0.0, le=1.0)                   # answer quality, 0.0 = wrong, 1.0 = perfect
+    answered_at: Optional[datetime] = None                      # defaults to the time of the request
+
+    @field_validator('answered_at')
+    @classmethod
+    def _to_local_time(cls, value):
+        # Naive local time like datetime.now(), so aware and naive answers can be ordered together
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+
+class ReviewBatch(BaseModel):
+    answers: list[ReviewAnswer] = Field(min_length=1, max_length=500)
@@ -4,6 +4,7 @@ from ..base import BaseContainerDict
 
 class LanguageDict(BaseContainerDict):
     name: str
+    iso1: Optional[str] = None  # ISO 639-1 code, e.g. "fr"
     native_name: Optional[str] = None
     level: Optional[str] = "A1"  # Default level
     description: Optional[str] = None
@@ -6,6 +6,10 @@ from .tts import TTSService
 from .text_gen import TextGeneratorService
 from .feedback import FeedbackService
 from .evaluator import EvaluatorService
+from .evaluation_jobs import EvaluationJobService
+from .review import ReviewService
+from .reference import ReferenceService
+from .language_resolver import LanguageResolver
 
 __all__ = [
     "LanguageService",
@@ -22,4 +26,8 @@ __all__ = [
     "TextGeneratorService",
     "FeedbackService",
     "EvaluatorService",
+    "EvaluationJobService",
+    "ReviewService",
+    "ReferenceService",
+    "LanguageResolver",
 ]
\ No newline at end of file
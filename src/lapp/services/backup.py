@@ -1,5 +1,5 @@
 import logging
-import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
@@ -43,6 +43,22 @@ class BackupService:
         
         logger.info(f"BackupService initialized: {self.backup_dir}")
     
+    def _copy_database(self, source: Path, target: Path) -> None:
+        """
+        Copy a SQLite database with the online backup API.
+
+        Unlike a file copy, this includes the changes still held in the WAL file
+        and is consistent even if the application is writing at the same time.
+        """
+        source_connection = sqlite3.connect(source)
+        target_connection = sqlite3.connect(target)
+        try:
+            with target_connection:
+                source_connection.backup(target_connection)
+        finally:
+            target_connection.close()
+            source_connection.close()
+    
     def create_backup(self) -> Optional[Path]:
         """
         Create a backup of the database.
@@ -60,7 +76,7 @@ class BackupService:
             backup_path = self.backup_dir / f"backup_{timestamp}.sqlite"
             
             # Copy database file
-            shutil.copy2(self.db_path, backup_path)
+            self._copy_database(self.db_path, backup_path)
             
             logger.info(f"✅ Backup created: {backup_path.name}")
             
@@ -99,11 +115,11 @@ class BackupService:
             # Create emergency backup of current database before restoring
             if self.db_path.exists():
                 emergency_backup = self.db_path.parent / f"emergency_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-                shutil.copy2(self.db_path, emergency_backup)
+                self._copy_database(self.db_path, emergency_backup)
                 logger.info(f"Emergency backup created: {emergency_backup.name}")
             
             # Restore from backup
-            shutil.copy2(backup_path, self.db_path)
+            self._copy_database(backup_path, self.db_path)
             
             logger.info(f"✅ Database restored from: {backup_path.name}")
             return True
@@ -22,9 +22,7 @@ class CharacterService:
         Returns:
             List of Character objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_all(
@@ -50,9 +48,7 @@ class CharacterService:
         Returns:
             Character object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_by_attr(
@@ -79,9 +75,7 @@ class CharacterService:
         Returns:
             Character object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_by_attr(
@@ -108,9 +102,7 @@ class CharacterService:
         Returns:
             Created Character object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             if existing := self.get_by_character(data.character, session=session):
@@ -150,6 +142,41 @@ class CharacterService:
             if owns_session:
                 session.close()
 
+    def upsert_many(self, data: list[CharacterDict], session: Optional[Session] = None) -> dict[str, int]:
+        """
+        Create or update many characters at once, matching existing ones on their character.
+
+        Args:
+            data: List of CharacterDict to import. Provided IDs are ignored.
+
+        Returns:
+            Dictionary with the number of "inserted" and "updated" characters
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            rows = []
+            for item in data:
+                values = item.model_dump(exclude_none=True)
+                values.pop('id', None)
+                # Build a transient Character so the model validators clean the values
+                record = Character(**values)
+                rows.append({column: getattr(record, column) for column in values})
+
+            counts = db_manager.upsert_many(model_class=Character, rows=rows, key='character', session=session)
+            db_manager.commit(session)
+
+            logger.info(f"Imported characters: {counts}")
+            return counts
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to import characters: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def update(self, character_id: str, data: CharacterDict, session: Optional[Session] = None) -> Character | None:
         """
         Update an existing character.
@@ -161,9 +188,7 @@ class CharacterService:
         Returns:
             Updated Character object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             existing = self.get_by_id(character_id, session=session)
@@ -214,9 +239,7 @@ class CharacterService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if character exists before deleting
@@ -22,9 +22,7 @@ class PassageService:
         Returns:
             List of Passage objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_all(
@@ -50,9 +48,7 @@ class PassageService:
         Returns:
             Passage object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_by_attr(
@@ -79,9 +75,7 @@ class PassageService:
         Returns:
             List of Passage objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_all(
@@ -107,9 +101,7 @@ class PassageService:
         Returns:
             Passage object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_by_attr(
@@ -136,9 +128,7 @@ class PassageService:
         Returns:
             List of Passage objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_all(
@@ -165,9 +155,7 @@ class PassageService:
         Returns:
             Created Passage object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             if existing := self.get_by_text(data.text, session=session):
@@ -208,6 +196,41 @@ class PassageService:
             if owns_session:
                 session.close()
 
+    def upsert_many(self, data: list[PassageDict], session: Optional[Session] = None) -> dict[str, int]:
+        """
+        Create or update many passages at once, matching existing ones on their text.
+
+        Args:
+            data: List of PassageDict to import. Provided IDs are ignored.
+
+        Returns:
+            Dictionary with the number of "inserted" and "updated" passages
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            rows = []
+            for item in data:
+                values = item.model_dump(exclude_none=True)
+                values.pop('id', None)
+                # Build a transient Passage so the model validators clean the values
+                passage = Passage(**values)
+                rows.append({column: getattr(passage, column) for column in values})
+
+            counts = db_manager.upsert_many(model_class=Passage, rows=rows, key='text', session=session)
+            db_manager.commit(session)
+
+            logger.info(f"Imported passages: {counts}")
+            return counts
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to import passages: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def update(self, passage_id: str, data: PassageDict, session: Optional[Session] = None) -> Passage | None:
         """
         Update an existing passage.
@@ -219,9 +242,7 @@ class PassageService:
         Returns:
             Updated Passage object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             existing = self.get_by_id(passage_id, session=session)
@@ -271,9 +292,7 @@ class PassageService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if passage exists before deleting
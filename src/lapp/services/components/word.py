@@ -20,9 +20,7 @@ class WordService:
         Returns:
             List of Word objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_all(
@@ -48,9 +46,7 @@ class WordService:
         Returns:
             Word object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_by_attr(
@@ -77,9 +73,7 @@ class WordService:
         Returns:
             Word object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             return db_manager.find_by_attr(
@@ -106,9 +100,7 @@ class WordService:
         Returns:
             Created Word object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             if existing := self.get_by_word(data.word, session=session):
@@ -145,6 +137,41 @@ class WordService:
             if owns_session:
                 session.close()
 
+    def upsert_many(self, data: list[WordDict], session: Optional[Session] = None) -> dict[str, int]:
+        """
+        Create or update many words at once, matching existing ones on their word.
+
+        Args:
+            data: List of WordDict to import. Provided IDs are ignored.
+
+        Returns:
+            Dictionary with the number of "inserted" and "updated" words
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            rows = []
+            for item in data:
+                values = item.model_dump(exclude_none=True)
+                values.pop('id', None)
+                # Build a transient Word so the model validators clean the values
+                word = Word(**values)
+                rows.append({column: getattr(word, column) for column in values})
+
+            counts = db_manager.upsert_many(model_class=Word, rows=rows, key='word', session=session)
+            db_manager.commit(session)
+
+            logger.info(f"Imported words: {counts}")
+            return counts
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to import words: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def update(self, word_id: str, data: WordDict, session: Optional[Session] = None) -> Word | None:
         """
         Update an existing word.
@@ -156,9 +183,7 @@ class WordService:
         Returns:
             Updated Word object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             existing = self.get_by_id(word_id, session=session)
@@ -204,9 +229,7 @@ class WordService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if word exists before deleting
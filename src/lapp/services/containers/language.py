@@ -1,5 +1,6 @@
 from datetime import date
 from typing import Optional
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 import logging
@@ -8,6 +9,7 @@ logger = logging.getLogger(__name__)
 from ...schemas.containers import LanguageDict
 from ...models.containers import Language, Unit
 from ...core.database import db_manager
+from ..language_resolver import language_resolver
 
 class LanguageService:
     def _serialize(self, language: Language | None, as_dict: bool, include_relations: bool) -> Language | dict | None:
@@ -20,68 +22,39 @@ class LanguageService:
             return languages
         return [language.to_dict(include_relations=include_relations) for language in languages]
 
-    def _check_current_unit(self, language: Language, current_unit_id: str, session: Optional[Session] = None) -> bool:
-        """
-        Check if the current unit ID is valid for the given language.
-
-        Args:
-            language: The Language object.
-            current_unit_id: The current unit ID to validate.
-        Returns:
-            True if valid, False otherwise.
-        """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
-        
-        try:
-            from .unit import UnitService
-            unit_service = UnitService()
-            if (unit := unit_service.get_by_id(current_unit_id, session=session)):
-                return unit.id
-            new_current_unit_id = self._find_current_unit(language.id, score_threshold=0.75, session=session)
-
-            language.current_unit = new_current_unit_id
-            db_manager.modify(language, session=session)
-            return new_current_unit_id
-            
-        except Exception as e:
-            if owns_session:
-                session.rollback()
-            logger.error(f"Failed to check current unit {current_unit_id} for language {language.id}: {e}")
-            raise
-        finally:
-            if owns_session:
-                session.close()
-    
     def _find_current_unit(self, language_id: str, score_threshold: float, session: Optional[Session] = None) -> Optional[str]:
         """
         Find the first unit ID for a given language with a score below a certain threshold.
 
+        Called on the write paths that change unit scores or membership (see apply_score_deltas),
+        so reads can trust the stored Language.current_unit.
+
         Args:
             language_id: The ID of the language.
             score_threshold: The score threshold to compare against.
             session: Optional SQLAlchemy session.
         
         Returns:
-            The ID of the first unit below the threshold, or None if all units meet/exceed the threshold.
+            The ID of the first unit below the threshold, or the last unit if all units meet/exceed the threshold.
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            from .unit import UnitService
-            unit_service = UnitService()
-
-            units = unit_service.get_all(
-                language_id=language_id,
-                session=session
+            # Unit IDs share the "unit_U" prefix, so (length, id) follows creation order
+            first_below_threshold = session.scalar(
+                select(Unit.id)
+                .where(Unit.language_id == language_id, Unit.score < score_threshold*100)
+                .order_by(func.length(Unit.id), Unit.id)
+                .limit(1)
+            )
+            if first_below_threshold:
+                return first_below_threshold
+            return session.scalar(
+                select(Unit.id)
+                .where(Unit.language_id == language_id)
+                .order_by(func.length(Unit.id).desc(), Unit.id.desc())
+                .limit(1)
             )
-            for unit in units:
-                if unit.score < score_threshold*100:
-                    return unit.id
-            return units[-1].id if units else None
         except Exception as e:
             if owns_session:
                 session.rollback()
@@ -95,33 +68,27 @@ class LanguageService:
         self,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Language] | list[dict]:
         """
         Get all languages.
 
         Args:
             None
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             List of Language objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             languages = db_manager.find_all(
                 model_class=Language,
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
-            for language in languages:
-                # Ensure current_unit is valid
-                language.current_unit = self._check_current_unit(
-                    language=language,
-                    current_unit_id=language.current_unit,
-                    session=session
-                )
             return self._serialize_list(languages, as_dict, include_relations)
         except Exception as e:
             if owns_session:
@@ -137,33 +104,28 @@ class LanguageService:
         language_id: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> Language | dict | None:
         """
         Get a language by its ID.
 
         Args:
             language_id: The ID of the language to retrieve.
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             Language object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             language = db_manager.find_by_attr(
                 model_class=Language,
                 attr_values={'id': language_id},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
-            if language:
-                language.current_unit = self._check_current_unit(
-                    language=language,
-                    current_unit_id=language.current_unit,
-                    session=session
-                )
             return self._serialize(language, as_dict, include_relations)
         except Exception as e:
             if owns_session:
@@ -179,34 +141,28 @@ class LanguageService:
         level: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Language] | list[dict]:
         """
         Get all languages of a specific level.
         
         Args:
             level: Language level (e.g., 'A1', 'B2')
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
         
         Returns:
             List of matching Language objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             languages = db_manager.find_all(
                 model_class=Language,
                 filters={'level': level},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
-            for language in languages:
-                # Ensure current_unit is valid
-                language.current_unit = self._check_current_unit(
-                    language=language,
-                    current_unit_id=language.current_unit,
-                    session=session
-                )
             return self._serialize_list(languages, as_dict, include_relations)
         except Exception as e:
             if owns_session:
@@ -233,9 +189,7 @@ class LanguageService:
         Returns:
             Created Language object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             language = Language(
@@ -289,12 +243,10 @@ class LanguageService:
         Returns:
             Updated Language object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            existing = self.get_by_id(language_id, session=session)
+            existing = self.get_by_id(language_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Language not found: {language_id}")
@@ -309,18 +261,18 @@ class LanguageService:
             for key, value in update_data.items():
                 setattr(existing, key, value)
             
-            # Update last_seen
-            existing.current_unit = self._check_current_unit(
-                language=existing,
-                current_unit_id=existing.current_unit,
-                session=session
-            )
+            # Keep the requested current unit if it belongs to the language, else derive it from the unit scores
+            current_unit_language = session.scalar(select(Unit.language_id).where(Unit.id == existing.current_unit))
+            if current_unit_language != language_id:
+                existing.current_unit = self._find_current_unit(language_id, score_threshold=0.75, session=session)
             
             # Save to database
             result = db_manager.modify(existing, session=session)
             
             if result:
                 logger.info(f"Updated language: {language_id}")
+                # Its name or code may have changed
+                language_resolver.clear()
             else:
                 logger.error(f"Failed to update language: {language_id}")
             
@@ -344,13 +296,11 @@ class LanguageService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if language exists before deleting
-            existing = self.get_by_id(language_id, session=session)
+            existing = self.get_by_id(language_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Language not found: {language_id}")
@@ -361,6 +311,7 @@ class LanguageService:
             
             if success:
                 logger.info(f"Deleted language: {language_id}")
+                language_resolver.clear()
             else:
                 logger.error(f"Failed to delete language: {language_id}")
             
@@ -374,64 +325,81 @@ class LanguageService:
             if owns_session:
                 session.close()
 
-    def update_score(self, language_id: str, session: Optional[Session] = None) -> Language | None:
+    def apply_score_deltas(self, deltas: dict[str, tuple[float, int]], session: Session) -> list[Language]:
         """
-        Update language score based on average of all unit scores.
+        Update the running score aggregates of several languages.
+
+        Each language keeps the sum and count of its units scores, so its score is
+        updated in O(1) without reading the units. The current unit is still re-derived
+        with one query per language, which reads the units below the mastery threshold
+        through the (language_id, score) index instead of scanning the unit table.
+        Changes are only flushed: the caller decides when to commit.
+
+        Args:
+            deltas: Mapping of language ID to (change of the units score sum, change of the units count)
+            session: The SQLAlchemy session the unit changes were made in
+
+        Returns:
+            List of the updated Language objects
+        """
+        if not deltas:
+            return []
+
+        # Make pending unit changes visible to the current unit query
+        session.flush()
+
+        languages = session.scalars(select(Language).where(Language.id.in_(deltas.keys()))).all()
+        for language in languages:
+            score_delta, count_delta = deltas[language.id]
+            language.score_sum = (language.score_sum or 0.0) + score_delta
+            language.score_count = (language.score_count or 0) + count_delta
+            language.score = round(language.score_sum / language.score_count, 2) if language.score_count > 0 else 0.0
+
+            # Update last_seen
+            language.last_seen = date.today()
+            language.current_unit = self._find_current_unit(
+                language_id=language.id,
+                score_threshold=0.75,
+                session=session
+            )
+            logger.info(f"Calculated language {language.id} score: {language.score} (from {language.score_count} units)")
+
+        session.flush()
+        return languages
+
+    def update_score(
+        self,
+        language_id: str,
+        score_delta: float,
+        count_delta: int = 0,
+        session: Optional[Session] = None
+    ) -> Language | None:
+        """
+        Update language score from a change in its units scores.
         
-        This should be called whenever a unit's score changes.
+        This should be called whenever a unit's score changes, or a unit is added or removed.
         
         Args:
             language_id: The ID of the language to update
+            score_delta: Change of the sum of the units scores
+            count_delta: Change of the number of units (+1 added, -1 removed)
         
         Returns:
             Updated Language object if successful, None otherwise
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            language = self.get_by_id(language_id, session=session)
+            languages = self.apply_score_deltas({language_id: (score_delta, count_delta)}, session=session)
             
-            if not language:
+            if not languages:
                 logger.warning(f"Language not found: {language_id}")
                 return None
             
-            # Get all units for this language
-            units = db_manager.find_all(
-                model_class=Unit,
-                filters={'language_id': language_id},
-                session=session
-            )
-            
-            if not units:
-                logger.warning(f"No units found for language: {language_id}")
-                language.score = 0.0
-            else:
-                # Calculate average score from all units
-                total_score = sum(unit.score for unit in units)
-                language.score = round(total_score / len(units), 2)
-                
-                logger.info(
-                    f"Calculated language score: {language.score} "
-                    f"(from {len(units)} units)"
-                )
-            
-            # Update last_seen
-            language.last_seen = date.today()
-            language.current_unit = self._find_current_unit(
-                language_id=language.id,
-                score_threshold=0.75,
-                session=session
-            )
-            
-            # Save changes
-            result = db_manager.modify(language, session=session)
-            
-            if result:
-                logger.info(f"Updated language {language_id} score: {result.score}")
+            db_manager.commit(session)
+            logger.info(f"Updated language {language_id} score: {languages[0].score}")
             
-            return result
+            return languages[0]
         except Exception as e:
             if owns_session:
                 session.rollback()
@@ -2,15 +2,16 @@ from datetime import date
 from typing import Optional
 import logging
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
 from ...schemas.containers import UnitDict
 from ...models.containers import Unit
-from ...models.features import Calligraphy, Vocabulary, Grammar, Exercise
 from ...core.database import db_manager
 from .language import LanguageService
+from ..language_resolver import language_resolver
 
 language_service = LanguageService()
 
@@ -30,26 +31,27 @@ class UnitService:
         language_id: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Unit] | list[dict]:
         """
         Get all units for a specific language.
 
         Args:
             language_id (str): The id of the language to get all the units from
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             List of UnitContainer objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             units = db_manager.find_all(
                 model_class=Unit,
                 filters={'language_id': language_id},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
             return self._serialize_list(units, as_dict, include_relations)
         except Exception as e:
@@ -61,31 +63,86 @@ class UnitService:
             if owns_session:
                 session.close()
 
+    def get_page(
+        self,
+        language_id: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        session: Optional[Session] = None,
+        include_relations: bool = True,
+        load_profile: str = "card"
+    ) -> dict:
+        """
+        Get one page of the units of a language, serialized.
+
+        Args:
+            language_id: The id of the language to get the units from
+            after: ID of the last unit of the previous page, None for the first page
+            limit: Maximum number of units in the page, None for all the remaining ones
+            fields: Keys to keep in each unit. If they are all Unit columns, only those columns are queried.
+            load_profile: Relationships to eager-load when whole units are serialized, see LOAD_PROFILES
+
+        Returns:
+            Dictionary with the "items" of the page, the "total" number of units and the "next_after" cursor
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            columns = fields if fields and set(fields) <= set(Unit.__table__.columns.keys()) else None
+            units, total, next_after = db_manager.find_page(
+                model_class=Unit,
+                filters={'language_id': language_id},
+                after=after,
+                limit=limit,
+                columns=columns,
+                session=session,
+                load_relationships=load_profile
+            )
+
+            if columns:
+                items = [{key: value.isoformat() if isinstance(value, date) else value for key, value in row.items()} for row in units]
+            else:
+                items = self._serialize_list(units, True, include_relations)
+                if fields:
+                    items = [{key: value for key, value in item.items() if key == 'id' or key in fields} for item in items]
+
+            return {"items": items, "total": total, "next_after": next_after}
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to get page of units for language {language_id}: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def get_by_id(
         self,
         unit_id: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> Unit | dict | None:
         """
         Get a unit by its ID.
 
         Args:
             unit_id: The ID of the unit to retrieve.
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             UnitContainer object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             unit = db_manager.find_by_attr(
                 model_class=Unit,
                 attr_values={'id': unit_id},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
             return self._serialize(unit, as_dict, include_relations)
         except Exception as e:
@@ -103,7 +160,8 @@ class UnitService:
         language_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Unit] | list[dict]:
         """
         Get all units of a specific level among a language.
@@ -111,27 +169,28 @@ class UnitService:
         Args:
             language_id: The id of the language to filter units
             level: Unit level (e.g., 'A1', 'B2')
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
         
         Returns:
             List of matching UnitContainer objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             if language_id:
                 units = db_manager.find_all(
                     model_class=Unit,
                     filters={'level': level, 'language_id': language_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(units, as_dict, include_relations)
             else:
                 units = db_manager.find_all(
                     model_class=Unit,
                     filters={'level': level},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(units, as_dict, include_relations)
         except Exception as e:
@@ -159,9 +218,7 @@ class UnitService:
         Returns:
             Created UnitContainer object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             unit = Unit(
@@ -178,6 +235,8 @@ class UnitService:
 
             if result:
                 logger.info(f"Created new unit with ID: {result.id}")
+                # Count the new unit in its language score
+                language_service.update_score(result.language_id, result.score or 0.0, 1, session=session)
             else:
                 logger.error(f"Failed to create new unit: {unit.title}")
 
@@ -209,12 +268,10 @@ class UnitService:
         Returns:
             Updated UnitContainer object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            existing = self.get_by_id(unit_id, session=session)
+            existing = self.get_by_id(unit_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"UnitContainer not found: {unit_id}")
@@ -226,11 +283,22 @@ class UnitService:
             update_data.pop('score', None)  # Don't allow direct score updates
             update_data.pop('last_seen', None)  # Don't allow direct last_seen updates
 
+            previous_language_id = existing.language_id
+
             for key, value in update_data.items():
                 setattr(existing, key, value)
             
             # Save to database
             result = db_manager.modify(existing, session=session)
+
+            # Move the unit score to its new language if it changed
+            if result and result.language_id != previous_language_id:
+                language_service.apply_score_deltas({
+                    previous_language_id: (-(result.score or 0.0), -1),
+                    result.language_id: (result.score or 0.0, 1),
+                }, session=session)
+                db_manager.commit(session)
+                language_resolver.clear()
             
             if result:
                 logger.info(f"Updated unit: {unit_id}")
@@ -257,23 +325,25 @@ class UnitService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if unit exists before deleting
-            existing = self.get_by_id(unit_id, session=session)
+            existing = self.get_by_id(unit_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Unit not found: {unit_id}")
                 return False
             
+            language_id, score = existing.language_id, existing.score or 0.0
+
             # Delete from database
             success = db_manager.delete(existing, session=session)
             
             if success:
                 logger.info(f"Deleted unit: {unit_id}")
+                # Remove the unit from its language score
+                language_service.update_score(language_id, -score, -1, session=session)
             else:
                 logger.error(f"Failed to delete unit: {unit_id}")
             
@@ -287,61 +357,78 @@ class UnitService:
             if owns_session:
                 session.close()
 
-    def update_score(self, unit_id: str, session: Optional[Session] = None) -> Unit | None:
+    def apply_score_deltas(self, deltas: dict[str, tuple[float, int]], session: Session) -> list[Unit]:
+        """
+        Update the running score aggregates of several units, then of their languages.
+
+        Each unit keeps the sum and count of its components scores, so a component
+        score change, addition or removal is applied in O(1) without reading the
+        components. Changes are only flushed: the caller decides when to commit.
+
+        Args:
+            deltas: Mapping of unit ID to (change of the components score sum, change of the components count)
+            session: The SQLAlchemy session the component changes were made in
+
+        Returns:
+            List of the updated UnitContainer objects
+        """
+        if not deltas:
+            return []
+
+        language_deltas: dict[str, tuple[float, int]] = {}
+
+        units = session.scalars(select(Unit).where(Unit.id.in_(deltas.keys()))).all()
+        for unit in units:
+            score_delta, count_delta = deltas[unit.id]
+            previous_score = unit.score or 0.0
+
+            unit.score_sum = (unit.score_sum or 0.0) + score_delta
+            unit.score_count = (unit.score_count or 0) + count_delta
+            unit.score = round(unit.score_sum / unit.score_count, 2) if unit.score_count > 0 else 0.0
+            logger.info(f"Calculated unit {unit.id} score: {unit.score} (from {unit.score_count} components)")
+            
+            # Update last_seen
+            unit.last_seen = date.today()
+
+            language_score_delta, _ = language_deltas.get(unit.language_id, (0.0, 0))
+            language_deltas[unit.language_id] = (language_score_delta + unit.score - previous_score, 0)
+
+        language_service.apply_score_deltas(language_deltas, session=session)
+        return units
+
+    def update_score(
+        self,
+        unit_id: str,
+        score_delta: float,
+        count_delta: int = 0,
+        session: Optional[Session] = None
+    ) -> Unit | None:
         """
-        Update unit score based on average of all of its components scores.
+        Update unit score from a change in its components scores.
         
-        This should be called whenever a component's score changes.
+        This should be called whenever a component's score changes, or a component is added or removed.
         
         Args:
             unit_id: The ID of the unit to update
+            score_delta: Change of the sum of the components scores
+            count_delta: Change of the number of components (+1 added, -1 removed)
         
         Returns:
             Updated UnitContainer object if successful, None otherwise
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            unit = self.get_by_id(unit_id, session=session)
+            units = self.apply_score_deltas({unit_id: (score_delta, count_delta)}, session=session)
             
-            if not unit:
+            if not units:
                 logger.warning(f"UnitContainer not found: {unit_id}")
                 return None
             
-            # Get all components for this language
-            components = db_manager.find_all(
-                model_class=[Vocabulary, Grammar, Calligraphy, Exercise],
-                filters={'unit_id': unit_id},
-                session=session
-            )
-
-            if not components:
-                logger.warning(f"No components found for unit: {unit_id}")
-                unit.score = 0.0
-            else:
-                # Calculate average score from all units
-                total_score = sum(component.score for component in components)
-                unit.score = round(total_score / len(components), 2)
-                
-                logger.info(
-                    f"Calculated unit score: {unit.score} "
-                    f"(from {len(components)} components)"
-                )
-            
-            # Update last_seen
-            unit.last_seen = date.today()
-            
-            # Save changes
-            result = db_manager.modify(unit, session=session)
-            if result:
-                logger.info(f"Updated unit {unit_id} score: {result.score}")
-
-            if not (language_service.update_score(unit.language_id, session=session)):
-                raise Exception(f"Failed to update language score for language {unit.language_id} after unit {unit_id} score update.")
+            db_manager.commit(session)
+            logger.info(f"Updated unit {unit_id} score: {units[0].score}")
             
-            return result
+            return units[0]
         except Exception as e:
             if owns_session:
                 session.rollback()
@@ -0,0 +1,159 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+from flask import current_app
+
+from .evaluator import EvaluatorService
+
+logger = logging.getLogger(__name__)
+
+evaluator_service = EvaluatorService()
+
+
+class _EvaluationJob:
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = "pending"  # pending -> scored -> done, or failed
+        self.correct: Optional[bool] = None
+        self.score: Optional[float] = None
+        self.feedback: Optional[str] = None
+        self.error: Optional[str] = None
+        self.finished_at: Optional[float] = None
+        # (event name, data) in emission order, replayed to late subscribers
+        self.events: list[tuple[str, dict]] = []
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "correct": self.correct,
+            "score": self.score,
+            "feedback": self.feedback,
+            "error": self.error,
+        }
+
+
+class EvaluationJobService:
+    """
+    Evaluations run in the background, for clients that should not hold a request open.
+
+    A job is scored first, then its feedback is generated, and each step is published
+    as soon as it is done: the score is available while the LLM feedback is still
+    being written. Jobs live in memory and are dropped EVALUATION_JOB_TTL_SECONDS after finishing.
+    """
+
+    def __init__(self):
+        self._jobs: dict[str, _EvaluationJob] = {}
+        self._changed = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get("EVALUATION_WORKERS", 2),
+                thread_name_prefix="evaluation"
+            )
+        return self._executor
+
+    def _prune(self) -> None:
+        """Drop the jobs finished for longer than the TTL. Called with the condition held."""
+        cutoff = time.monotonic() - current_app.config.get("EVALUATION_JOB_TTL_SECONDS", 600)
+        for job_id in [job.id for job in self._jobs.values() if job.finished_at is not None and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def _publish(self, job: _EvaluationJob, event: str, status: str, **fields) -> None:
+        with self._changed:
+            for key, value in fields.items():
+                setattr(job, key, value)
+            job.status = status
+            if status in ("done", "failed"):
+                job.finished_at = time.monotonic()
+            job.events.append((event, {"job_id": job.id, "status": status, **fields}))
+            self._changed.notify_all()
+
+    def _run(self, app, job: _EvaluationJob, ex_id: str, user_input: str, input_type: str, correct_audio_index: int) -> None:
+        with app.app_context():
+            try:
+                scored = evaluator_service.score(ex_id, user_input, input_type, correct_audio_index=correct_audio_index)
+            except Exception as e:
+                logger.error(f"Evaluation job {job.id} failed for Exercise {ex_id}: {e}")
+                self._publish(job, "error", "failed", error=str(e))
+                return
+
+            self._publish(job, "score", "scored", correct=bool(scored["correct"]), score=float(scored["score"]))
+
+            # FeedbackService falls back to a canned feedback on errors, this only guards unexpected ones
+            try:
+                feedback = evaluator_service.generate_feedback(ex_id, user_input, input_type, scored, correct_audio_index=correct_audio_index)
+            except Exception as e:
+                logger.error(f"Feedback of evaluation job {job.id} failed: {e}")
+                self._publish(job, "error", "failed", error=str(e))
+                return
+
+            self._publish(job, "feedback", "done", feedback=feedback)
+
+    def submit(self, ex_id: str, user_input: str, input_type: str, correct_audio_index: int = 0) -> str:
+        """
+        Start evaluating an answer in the background.
+
+        Args:
+            - ex_id: The ID of the exercise to evaluate.
+            - user_input: The user's answer, either as text or a path to an audio file.
+            - input_type: The type of input, either 'text' or 'speech'.
+            - correct_audio_index: For speech evaluation, the index of the correct audio file to compare against.
+
+        Returns:
+            The ID of the job
+        """
+        if input_type not in ("text", "speech"):
+            raise ValueError("Invalid input type for evaluation. Must be 'text' or 'speech'.")
+
+        job = _EvaluationJob(uuid.uuid4().hex)
+        with self._changed:
+            self._prune()
+            self._jobs[job.id] = job
+
+        app = current_app._get_current_object()
+        self._get_executor().submit(self._run, app, job, ex_id, user_input, input_type, correct_audio_index)
+        logger.info(f"Started evaluation job {job.id} for Exercise {ex_id} ({input_type})")
+        return job.id
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Get the current state of a job, None if unknown or expired."""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def stream(self, job_id: str, keepalive: float = 15.0) -> Iterator[str]:
+        """
+        Yield the events of a job as server-sent events, until it is done or failed.
+
+        Events already emitted are replayed first, so subscribing late loses nothing.
+        A comment is sent every keepalive seconds without news, to keep proxies from closing the stream.
+        """
+        sent = 0
+        while True:
+            with self._changed:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return
+                if sent == len(job.events):
+                    self._changed.wait_for(lambda: len(job.events) > sent, timeout=keepalive)
+                events = job.events[sent:]
+                finished = job.finished_at is not None
+
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+
+            for event, data in events:
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+            sent += len(events)
+
+            if finished:
+                return
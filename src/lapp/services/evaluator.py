@@ -1,18 +1,28 @@
 import numpy as np
 from scipy.spatial.distance import cosine
-import language_tool_python
 from sqlalchemy.orm import Session
-from typing import Optional
-import torchaudio
+from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, has_app_context
+import time
+import torch
 import math
+from pathlib import Path
 
 import logging
 logger = logging.getLogger(__name__)
 
 from ..core.database import db_manager
+from ..utils.detect_language import Language
 from ..utils import (
     detect_text_language,
     load_spacy_model,
+    language_tool_pool,
+    inference_scheduler,
+    audio_frontend,
+    TEXT_EMBEDDING_MODEL_NAME,
+    AUDIO_EMBEDDING_MODEL_NAME,
+    STT_MODEL_NAME,
     text_embedding_model,
     audio_embedding_model,
     audio_embedding_processor,
@@ -20,9 +30,16 @@ from ..utils import (
 )
 from .features import ExerciseService
 from .feedback import FeedbackService
+from .reference import ReferenceService
+from .language_resolver import language_resolver
 
 exercise_service = ExerciseService()
 feedback_service = FeedbackService()
+reference_service = ReferenceService()
+
+# Runs the independent scorers of an evaluation concurrently: they wait on the
+# inference workers, the LanguageTool server or spaCy, all of which release the GIL
+scorer_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="evaluation-scorer")
 
 class EvaluatorService:
     text_embedding_model = text_embedding_model
@@ -55,9 +72,7 @@ class EvaluatorService:
     grammar_fallback_score = 1.0
 
     def _get_correct_text_and_type(self, ex_id: str, session: Optional[Session]) -> tuple[Optional[str], Optional[str]]:
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             exercise = exercise_service.get_by_id(ex_id, session=session)
@@ -81,9 +96,7 @@ class EvaluatorService:
                 session.close()
 
     def _get_correct_audio_path_and_type(self, ex_id: str, correct_audio_index: int, session: Optional[Session]) -> tuple[Optional[str], Optional[str]]:
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             exercise = exercise_service.get_by_id(ex_id, session=session)
@@ -116,26 +129,86 @@ class EvaluatorService:
                 session.close()
 
     def _extract_waveform_from_path(self, audio_path: str) -> np.ndarray:
-        waveform, sr = torchaudio.load(audio_path)
-        if sr != 16000:
-            waveform = torchaudio.transforms.Resample(orig_freq=sr, new_freq=16000)(waveform)
-        return waveform.mean(dim=0).numpy()
+        return audio_frontend.decode(audio_path)
     
-    def _speech_to_embeddings(self, waveform: np.ndarray) -> list[float]:
-        input_processed = self.audio_embedding_processor(waveform, sampling_rate=16000, return_tensors="pt", padding=True)
-        return self.audio_embedding_model(**input_processed, output_hidden_states=True).hidden_states[-1].squeeze(0).mean(dim=0).detach().numpy()
+    # Batch functions of the models, run by the inference scheduler on the concurrent requests it groups
+
+    @classmethod
+    def _encode_text_batch(cls, texts: list[str]) -> list[np.ndarray]:
+        return list(cls.text_embedding_model.encode(texts))
+
+    @classmethod
+    def _speech_batch_to_embeddings(cls, waveforms: list[np.ndarray]) -> list[np.ndarray]:
+        input_processed = cls.audio_embedding_processor(
+            waveforms, sampling_rate=16000, return_tensors="pt", padding=True, return_attention_mask=True
+        )
+        with torch.inference_mode():
+            hidden_states = cls.audio_embedding_model(**input_processed, output_hidden_states=True).hidden_states[-1]
+        # Mean over each recording's own frames, not over the padding added to match the longest one
+        frame_counts = cls.audio_embedding_model._get_feat_extract_output_lengths(input_processed["attention_mask"].sum(-1))
+        return [hidden_states[i, :frame_counts[i]].mean(dim=0).numpy() for i in range(len(waveforms))]
+
+    @classmethod
+    def _speech_batch_to_text(cls, waveforms: list[np.ndarray]) -> list[str]:
+        return [output["text"] for output in cls.stt_pipe(waveforms, batch_size=len(waveforms), return_timestamps=False)]
+
+    def _encode_text(self, text: str) -> np.ndarray:
+        return inference_scheduler.run(TEXT_EMBEDDING_MODEL_NAME, text)
+
+    def _speech_to_embeddings(self, waveform: np.ndarray) -> np.ndarray:
+        return inference_scheduler.run(AUDIO_EMBEDDING_MODEL_NAME, waveform)
     
     def _speech_to_text(self, waveform: np.ndarray) -> str:
-        return self.stt_pipe(waveform, return_timestamps=False)["text"]
+        return inference_scheduler.run(STT_MODEL_NAME, waveform)
+
+    def _compute_reference_audio_features(self, audio_path: Path) -> tuple[int, np.ndarray, str]:
+        # Decoded once into a buffer shared by both models, memory-mapped when decoded before
+        waveform = audio_frontend.load_reference(audio_path)
+        return waveform.shape[0], self._speech_to_embeddings(waveform), self._speech_to_text(waveform)
+
+    def get_reference_audio_features(self, audio_path: Path) -> tuple[int, np.ndarray, str]:
+        """
+        Get the waveform length, embedding and transcription of a reference recording.
+
+        They only depend on the file content and the models, so they are computed once
+        and then served from the reference cache.
+        """
+        return reference_service.get_audio_features(
+            audio_path,
+            f"{AUDIO_EMBEDDING_MODEL_NAME}|{STT_MODEL_NAME}",
+            self._compute_reference_audio_features
+        )
+
+    def precompute_reference_audio(self, audio_files: list[str]) -> int:
+        """
+        Fill the reference cache for an exercise's audio files, e.g. right after they are attached.
+
+        Args:
+            audio_files: The exercise's audio_files, e.g. ["/media/audio/abc.mp3"]
+
+        Returns:
+            The number of files processed
+        """
+        from .media import MediaService
+        media_service = MediaService()
+
+        processed = 0
+        for audio_file in audio_files:
+            _, audio_path = media_service.get_file_path("/".join(audio_file.split("/")[2:]))
+            if not audio_path.is_file():
+                logger.warning(f"Reference audio not found, skipping: {audio_file}")
+                continue
+            self.get_reference_audio_features(audio_path)
+            processed += 1
+        return processed
 
     def _compute_cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
         return float(1-cosine(u = vec1, v = vec2))
 
-    def _compute_grammar_error_rate(self, user_translation: str, correct_translation: str) -> float:
-        language = detect_text_language(correct_translation)
+    def _compute_grammar_error_rate(self, user_translation: str, correct_translation: str, language: Optional[Language] = None) -> float:
+        language = language or detect_text_language(correct_translation)
         try:
-            tool = language_tool_python.LanguageTool(language.iso1)
-            matches = tool.check(user_translation)
+            matches = language_tool_pool.check(language.iso1, user_translation)
         except Exception as err:
             logger.warning(
                 f"LanguageTool check failed for language '{language.iso1}'. "
@@ -168,8 +241,8 @@ class EvaluatorService:
         logger.info(substantive_errors)
         return score
     
-    def _compute_token_differences_rate(self, user_translation: str, correct_translation: str) -> float:
-        language = detect_text_language(correct_translation)
+    def _compute_token_differences_rate(self, user_translation: str, correct_translation: str, language: Optional[Language] = None) -> float:
+        language = language or detect_text_language(correct_translation)
         nlp = load_spacy_model(language.spacy_model)
 
         # Normalize whitespace for CJK languages where spaces are not meaningful
@@ -188,6 +261,18 @@ class EvaluatorService:
         common_tokens = correct_tokens.intersection(user_tokens)
         return min(1, len(common_tokens) / len(user_tokens))
     
+    def _run_stages(self, stages: dict[str, Callable[[], object]], timings: dict[str, float]) -> dict[str, object]:
+        """Run independent stages concurrently, recording how long each one took in timings."""
+        def timed(name: str, stage: Callable[[], object]) -> object:
+            started = time.perf_counter()
+            try:
+                return stage()
+            finally:
+                timings[name] = round(time.perf_counter() - started, 4)
+
+        futures = {name: scorer_pool.submit(timed, name, stage) for name, stage in stages.items()}
+        return {name: future.result() for name, future in futures.items()}
+
     def _evaluate_text(self, ex_id: str, user_text: str) -> dict[str, float | str]:
         correct_text, exercise_type = self._get_correct_text_and_type(ex_id, session=None)
         if not correct_text:
@@ -197,16 +282,25 @@ class EvaluatorService:
         # Get the weights for the specific exercise type
         x, y, z = self.exercises_scales[exercise_type]
 
-        embedding_similarity = self._compute_cosine_similarity(
-            self.text_embedding_model.encode(user_text),
-            self.text_embedding_model.encode(correct_text)
-        )
+        # The language is resolved once from the course, for both the grammar and the token scorers
+        timings: dict[str, float] = {}
+        language = self._run_stages({"language_resolution": lambda: language_resolver.resolve(correct_text, ex_id=ex_id)}, timings)["language_resolution"]
+
+        # The reference embedding only changes with the answer, so it is encoded once and cached
+        scores = self._run_stages({
+            "embedding_similarity": lambda: self._compute_cosine_similarity(
+                self._encode_text(user_text),
+                reference_service.get_text_embedding(ex_id, correct_text, TEXT_EMBEDDING_MODEL_NAME, self._encode_text)
+            ),
+            "grammar_error_rate": lambda: self._compute_grammar_error_rate(user_text, correct_text, language),
+            "token_difference_rate": lambda: self._compute_token_differences_rate(user_text, correct_text, language),
+        }, timings)
+        embedding_similarity = scores["embedding_similarity"]
+        grammar_error_rate = scores["grammar_error_rate"]
+        token_difference_rate = scores["token_difference_rate"]
+
         logger.info(f"Embedding similarity for Exercise {ex_id}between user: '{user_text}' and correct answer: '{correct_text}' is {embedding_similarity:.4f}")
-        
-        grammar_error_rate = self._compute_grammar_error_rate(user_text, correct_text)
         logger.info(f"Grammar error rate for Exercise {ex_id} for user text: '{user_text}' is {grammar_error_rate:.4f}") 
-
-        token_difference_rate = self._compute_token_differences_rate(user_text, correct_text)
         logger.info(f"Token difference rate for Exercise {ex_id} between user: '{user_text}' and correct answer: '{correct_text}' is {token_difference_rate:.4f}")
 
         return {
@@ -216,6 +310,7 @@ class EvaluatorService:
             "token_difference_rate": token_difference_rate,
             "user_answer": user_text,
             "correct_answer": correct_text,
+            "timings": timings,
         }
     
     def _evaluate_speech(self, ex_id: str, user_audio_path: str, correct_audio_index: int) -> dict[str, float | str]:
@@ -230,28 +325,34 @@ class EvaluatorService:
 
         logger.info(f"Evaluating speech for Exercise {ex_id} with user audio: '{user_audio_path}' and correct audio: '{correct_audio_path}'")
 
-        correct_waveform = self._extract_waveform_from_path(correct_audio_path)
-        user_waveform = self._extract_waveform_from_path(user_audio_path)
-        
-        embedding_similarity = self._compute_cosine_similarity(
-            self._speech_to_embeddings(user_waveform),
-            self._speech_to_embeddings(correct_waveform)
-        )
-
-        user_transcription = self._speech_to_text(user_waveform)
-        correct_transcription = self._speech_to_text(correct_waveform)
+        # The reference side is served from the cache, only the user recording goes through the models
+        timings: dict[str, float] = {}
+        decoded = self._run_stages({
+            "reference_features": lambda: self.get_reference_audio_features(correct_audio_path),
+            "user_waveform": lambda: self._extract_waveform_from_path(user_audio_path),
+        }, timings)
+        _, correct_embedding, correct_transcription = decoded["reference_features"]
+        user_waveform = decoded["user_waveform"]
+
+        # The language comes from the course, so it is resolved alongside the models
+        modeled = self._run_stages({
+            "user_embedding": lambda: self._speech_to_embeddings(user_waveform),
+            "user_transcription": lambda: self._speech_to_text(user_waveform),
+            "language_resolution": lambda: language_resolver.resolve(correct_transcription, ex_id=ex_id),
+        }, timings)
+        user_transcription = modeled["user_transcription"]
+        language = modeled["language_resolution"]
+
+        embedding_similarity = self._compute_cosine_similarity(modeled["user_embedding"], correct_embedding)
         logger.info(f"Transcribed user audio for Exercise {ex_id}: '{user_transcription}'")
         logger.info(f"Transcribed correct audio for Exercise {ex_id}: '{correct_transcription}'")
 
-        grammar_error_rate = self._compute_grammar_error_rate(
-            user_transcription,
-            correct_transcription
-        )
-
-        token_difference_rate = self._compute_token_differences_rate(
-            user_transcription,
-            correct_transcription
-        )
+        scores = self._run_stages({
+            "grammar_error_rate": lambda: self._compute_grammar_error_rate(user_transcription, correct_transcription, language),
+            "token_difference_rate": lambda: self._compute_token_differences_rate(user_transcription, correct_transcription, language),
+        }, timings)
+        grammar_error_rate = scores["grammar_error_rate"]
+        token_difference_rate = scores["token_difference_rate"]
 
         # Get the weights for the specific exercise type
         x, y, z = self.exercises_scales[exercise_type]
@@ -263,25 +364,25 @@ class EvaluatorService:
             "token_difference_rate": token_difference_rate,
             "user_transcription": user_transcription,
             "correct_transcription": correct_transcription,
+            "timings": timings,
         }
 
-    def evaluate(self, ex_id: str, user_input: str, input_type: str, correct_audio_index: int = 0) -> float:
+    def score(self, ex_id: str, user_input: str, input_type: str, correct_audio_index: int = 0) -> dict:
         """
-        Evaluate a user's answer for a given exercise ID and input type (text or speech).
-        
-        Args:
-            - ex_id: The ID of the exercise to evaluate.
-            - user_input: The user's answer, either as text or a path to an audio file.
-            - input_type: The type of input, either 'text' or 'speech'.
-            - threshold: The score threshold above which the answer is considered correct (default is 0.8).
-            - correct_audio_index: For speech evaluation, the index of the correct audio file to compare against (default is 0).
-            
+        Score a user's answer, without generating the feedback.
+
+        This is the fast part of evaluate(): the models only, no text generation.
+
         Returns:
             A dictionary containing:
                 - 'correct': A boolean indicating whether the answer is correct based on the threshold.
                 - 'score': The computed score for the user's answer.
-                - 'feedback': A string with feedback for the user (currently empty, to be implemented).      
+                - 'results': The detailed metrics the feedback is generated from.
+                - 'threshold': The threshold of the exercise type.
+                - 'exercise': The evaluated Exercise.
+                - 'timings': Seconds spent in each stage of the evaluation.
         """
+        started = time.perf_counter()
         if input_type == 'text':
             results = self._evaluate_text(ex_id, user_input)
         elif input_type == 'speech':
@@ -290,25 +391,69 @@ class EvaluatorService:
             logger.warning(f"Invalid input type '{input_type}' for evaluation. Returning score of 0.")
             raise ValueError("Invalid input type for evaluation. Must be 'text' or 'speech'.")
         
-        logger.info(f"Evaluation results for Exercise {ex_id} with input type '{input_type}': {results}")
+        # Kept out of the results, which are handed to the feedback model as metrics
+        timings = results.pop("timings", {})
+        timings["scoring"] = round(time.perf_counter() - started, 4)
+        logger.info(f"Evaluation results for Exercise {ex_id} with input type '{input_type}': {results} (timings: {timings})")
 
         exercise = exercise_service.get_by_id(ex_id, session=None)
         if not exercise:
             raise ValueError(f"Exercise {ex_id} not found.")
 
         threshold = self.exercises_thresholds.get(exercise.exercise_type, 0.5)
-        feedback = feedback_service.generate_feedback(
+        return {
+            "correct": results["score"] > threshold,
+            "score": results["score"],
+            "results": results,
+            "threshold": threshold,
+            "exercise": exercise,
+            "timings": timings,
+        }
+
+    def generate_feedback(self, ex_id: str, user_input: str, input_type: str, scored: dict, correct_audio_index: int = 0) -> str:
+        """Generate the feedback of an answer scored by score()."""
+        return feedback_service.generate_feedback(
             ex_id=ex_id,
             user_input=user_input,
             input_type=input_type,
-            results=results,
-            threshold=threshold,
+            results=scored["results"],
+            threshold=scored["threshold"],
             correct_audio_index=correct_audio_index,
-            exercise=exercise,
+            exercise=scored["exercise"],
         )
 
-        return {
-            "correct": results["score"] > threshold,
-            "score": results["score"],
-            "feedback": feedback,
-        }
\ No newline at end of file
+    def evaluate(self, ex_id: str, user_input: str, input_type: str, correct_audio_index: int = 0) -> float:
+        """
+        Evaluate a user's answer for a given exercise ID and input type (text or speech).
+        
+        Args:
+            - ex_id: The ID of the exercise to evaluate.
+            - user_input: The user's answer, either as text or a path to an audio file.
+            - input_type: The type of input, either 'text' or 'speech'.
+            - threshold: The score threshold above which the answer is considered correct (default is 0.8).
+            - correct_audio_index: For speech evaluation, the index of the correct audio file to compare against (default is 0).
+            
+        Returns:
+            A dictionary containing:
+                - 'correct': A boolean indicating whether the answer is correct based on the threshold.
+                - 'score': The computed score for the user's answer.
+                - 'feedback': A string with feedback for the user (currently empty, to be implemented).      
+                - 'timings': In debug mode, seconds spent in each stage of the evaluation.
+        """
+        scored = self.score(ex_id, user_input, input_type, correct_audio_index=correct_audio_index)
+
+        started = time.perf_counter()
+        evaluation = {
+            "correct": scored["correct"],
+            "score": scored["score"],
+            "feedback": self.generate_feedback(ex_id, user_input, input_type, scored, correct_audio_index=correct_audio_index),
+        }
+
+        # Per-stage timings, to profile the pipeline while developing
+        if has_app_context() and current_app.debug:
+            evaluation["timings"] = {**scored["timings"], "feedback": round(time.perf_counter() - started, 4)}
+        return evaluation
+
+inference_scheduler.register(TEXT_EMBEDDING_MODEL_NAME, EvaluatorService._encode_text_batch, max_batch_size=64)
+inference_scheduler.register(AUDIO_EMBEDDING_MODEL_NAME, EvaluatorService._speech_batch_to_embeddings, max_batch_size=8)
+inference_scheduler.register(STT_MODEL_NAME, EvaluatorService._speech_batch_to_text, max_batch_size=8)
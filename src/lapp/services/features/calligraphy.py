@@ -11,7 +11,7 @@ from ...models.features import Calligraphy
 from ...core.database import db_manager
 from ..containers import UnitService, LanguageService
 from ..components import CharacterService, WordService
-from ...utils import update_score
+from ...utils import update_score, update_difficulty, compute_due_date
 
 unit_service = UnitService()
 language_service = LanguageService()
@@ -35,7 +35,8 @@ class CalligraphyService:
         unit_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Calligraphy] | list[dict]:
         """
         Get all calligraphies for a specific language or unit.
@@ -43,33 +44,28 @@ class CalligraphyService:
         Args:
             language_id (Optional[str]=None): The id of the language to get all the calligraphies from
             unit_id (Optional[str]=None): The id of the unit to get all the calligraphies from
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
         Returns:
             List of Calligraphy objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                calligraphies = []
-                for unit in units:
-                    calligraphies.extend(
-                        db_manager.find_all(
-                            model_class=Calligraphy,
-                            filters={'unit_id': unit.id},
-                            session=session
-                        )
-                    )
+                calligraphies = db_manager.find_all_by_language(
+                    model_class=Calligraphy,
+                    language_id=language_id,
+                    session=session,
+                    load_relationships=load_profile
+                )
                 return self._serialize_list(calligraphies, as_dict, include_relations)
             elif unit_id:
                 calligraphies = db_manager.find_all(
                     model_class=Calligraphy,
                     filters={'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(calligraphies, as_dict, include_relations)
             else:
@@ -83,31 +79,93 @@ class CalligraphyService:
             if owns_session:
                 session.close()
 
+    def get_page(
+        self,
+        language_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        session: Optional[Session] = None,
+        include_relations: bool = True,
+        load_profile: str = "card"
+    ) -> dict:
+        """
+        Get one page of the calligraphies of a language or unit, serialized.
+
+        Args:
+            language_id: The id of the language to get the calligraphies from
+            unit_id: The id of the unit to get the calligraphies from
+            after: ID of the last item of the previous page, None for the first page
+            limit: Maximum number of items in the page, None for all the remaining ones
+            fields: Keys to keep in each item. If they are all Calligraphy columns, only those columns are queried.
+            load_profile: Relationships to eager-load when whole items are serialized, see LOAD_PROFILES
+
+        Returns:
+            Dictionary with the "items" of the page, the "total" number of items and the "next_after" cursor
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
+            if not (language_id or unit_id):
+                raise ValueError(f"Requires either language_id or unit_id but got neither: {language_id} and {unit_id}")
+
+            columns = fields if fields and set(fields) <= set(Calligraphy.__table__.columns.keys()) else None
+            calligraphies, total, next_after = db_manager.find_page(
+                model_class=Calligraphy,
+                filters={'unit_id': unit_id} if unit_id else None,
+                language_id=language_id,
+                after=after,
+                limit=limit,
+                columns=columns,
+                session=session,
+                load_relationships=load_profile
+            )
+
+            if columns:
+                items = [{key: value.isoformat() if isinstance(value, date) else value for key, value in row.items()} for row in calligraphies]
+            else:
+                items = self._serialize_list(calligraphies, True, include_relations)
+                if fields:
+                    items = [{key: value for key, value in item.items() if key == 'id' or key in fields} for item in items]
+
+            return {"items": items, "total": total, "next_after": next_after}
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to get page of calligraphies: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def get_by_id(
         self,
         calligraphy_id: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> Calligraphy | dict | None:
         """
         Get a Calligraphy item by its ID.
 
         Args:
             calligraphy_id: The ID of the Calligraphy item to retrieve.
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             Calligraphy object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             calligraphy = db_manager.find_by_attr(
                 model_class=Calligraphy,
                 attr_values={'id': calligraphy_id},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
             return self._serialize(calligraphy, as_dict, include_relations)
         except Exception as e:
@@ -126,7 +184,8 @@ class CalligraphyService:
         unit_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Calligraphy] | list[dict]:
         """
         Get all Calligraphy items of a specific level among a language.
@@ -135,35 +194,31 @@ class CalligraphyService:
             language_id: The id of the language to filter Calligraphy items
             unit_id: The id of the unit to filter Calligraphy items
             level: Calligraphy level (e.g., 'A1', 'B2')
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
         
         Returns:
             List of matching Calligraphy objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
 
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                calligraphies = []
-                for unit in units:
-                    calligraphies.extend(
-                        db_manager.find_all(
-                            model_class=Calligraphy,
-                            filters={'level':level ,'unit_id': unit.id},
-                            session=session
-                        )
-                    )
+                calligraphies = db_manager.find_all_by_language(
+                    model_class=Calligraphy,
+                    language_id=language_id,
+                    filters={'level': level},
+                    session=session,
+                    load_relationships=load_profile
+                )
                 return self._serialize_list(calligraphies, as_dict, include_relations)
             elif unit_id:
                 calligraphies = db_manager.find_all(
                     model_class=Calligraphy,
                     filters={'level': level, 'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(calligraphies, as_dict, include_relations)
             else:
@@ -193,12 +248,10 @@ class CalligraphyService:
         Returns:
             Created Calligraphy object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            unit = unit_service.get_by_id(data.unit_id, session=session)
+            unit = unit_service.get_by_id(data.unit_id, session=session, load_profile="ids_only")
 
             if not unit:
                 logger.warning(f"Cannot create Calligraphy item, unit not found: {data.unit_id}")
@@ -238,6 +291,9 @@ class CalligraphyService:
             calligraphy.example_word_id = example_word.id if example_word else None
             calligraphy.example_word = example_word
             
+            # Count the new item in its unit score, committed together with the insert
+            unit_service.apply_score_deltas({calligraphy.unit_id: (calligraphy.score or 0.0, 1)}, session=session)
+
             result = db_manager.insert(
                 obj=calligraphy,
                 session=session
@@ -276,12 +332,10 @@ class CalligraphyService:
         Returns:
             Updated Calligraphy object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            existing = self.get_by_id(calligraphy_id, session=session)
+            existing = self.get_by_id(calligraphy_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Calligraphy item not found: {calligraphy_id}")
@@ -320,11 +374,20 @@ class CalligraphyService:
             update_data.pop('score', None)  # Don't allow direct score updates
             update_data.pop('last_seen', None)  # Don't allow direct last_seen updates
             
+            previous_unit_id = existing.unit_id
+
             # Update the existing object's attributes
             for key, value in update_data.items():
                 if key not in ('character_id', 'example_word_id'):  # Don't overwrite if already set
                     setattr(existing, key, value)
             
+            # Move the item score to its new unit if it changed
+            if existing.unit_id != previous_unit_id:
+                unit_service.apply_score_deltas({
+                    previous_unit_id: (-(existing.score or 0.0), -1),
+                    existing.unit_id: (existing.score or 0.0, 1),
+                }, session=session)
+
             # Save to database
             result = db_manager.modify(existing, session=session)
             
@@ -352,18 +415,19 @@ class CalligraphyService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if Calligraphy item exists before deleting
-            existing = self.get_by_id(calligraphy_id, session=session)
+            existing = self.get_by_id(calligraphy_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Calligraphy item not found: {calligraphy_id}")
                 return False
             
+            # Remove the item from its unit score, committed together with the delete
+            unit_service.apply_score_deltas({existing.unit_id: (-(existing.score or 0.0), -1)}, session=session)
+
             # Delete from database
             success = db_manager.delete(existing, session=session)
             
@@ -402,12 +466,10 @@ class CalligraphyService:
         Returns:
             Updated Calligraphy object if successful, None otherwise
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            calligraphy = self.get_by_id(calligraphy_id, session=session)
+            calligraphy = self.get_by_id(calligraphy_id, session=session, load_profile="ids_only")
 
             if not calligraphy:
                 logger.warning(f"Calligraphy item not found: {calligraphy_id}")
@@ -419,21 +481,29 @@ class CalligraphyService:
                 score=calligraphy.score,
                 last_seen=calligraphy.last_seen,
                 similarity=score,
+                difficulty=calligraphy.difficulty
             )
-            
-            # Update last_seen
+            calligraphy.difficulty = update_difficulty(
+                new_score=calligraphy.score,
+                last_seen=calligraphy.last_seen,
+                previous_difficulty=calligraphy.difficulty
+            )
+
+            # Update last_seen and schedule the next review
             calligraphy.last_seen = date.today()
+            calligraphy.due_at = compute_due_date(calligraphy.score, calligraphy.difficulty)
             
+            # Apply the score change to the unit aggregates, committed together with the item
+            if calligraphy.score != previous_score and calligraphy.unit_id:
+                unit_service.apply_score_deltas({calligraphy.unit_id: (calligraphy.score - (previous_score or 0.0), 0)}, session=session)
+                logger.info(f"Updated unit {calligraphy.unit_id} score due to Calligraphy {calligraphy_id}")
+
             # Save changes
             result = db_manager.modify(calligraphy, session=session)
             
             if result:
                 logger.info(f"Updated Calligraphy item {calligraphy_id} score: {result.score}")
 
-            if calligraphy.score != previous_score:
-                if calligraphy.unit_id:
-                    unit_service.update_score(calligraphy.unit_id, session=session)
-                    logger.info(f"Updated unit {calligraphy.unit_id} score due to calligraphy {calligraphy_id}")
             
             
             
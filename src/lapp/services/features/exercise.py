@@ -1,20 +1,31 @@
 from datetime import date
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 import logging
 logger = logging.getLogger(__name__)
 
 from ...schemas.features import ExerciseDict
-from ...models.features import Exercise
+from ...models.features import (
+    Exercise,
+    Calligraphy,
+    Vocabulary,
+    Grammar,
+    ExerciseVocabulary,
+    ExerciseCalligraphy,
+    ExerciseGrammar,
+)
 from ...core.database import db_manager
-from ...utils import update_score
+from ...utils import update_score, update_difficulty, compute_due_date
 from ..containers import UnitService
+from ..reference import ReferenceService
 from .calligraphy import CalligraphyService
 from .vocabulary import VocabularyService
 from .grammar import GrammarService
 
 unit_service = UnitService()
+reference_service = ReferenceService()
 calligraphy_service = CalligraphyService()
 vocabulary_service = VocabularyService()
 grammar_service = GrammarService()
@@ -30,6 +41,12 @@ class ExerciseService:
             return exercises
         return [exercise.to_dict(include_relations=include_relations) for exercise in exercises]
 
+    def _existing_ids(self, model_class, ids: list[str], session: Session) -> set[str]:
+        """Return the subset of ids that exist for model_class, in a single query."""
+        if not ids:
+            return set()
+        return set(session.scalars(select(model_class.id).where(model_class.id.in_(set(ids)))).all())
+
     def _check_associate_components(
         self, 
         calligraphy_ids: Optional[list[str]],
@@ -38,60 +55,37 @@ class ExerciseService:
         session: Optional[Session] = None
     ) -> tuple[list[str], list[str], list[str]]:
         """Validate and filter associated component IDs."""
-        
-        valid_calligraphy_ids = [
-            cid for cid in (calligraphy_ids or [])
-            if calligraphy_service.get_by_id(calligraphy_id=cid, session=session)
-        ]
-        
-        valid_grammar_ids = [
-            gid for gid in (grammar_ids or [])
-            if grammar_service.get_by_id(grammar_id=gid, session=session)
-        ]
-        
-        valid_voc_ids = [
-            vid for vid in (vocabulary_ids or [])
-            if vocabulary_service.get_by_id(voc_id=vid, session=session)
-        ]
-        
-        return valid_calligraphy_ids, valid_voc_ids, valid_grammar_ids
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            existing_calligraphy_ids = self._existing_ids(Calligraphy, calligraphy_ids, session)
+            existing_voc_ids = self._existing_ids(Vocabulary, vocabulary_ids, session)
+            existing_grammar_ids = self._existing_ids(Grammar, grammar_ids, session)
+
+            # dict.fromkeys drops duplicates while keeping the submitted order
+            valid_calligraphy_ids = [cid for cid in dict.fromkeys(calligraphy_ids or []) if cid in existing_calligraphy_ids]
+            valid_voc_ids = [vid for vid in dict.fromkeys(vocabulary_ids or []) if vid in existing_voc_ids]
+            valid_grammar_ids = [gid for gid in dict.fromkeys(grammar_ids or []) if gid in existing_grammar_ids]
+
+            return valid_calligraphy_ids, valid_voc_ids, valid_grammar_ids
+        finally:
+            if owns_session:
+                session.close()
     
-    def _clean_exercise_associations(self, exercise: Exercise, session: Optional[Session] = None) -> bool:
-        """
-        Clean invalid association_ids from an exercise.
-        
-        Returns:
-            True if any associations were cleaned, False otherwise
-        """
-        if not (exercise.calligraphy_ids or exercise.vocabulary_ids or exercise.grammar_ids):
-            return False
-        
-        cleaned_calligraphy_ids, cleaned_voc_ids, cleaned_grammar_ids = self._check_associate_components(
-            calligraphy_ids=exercise.calligraphy_ids,
-            vocabulary_ids=exercise.vocabulary_ids,
-            grammar_ids=exercise.grammar_ids,
-            session=session
-        )
-        
-        if (cleaned_calligraphy_ids != exercise.calligraphy_ids or
-            cleaned_voc_ids != exercise.vocabulary_ids or
-            cleaned_grammar_ids != exercise.grammar_ids):
-            
-            exercise.calligraphy_ids = cleaned_calligraphy_ids
-            exercise.vocabulary_ids = cleaned_voc_ids
-            exercise.grammar_ids = cleaned_grammar_ids
-            db_manager.modify(exercise, session=session)
-            return True
-        
-        return False
-        
+    def _schedule_reference_audio(self, ex_id: str, audio_files: list[str]) -> None:
+        """Precompute the evaluation features of newly attached reference recordings in the background."""
+        # Imported here: the tasks package imports the services
+        from ...tasks import schedule_reference_audio
+        schedule_reference_audio(ex_id, audio_files)
+
     def get_all(
         self,
         language_id: Optional[str] = None,
         unit_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Exercise] | list[dict]:
         """
         Get all exercises for a specific language or unit.
@@ -99,40 +93,32 @@ class ExerciseService:
         Args:
             language_id (Optional[str] = None): The id of the language to get all the exercises from
             unit_id (Optional[str] = None): The id of the unit to get all the exercises from
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             List of Exercise objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                exercises = []
-                for unit in units:
-                    exercises.extend(
-                        db_manager.find_all(
-                            model_class=Exercise,
-                            filters={'unit_id': unit.id},
-                            session=session
-                        )
-                    )
+                exercises = db_manager.find_all_by_language(
+                    model_class=Exercise,
+                    language_id=language_id,
+                    session=session,
+                    load_relationships=load_profile
+                )
             elif unit_id:
                 exercises = db_manager.find_all(
                     model_class=Exercise,
                     filters={'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
             else:
                 raise ValueError(f"Requires either language_id or unit_id but got: {language_id} and {unit_id}")
             
-            if exercises:
-                for ex in exercises:
-                    self._clean_exercise_associations(ex, session=session)
             return self._serialize_list(exercises, as_dict, include_relations)
         except Exception as e:
             if owns_session:
@@ -143,35 +129,94 @@ class ExerciseService:
             if owns_session:
                 session.close()
 
+    def get_page(
+        self,
+        language_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        session: Optional[Session] = None,
+        include_relations: bool = True,
+        load_profile: str = "card"
+    ) -> dict:
+        """
+        Get one page of the exercises of a language or unit, serialized.
+
+        Args:
+            language_id: The id of the language to get the exercises from
+            unit_id: The id of the unit to get the exercises from
+            after: ID of the last item of the previous page, None for the first page
+            limit: Maximum number of items in the page, None for all the remaining ones
+            fields: Keys to keep in each item. If they are all Exercise columns, only those columns are queried.
+            load_profile: Relationships to eager-load when whole items are serialized, see LOAD_PROFILES
+
+        Returns:
+            Dictionary with the "items" of the page, the "total" number of items and the "next_after" cursor
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
+            if not (language_id or unit_id):
+                raise ValueError(f"Requires either language_id or unit_id but got neither: {language_id} and {unit_id}")
+
+            columns = fields if fields and set(fields) <= set(Exercise.__table__.columns.keys()) else None
+            exercises, total, next_after = db_manager.find_page(
+                model_class=Exercise,
+                filters={'unit_id': unit_id} if unit_id else None,
+                language_id=language_id,
+                after=after,
+                limit=limit,
+                columns=columns,
+                session=session,
+                load_relationships=load_profile
+            )
+
+            if columns:
+                items = [{key: value.isoformat() if isinstance(value, date) else value for key, value in row.items()} for row in exercises]
+            else:
+                items = self._serialize_list(exercises, True, include_relations)
+                if fields:
+                    items = [{key: value for key, value in item.items() if key == 'id' or key in fields} for item in items]
+
+            return {"items": items, "total": total, "next_after": next_after}
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to get page of exercises: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def get_by_id(
         self,
         ex_id: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> Exercise | dict | None:
         """
         Get a Exercise item by its ID.
 
         Args:
             ex_id: The ID of the Exercise item to retrieve.
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             Exercise object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             exercise = db_manager.find_by_attr(
                 model_class=Exercise,
                 attr_values={'id': ex_id},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
-
-            if exercise:
-                self._clean_exercise_associations(exercise, session=session)
             return self._serialize(exercise, as_dict, include_relations)
         except Exception as e:
             if owns_session:
@@ -182,6 +227,62 @@ class ExerciseService:
             if owns_session:
                 session.close()
 
+    def get_by_feature(
+        self,
+        vocabulary_id: Optional[str] = None,
+        calligraphy_id: Optional[str] = None,
+        grammar_id: Optional[str] = None,
+        session: Optional[Session] = None,
+        as_dict: bool = False,
+        include_relations: bool = True,
+        load_profile: str = "full"
+    ) -> list[Exercise] | list[dict]:
+        """
+        Get all exercises that practice a specific feature.
+
+        Uses the reverse index of the association table, so the lookup doesn't scan the exercises.
+
+        Args:
+            vocabulary_id: The id of the vocabulary practiced by the exercises
+            calligraphy_id: The id of the calligraphy practiced by the exercises
+            grammar_id: The id of the grammar practiced by the exercises
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
+
+        Returns:
+            List of Exercise objects
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            lookups = [
+                (ExerciseVocabulary, ExerciseVocabulary.vocabulary_id, vocabulary_id),
+                (ExerciseCalligraphy, ExerciseCalligraphy.calligraphy_id, calligraphy_id),
+                (ExerciseGrammar, ExerciseGrammar.grammar_id, grammar_id),
+            ]
+            specified = [(link, column, value) for link, column, value in lookups if value]
+            if len(specified) != 1:
+                raise ValueError(
+                    f"Requires exactly one of vocabulary_id, calligraphy_id or grammar_id but got: "
+                    f"{vocabulary_id}, {calligraphy_id} and {grammar_id}"
+                )
+
+            link, column, value = specified[0]
+            query = (
+                session.query(Exercise)
+                .join(link, link.exercise_id == Exercise.id)
+                .filter(column == value)
+            )
+            exercises = db_manager._load_relationships(query, Exercise, load_profile).all()
+            return self._serialize_list(exercises, as_dict, include_relations)
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to get exercises by feature: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def get_by_level(
         self,
         level: str,
@@ -189,7 +290,8 @@ class ExerciseService:
         unit_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Exercise] | list[dict]:
         """
         Get all Exercise items of a specific level among a language.
@@ -198,40 +300,34 @@ class ExerciseService:
             language_id: The id of the language to filter Exercise items
             unit_id: The id of the unit to filter Exercise items
             level: Exercise level (e.g., 'A1', 'B2')
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
         
         Returns:
             List of matching Exercise objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
 
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                exercises = []
-                for unit in units:
-                    exercises.extend(
-                        db_manager.find_all(
-                            model_class=Exercise,
-                            filters={'unit_id': unit.id},
-                            session=session
-                        )
-                    )
+                exercises = db_manager.find_all_by_language(
+                    model_class=Exercise,
+                    language_id=language_id,
+                    filters={'level': level},
+                    session=session,
+                    load_relationships=load_profile
+                )
             elif unit_id:
                 exercises = db_manager.find_all(
                     model_class=Exercise,
                     filters={'level': level, 'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
             else:
                 raise ValueError(f"Requires either language_id or unit_id but got neither: {language_id} and {unit_id}")
             
-            for ex in exercises:
-                self._clean_exercise_associations(ex, session=session)
             return self._serialize_list(exercises, as_dict, include_relations)
         except Exception as e:
             if owns_session:
@@ -258,12 +354,10 @@ class ExerciseService:
         Returns:
             Created Exercise object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            unit = unit_service.get_by_id(data.unit_id, session=session)
+            unit = unit_service.get_by_id(data.unit_id, session=session, load_profile="ids_only")
 
             if not unit:
                 logger.warning(f"Cannot create Exercise item, unit not found: {data.unit_id}")
@@ -284,6 +378,9 @@ class ExerciseService:
                 ),
                 **data.model_dump(exclude_none=True)
             )
+            # Count the new item in its unit score, committed together with the insert
+            unit_service.apply_score_deltas({exercise.unit_id: (exercise.score or 0.0, 1)}, session=session)
+
             result = db_manager.insert(
                 obj=exercise,
                 session=session
@@ -291,6 +388,8 @@ class ExerciseService:
 
             if result:
                 logger.info(f"Created new Exercise item with ID: {result.id}")
+                if result.exercise_type in ('speaking', 'conversation'):
+                    self._schedule_reference_audio(result.id, result.audio_files)
             else:
                 logger.error(f"Failed to create new Exercise item: {exercise.id}")
 
@@ -323,18 +422,16 @@ class ExerciseService:
         Returns:
             Updated Exercise object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            existing = self.get_by_id(ex_id, session=session)
+            existing = self.get_by_id(ex_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Exercise item not found: {ex_id}")
                 return None
             
-            if not unit_service.get_by_id(data.unit_id, session=session):
+            if not unit_service.get_by_id(data.unit_id, session=session, load_profile="ids_only"):
                 logger.warning(f"Unit not found: {data.unit_id}, keeping existing unit_id: {existing.unit_id}")
                 data.unit_id = existing.unit_id  # Revert to existing unit_id
             
@@ -350,16 +447,35 @@ class ExerciseService:
             update_data.pop('id', None)  # Don't allow updating the ID
             update_data.pop('score', None)  # Don't allow direct score updates
             update_data.pop('last_seen', None)  # Don't allow direct last_seen updates
+            for key in ('calligraphy_ids', 'vocabulary_ids', 'grammar_ids'):
+                update_data[key] = update_data[key] or []  # Missing associations clear the links
             
+            previous_unit_id = existing.unit_id
+            previous_answer = existing.answer
+            previous_audio_files = list(existing.audio_files or [])
+
             # Update the existing object's attributes
             for key, value in update_data.items():
                 setattr(existing, key, value)
             
+            # Cached reference computations were made from the previous answer
+            if existing.answer != previous_answer:
+                reference_service.invalidate(ex_id, session=session)
+            
+            # Move the item score to its new unit if it changed
+            if existing.unit_id != previous_unit_id:
+                unit_service.apply_score_deltas({
+                    previous_unit_id: (-(existing.score or 0.0), -1),
+                    existing.unit_id: (existing.score or 0.0, 1),
+                }, session=session)
+
             # Save to database
             result = db_manager.modify(existing, session=session)
             
             if result:
                 logger.info(f"Updated Exercise item: {ex_id}")
+                if result.exercise_type in ('speaking', 'conversation') and list(result.audio_files or []) != previous_audio_files:
+                    self._schedule_reference_audio(ex_id, result.audio_files)
             else:
                 logger.error(f"Failed to update Exercise item: {ex_id}")
             
@@ -382,18 +498,19 @@ class ExerciseService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if Exercise item exists before deleting
-            existing = self.get_by_id(ex_id, session=session)
+            existing = self.get_by_id(ex_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Exercise item not found: {ex_id}")
                 return False
             
+            # Remove the item from its unit score, committed together with the delete
+            unit_service.apply_score_deltas({existing.unit_id: (-(existing.score or 0.0), -1)}, session=session)
+
             # Delete from database
             success = db_manager.delete(existing, session=session)
             
@@ -421,9 +538,11 @@ class ExerciseService:
         include_relations: bool = True
     ) -> Exercise | dict | None:
         """
-        Update Exercise item score based on average of all of its components scores.
+        Update Exercise item score and propagate the answer to its linked features.
         
-        This should be called whenever a component's score changes.
+        The exercise and its linked Vocabulary/Calligraphy/Grammar items are loaded
+        in one query per type and scored in memory. The score changes are applied to
+        the unit and language aggregates, and everything is written in a single commit.
         
         Args:
             ex_id: The ID of the Exercise item to update
@@ -432,71 +551,58 @@ class ExerciseService:
         Returns:
             Updated Exercise object if successful, None otherwise
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            exercise = self.get_by_id(ex_id, session=session)
+            exercise = session.get(Exercise, ex_id)
             
             if not exercise:
                 logger.warning(f"Exercise item not found: {ex_id}")
                 return None
             
-            previous_score = exercise.score
-            
-            exercise.score = update_score(
-                score=exercise.score,
-                last_seen=exercise.last_seen,
-                similarity=score
-            )
-            
-            # Update last_seen
-            exercise.last_seen = date.today()
-
-            # Save changes
-            result = db_manager.modify(exercise, session=session)
-
-            if result:
-                logger.info(f"Updated Exercise item {ex_id} score: {result.score}")
-
-            # Update scores of associated components
-            dependencies_lists = []
-            if exercise.vocabulary_ids:
-                for voc_id in exercise.vocabulary_ids:
-                    voc = vocabulary_service.get_by_id(voc_id=voc_id, session=session)
-                    if voc:
-                        dependencies_lists.append(voc)
-            if exercise.calligraphy_ids:
-                for calligraphy_id in exercise.calligraphy_ids:
-                    calligraphy = calligraphy_service.get_by_id(calligraphy_id=calligraphy_id, session=session)
-                    if calligraphy:
-                        dependencies_lists.append(calligraphy)
-            if exercise.grammar_ids:
-                for grammar_id in exercise.grammar_ids:
-                    grammar = grammar_service.get_by_id(grammar_id=grammar_id, session=session)
-                    if grammar:
-                        dependencies_lists.append(grammar)
-
-            for feature in dependencies_lists:
-                feature.score = update_score(
-                    score=feature.score,
-                    last_seen=feature.last_seen,
-                    similarity=score
+            # Gather the associated components, one indexed lookup per feature type
+            features = [
+                *session.scalars(select(Vocabulary).join(ExerciseVocabulary).where(ExerciseVocabulary.exercise_id == ex_id)),
+                *session.scalars(select(Calligraphy).join(ExerciseCalligraphy).where(ExerciseCalligraphy.exercise_id == ex_id)),
+                *session.scalars(select(Grammar).join(ExerciseGrammar).where(ExerciseGrammar.exercise_id == ex_id)),
+            ]
+
+            today = date.today()
+            unit_deltas: dict[str, tuple[float, int]] = {}
+            for item in (exercise, *features):
+                previous_score = item.score
+                item.score = update_score(
+                    score=item.score,
+                    last_seen=item.last_seen,
+                    similarity=score,
+                    difficulty=item.difficulty
+                )
+                item.difficulty = update_difficulty(
+                    new_score=item.score,
+                    last_seen=item.last_seen,
+                    previous_difficulty=item.difficulty
                 )
-                feature.last_seen = date.today()
+                item.last_seen = today
+                item.due_at = compute_due_date(item.score, item.difficulty, today)
 
-                db_manager.modify(feature, session=session)
+                if item.score != previous_score and item.unit_id:
+                    score_delta, _ = unit_deltas.get(item.unit_id, (0.0, 0))
+                    unit_deltas[item.unit_id] = (score_delta + item.score - (previous_score or 0.0), 0)
 
-            if exercise.score != previous_score:
-                unit_service.update_score(exercise.unit_id, session=session)
-                logger.info(f"Updated unit {exercise.unit_id} score due to Exercise {ex_id}")
+            # Update each affected unit (and its language) once
+            unit_service.apply_score_deltas(unit_deltas, session=session)
+
+            db_manager.commit(session)
+            logger.info(
+                f"Updated Exercise item {ex_id} score: {exercise.score} "
+                f"({len(features)} linked features, {len(unit_deltas)} units)"
+            )
             
             # Ensure all attributes are loaded before closing session
-            if owns_session and result:
-                session.refresh(result)
+            if owns_session:
+                session.refresh(exercise)
             
-            return self._serialize(result, as_dict, include_relations)
+            return self._serialize(exercise, as_dict, include_relations)
         except Exception as e:
             if owns_session:
                 session.rollback()
@@ -504,4 +610,4 @@ class ExerciseService:
             raise
         finally:
             if owns_session:
-                session.close()
\ No newline at end of file
+                session.close()
@@ -12,7 +12,7 @@ from ...models.features import Grammar
 from ..containers import UnitService, LanguageService
 from ..components import PassageService
 from ...core.database import db_manager
-from ...utils import update_score
+from ...utils import update_score, update_difficulty, compute_due_date
 
 unit_service = UnitService()
 language_service = LanguageService()
@@ -35,7 +35,8 @@ class GrammarService:
         unit_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Grammar] | list[dict]:
         """
         Get all Grammar items for a specific language or unit.
@@ -43,34 +44,29 @@ class GrammarService:
         Args:
             language_id (Optional[str] = None): The id of the language to get all the grammars from
             unit_id (Optional[str] = None): The id of the unit to get all the grammars from
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             List of Grammar objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                grammars = []
-                for unit in units:
-                    grammars.extend(
-                        db_manager.find_all(
-                            model_class=Grammar,
-                            filters={'unit_id': unit.id},
-                            session=session
-                        )
-                    )
+                grammars = db_manager.find_all_by_language(
+                    model_class=Grammar,
+                    language_id=language_id,
+                    session=session,
+                    load_relationships=load_profile
+                )
                 return self._serialize_list(grammars, as_dict, include_relations)
             elif unit_id:
                 grammars = db_manager.find_all(
                     model_class=Grammar,
                     filters={'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(grammars, as_dict, include_relations)
             else:
@@ -84,31 +80,93 @@ class GrammarService:
             if owns_session:
                 session.close()
 
+    def get_page(
+        self,
+        language_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        session: Optional[Session] = None,
+        include_relations: bool = True,
+        load_profile: str = "card"
+    ) -> dict:
+        """
+        Get one page of the Grammar items of a language or unit, serialized.
+
+        Args:
+            language_id: The id of the language to get the Grammar items from
+            unit_id: The id of the unit to get the Grammar items from
+            after: ID of the last item of the previous page, None for the first page
+            limit: Maximum number of items in the page, None for all the remaining ones
+            fields: Keys to keep in each item. If they are all Grammar columns, only those columns are queried.
+            load_profile: Relationships to eager-load when whole items are serialized, see LOAD_PROFILES
+
+        Returns:
+            Dictionary with the "items" of the page, the "total" number of items and the "next_after" cursor
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
+            if not (language_id or unit_id):
+                raise ValueError(f"Requires either language_id or unit_id but got neither: {language_id} and {unit_id}")
+
+            columns = fields if fields and set(fields) <= set(Grammar.__table__.columns.keys()) else None
+            grammars, total, next_after = db_manager.find_page(
+                model_class=Grammar,
+                filters={'unit_id': unit_id} if unit_id else None,
+                language_id=language_id,
+                after=after,
+                limit=limit,
+                columns=columns,
+                session=session,
+                load_relationships=load_profile
+            )
+
+            if columns:
+                items = [{key: value.isoformat() if isinstance(value, date) else value for key, value in row.items()} for row in grammars]
+            else:
+                items = self._serialize_list(grammars, True, include_relations)
+                if fields:
+                    items = [{key: value for key, value in item.items() if key == 'id' or key in fields} for item in items]
+
+            return {"items": items, "total": total, "next_after": next_after}
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to get page of grammars: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def get_by_id(
         self,
         grammar_id: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> Grammar | dict | None:
         """
         Get a Grammar item by its ID.
 
         Args:
             grammar_id: The ID of the Grammar item to retrieve.
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             Grammar object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             grammar = db_manager.find_by_attr(
                 model_class=Grammar,
                 attr_values={'id': grammar_id},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
             return self._serialize(grammar, as_dict, include_relations)
         except Exception as e:
@@ -127,7 +185,8 @@ class GrammarService:
         unit_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Grammar] | list[dict]:
         """
         Get all Grammar items of a specific level among a language.
@@ -136,35 +195,31 @@ class GrammarService:
             language_id: The id of the language to filter Grammar items
             unit_id: The id of the unit to filter Grammar items
             level: Grammar level (e.g., 'A1', 'B2')
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
         
         Returns:
             List of matching Grammar objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
 
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                grammars = []
-                for unit in units:
-                    grammars.extend(
-                        db_manager.find_all(
-                            model_class=Grammar,
-                            filters={'level': level, 'unit_id': unit.id},
-                            session=session
-                        )
-                    )
+                grammars = db_manager.find_all_by_language(
+                    model_class=Grammar,
+                    language_id=language_id,
+                    filters={'level': level},
+                    session=session,
+                    load_relationships=load_profile
+                )
                 return self._serialize_list(grammars, as_dict, include_relations)
             elif unit_id:
                 grammars = db_manager.find_all(
                     model_class=Grammar,
                     filters={'level': level, 'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(grammars, as_dict, include_relations)
             else:
@@ -194,12 +249,10 @@ class GrammarService:
         Returns:
             Created Grammar object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            unit = unit_service.get_by_id(data.unit_id, session=session)
+            unit = unit_service.get_by_id(data.unit_id, session=session, load_profile="ids_only")
 
             if not unit:
                 logger.warning(f"Cannot create Grammar item, unit not found: {data.unit_id}")
@@ -224,6 +277,9 @@ class GrammarService:
                 **grammar_data
             )
             
+            # Count the new item in its unit score, committed together with the insert
+            unit_service.apply_score_deltas({grammar.unit_id: (grammar.score or 0.0, 1)}, session=session)
+
             # Add the passages to the grammar
             grammar.learnable_sentences = learnable_sentences
             
@@ -265,12 +321,10 @@ class GrammarService:
         Returns:
             Updated Grammar object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            existing = self.get_by_id(grammar_id, session=session)
+            existing = self.get_by_id(grammar_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Grammar item not found: {grammar_id}")
@@ -300,10 +354,19 @@ class GrammarService:
             update_data.pop('score', None)  # Don't allow direct score updates
             update_data.pop('last_seen', None)  # Don't allow direct last_seen updates
             
+            previous_unit_id = existing.unit_id
+
             # Update the existing object's attributes
             for key, value in update_data.items():
                 setattr(existing, key, value)
             
+            # Move the item score to its new unit if it changed
+            if existing.unit_id != previous_unit_id:
+                unit_service.apply_score_deltas({
+                    previous_unit_id: (-(existing.score or 0.0), -1),
+                    existing.unit_id: (existing.score or 0.0, 1),
+                }, session=session)
+
             # Save to database
             result = db_manager.modify(existing, session=session)
             
@@ -331,18 +394,19 @@ class GrammarService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if grammar item exists before deleting
-            existing = self.get_by_id(grammar_id, session=session)
+            existing = self.get_by_id(grammar_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"Grammar item not found: {grammar_id}")
                 return False
             
+            # Remove the item from its unit score, committed together with the delete
+            unit_service.apply_score_deltas({existing.unit_id: (-(existing.score or 0.0), -1)}, session=session)
+
             # Delete from database
             success = db_manager.delete(existing, session=session)
             
@@ -381,12 +445,10 @@ class GrammarService:
         Returns:
             Updated Grammar object if successful, None otherwise
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            grammar = self.get_by_id(grammar_id, session=session)
+            grammar = self.get_by_id(grammar_id, session=session, load_profile="ids_only")
         
             if not grammar:
                 logger.warning(f"Grammar item not found: {grammar_id}")
@@ -397,21 +459,29 @@ class GrammarService:
             grammar.score = update_score(
                 score=grammar.score,
                 last_seen=grammar.last_seen,
-                similarity=score
+                similarity=score,
+                difficulty=grammar.difficulty
             )
-            
-            # Update last_seen
+            grammar.difficulty = update_difficulty(
+                new_score=grammar.score,
+                last_seen=grammar.last_seen,
+                previous_difficulty=grammar.difficulty
+            )
+
+            # Update last_seen and schedule the next review
             grammar.last_seen = date.today()
+            grammar.due_at = compute_due_date(grammar.score, grammar.difficulty)
+            # Apply the score change to the unit aggregates, committed together with the item
+            if grammar.score != previous_score and grammar.unit_id:
+                unit_service.apply_score_deltas({grammar.unit_id: (grammar.score - (previous_score or 0.0), 0)}, session=session)
+                logger.info(f"Updated unit {grammar.unit_id} score due to Grammar {grammar_id}")
+
             # Save changes
             result = db_manager.modify(grammar, session=session)
             
             if result:
                 logger.info(f"Updated Grammar item {grammar_id} score: {result.score}")
 
-            if grammar.score != previous_score:
-                if grammar.unit_id:
-                    unit_service.update_score(grammar.unit_id, session=session)
-                    logger.info(f"Updated unit {grammar.unit_id} score due to Grammar {grammar_id}")
             
             
             return self._serialize(result, as_dict, include_relations)
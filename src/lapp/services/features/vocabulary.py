@@ -11,7 +11,7 @@ from ...models.features import Vocabulary
 from ..containers import UnitService, LanguageService
 from ..components import WordService, PassageService
 from ...core.database import db_manager
-from ...utils import update_score
+from ...utils import update_score, update_difficulty, compute_due_date
 
 unit_service = UnitService()
 language_service = LanguageService()
@@ -36,7 +36,8 @@ class VocabularyService:
         unit_id: Optional[str] = None,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Vocabulary] | list[dict]:
         """
         Get all vocabulary for a specific language or unit.
@@ -44,34 +45,29 @@ class VocabularyService:
         Args:
             language_id (Optional[str]): The id of the language to get all the vocabulary from
             unit_id (Optional[str]): The id of the unit to get all the vocabulary from
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             List of VocabularyFeature objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                vocabulary = []
-                for unit in units:
-                    vocabulary.extend(
-                        db_manager.find_all(
-                            model_class=Vocabulary,
-                            filters={'unit_id': unit.id},
-                            session=session
-                        )
-                    )
+                vocabulary = db_manager.find_all_by_language(
+                    model_class=Vocabulary,
+                    language_id=language_id,
+                    session=session,
+                    load_relationships=load_profile
+                )
                 return self._serialize_list(vocabulary, as_dict, include_relations)
             elif unit_id:
                 vocabulary = db_manager.find_all(
                     model_class=Vocabulary,
                     filters={'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(vocabulary, as_dict, include_relations)
             else:
@@ -85,31 +81,93 @@ class VocabularyService:
             if owns_session:
                 session.close()
 
+    def get_page(
+        self,
+        language_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        session: Optional[Session] = None,
+        include_relations: bool = True,
+        load_profile: str = "card"
+    ) -> dict:
+        """
+        Get one page of the vocabulary items of a language or unit, serialized.
+
+        Args:
+            language_id: The id of the language to get the vocabulary items from
+            unit_id: The id of the unit to get the vocabulary items from
+            after: ID of the last item of the previous page, None for the first page
+            limit: Maximum number of items in the page, None for all the remaining ones
+            fields: Keys to keep in each item. If they are all Vocabulary columns, only those columns are queried.
+            load_profile: Relationships to eager-load when whole items are serialized, see LOAD_PROFILES
+
+        Returns:
+            Dictionary with the "items" of the page, the "total" number of items and the "next_after" cursor
+        """
+        session, owns_session = db_manager.join_session(session)
+        
+        try:
+            assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
+            if not (language_id or unit_id):
+                raise ValueError(f"Requires either language_id or unit_id but got neither: {language_id} and {unit_id}")
+
+            columns = fields if fields and set(fields) <= set(Vocabulary.__table__.columns.keys()) else None
+            vocabularies, total, next_after = db_manager.find_page(
+                model_class=Vocabulary,
+                filters={'unit_id': unit_id} if unit_id else None,
+                language_id=language_id,
+                after=after,
+                limit=limit,
+                columns=columns,
+                session=session,
+                load_relationships=load_profile
+            )
+
+            if columns:
+                items = [{key: value.isoformat() if isinstance(value, date) else value for key, value in row.items()} for row in vocabularies]
+            else:
+                items = self._serialize_list(vocabularies, True, include_relations)
+                if fields:
+                    items = [{key: value for key, value in item.items() if key == 'id' or key in fields} for item in items]
+
+            return {"items": items, "total": total, "next_after": next_after}
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to get page of vocabularies: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
     def get_by_id(
         self,
         voc_id: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> Vocabulary | dict | None:
         """
         Get a vocabulary item by its ID.
 
         Args:
             voc_id: The ID of the vocabulary item to retrieve.
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
 
         Returns:
             VocabularyFeature object if found, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             vocabulary = db_manager.find_by_attr(
                 model_class=Vocabulary,
                 attr_values={'id': voc_id},
-                session=session
+                session=session,
+                load_relationships=load_profile
             )
             return self._serialize(vocabulary, as_dict, include_relations)
         except Exception as e:
@@ -128,7 +186,8 @@ class VocabularyService:
         level: str,
         session: Optional[Session] = None,
         as_dict: bool = False,
-        include_relations: bool = True
+        include_relations: bool = True,
+        load_profile: str = "full"
     ) -> list[Vocabulary] | list[dict]:
         """
         Get all vocabulary items of a specific level among a language.
@@ -137,35 +196,31 @@ class VocabularyService:
             language_id: The id of the language to filter vocabulary items
             unit_id: The id of the unit to filter vocabulary items
             level: Vocabulary level (e.g., 'A1', 'B2')
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
         
         Returns:
             List of matching VocabularyFeature objects
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
 
             if language_id:
-                units = unit_service.get_all(language_id=language_id, session=session)
-
-                vocabulary = []
-                for unit in units:
-                    vocabulary.extend(
-                        db_manager.find_all(
-                            model_class=Vocabulary,
-                            filters={'unit_id': unit.id, 'level': level},
-                            session=session
-                        )
-                    )
+                vocabulary = db_manager.find_all_by_language(
+                    model_class=Vocabulary,
+                    language_id=language_id,
+                    filters={'level': level},
+                    session=session,
+                    load_relationships=load_profile
+                )
                 return self._serialize_list(vocabulary, as_dict, include_relations)
             elif unit_id:
                 vocabulary = db_manager.find_all(
                     model_class=Vocabulary,
                     filters={'level': level, 'unit_id': unit_id},
-                    session=session
+                    session=session,
+                    load_relationships=load_profile
                 )
                 return self._serialize_list(vocabulary, as_dict, include_relations)
             else:
@@ -195,12 +250,10 @@ class VocabularyService:
         Returns:
             Created VocabularyFeature object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            unit = unit_service.get_by_id(data.unit_id, session=session)
+            unit = unit_service.get_by_id(data.unit_id, session=session, load_profile="ids_only")
 
             if not unit:
                 logger.warning(f"Cannot create vocabulary item, unit not found: {data.unit_id}")
@@ -230,6 +283,9 @@ class VocabularyService:
                 audio_files=data.audio_files
             )
             
+            # Count the new item in its unit score, committed together with the insert
+            unit_service.apply_score_deltas({vocabulary.unit_id: (vocabulary.score or 0.0, 1)}, session=session)
+
             # Add the passages to the vocabulary
             vocabulary.example_sentences = example_sentences
             
@@ -271,12 +327,10 @@ class VocabularyService:
         Returns:
             Updated VocabularyFeature object if successful, else None
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            existing = self.get_by_id(voc_id, session=session)
+            existing = self.get_by_id(voc_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"VocabularyFeature item not found: {voc_id}")
@@ -348,11 +402,20 @@ class VocabularyService:
             update_data.pop('score', None)  # Don't allow direct score updates
             update_data.pop('last_seen', None)  # Don't allow direct last_seen updates
             
+            previous_unit_id = existing.unit_id
+
             # Update remaining fields
             for key, value in update_data.items():
                 if key != 'word_id':  # Don't overwrite word_id if we already set it
                     setattr(existing, key, value)
             
+            # Move the item score to its new unit if it changed
+            if existing.unit_id != previous_unit_id:
+                unit_service.apply_score_deltas({
+                    previous_unit_id: (-(existing.score or 0.0), -1),
+                    existing.unit_id: (existing.score or 0.0, 1),
+                }, session=session)
+
             # Save to database
             result = db_manager.modify(existing, session=session)
             
@@ -381,18 +444,19 @@ class VocabularyService:
         Returns:
             True if deletion was successful, else False
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
             # Check if vocabulary item exists before deleting
-            existing = self.get_by_id(voc_id, session=session)
+            existing = self.get_by_id(voc_id, session=session, load_profile="ids_only")
             
             if not existing:
                 logger.warning(f"VocabularyFeature item not found: {voc_id}")
                 return False
             
+            # Remove the item from its unit score, committed together with the delete
+            unit_service.apply_score_deltas({existing.unit_id: (-(existing.score or 0.0), -1)}, session=session)
+
             # Delete from database
             success = db_manager.delete(existing, session=session)
             
@@ -431,12 +495,10 @@ class VocabularyService:
         Returns:
             Updated VocabularyFeature object if successful, None otherwise
         """
-        owns_session = session is None
-        if owns_session:
-            session = db_manager.get_session()
+        session, owns_session = db_manager.join_session(session)
         
         try:
-            vocabulary = self.get_by_id(voc_id, session=session)
+            vocabulary = self.get_by_id(voc_id, session=session, load_profile="ids_only")
             
             if not vocabulary:
                 logger.warning(f"VocabularyFeature item not found: {voc_id}")
@@ -447,22 +509,30 @@ class VocabularyService:
             vocabulary.score = update_score(
                 score=vocabulary.score,
                 last_seen=vocabulary.last_seen,
-                similarity=score
+                similarity=score,
+                difficulty=vocabulary.difficulty
+            )
+            vocabulary.difficulty = update_difficulty(
+                new_score=vocabulary.score,
+                last_seen=vocabulary.last_seen,
+                previous_difficulty=vocabulary.difficulty
             )
 
-            # Update last_seen
+            # Update last_seen and schedule the next review
             vocabulary.last_seen = date.today()
+            vocabulary.due_at = compute_due_date(vocabulary.score, vocabulary.difficulty)
             
+            # Apply the score change to the unit aggregates, committed together with the item
+            if vocabulary.score != previous_score and vocabulary.unit_id:
+                unit_service.apply_score_deltas({vocabulary.unit_id: (vocabulary.score - (previous_score or 0.0), 0)}, session=session)
+                logger.info(f"Updated unit {vocabulary.unit_id} score due to VocabularyFeature {voc_id}")
+
             # Save changes
             result = db_manager.modify(vocabulary, session=session)
 
             if result:
                 logger.info(f"Updated VocabularyFeature item {voc_id} score: {result.score}")
 
-            if vocabulary.score != previous_score:
-                if vocabulary.unit_id:
-                    unit_service.update_score(vocabulary.unit_id, session=session)
-                    logger.info(f"Updated unit {vocabulary.unit_id} score due to VocabularyFeature {voc_id}")
                     
             return self._serialize(result, as_dict, include_relations)
         except Exception as e:
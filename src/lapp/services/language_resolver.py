@@ -0,0 +1,97 @@
+import logging
+import threading
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..core.database import db_manager
+from ..models import Language, Unit, Exercise
+from ..utils import detect_text_language, language_from_course
+from ..utils.detect_language import Language as LanguageDescriptor
+
+logger = logging.getLogger(__name__)
+
+
+class LanguageResolver:
+    """
+    Resolve the language of a text from the course it belongs to.
+
+    The unit → language chain gives the language without guessing: its iso1 code,
+    or else its name, maps to the Language descriptor used by the evaluation and
+    TTS. The descriptor of each unit is cached until a language or unit changes.
+    langdetect is only the fallback, for texts outside any course or courses in
+    an unsupported language.
+    """
+
+    def __init__(self):
+        self._by_unit: dict[str, Optional[LanguageDescriptor]] = {}
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Forget the cached descriptors, after a language or unit was modified."""
+        with self._lock:
+            self._by_unit.clear()
+
+    def for_unit(self, unit_id: str, session: Optional[Session] = None) -> Optional[LanguageDescriptor]:
+        """Get the descriptor of a unit's language, None if the unit or its language is unknown."""
+        with self._lock:
+            if unit_id in self._by_unit:
+                return self._by_unit[unit_id]
+
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            row = session.execute(
+                select(Language.iso1, Language.name)
+                .join(Unit, Unit.language_id == Language.id)
+                .where(Unit.id == unit_id)
+            ).first()
+            descriptor = language_from_course(row.iso1, row.name) if row else None
+            if row and descriptor is None:
+                logger.warning(f"Language of unit {unit_id} is not supported: iso1={row.iso1!r}, name={row.name!r}")
+        finally:
+            if owns_session:
+                session.close()
+
+        # A missing unit is not cached, it may be created later
+        if row:
+            with self._lock:
+                self._by_unit[unit_id] = descriptor
+        return descriptor
+
+    def for_exercise(self, ex_id: str, session: Optional[Session] = None) -> Optional[LanguageDescriptor]:
+        """Get the descriptor of an exercise's course language, None if unknown."""
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            unit_id = session.scalar(select(Exercise.unit_id).where(Exercise.id == ex_id))
+            return self.for_unit(unit_id, session=session) if unit_id else None
+        finally:
+            if owns_session:
+                session.close()
+
+    def resolve(
+        self,
+        text: str,
+        unit_id: Optional[str] = None,
+        ex_id: Optional[str] = None,
+        session: Optional[Session] = None
+    ) -> LanguageDescriptor:
+        """
+        Get the language of a text, from its course when known, else by detection.
+
+        Args:
+            text: The text, only used by the detection fallback
+            unit_id: The unit the text belongs to, if any
+            ex_id: The exercise the text belongs to, if any
+        """
+        descriptor = None
+        if ex_id:
+            descriptor = self.for_exercise(ex_id, session=session)
+        elif unit_id:
+            descriptor = self.for_unit(unit_id, session=session)
+        return descriptor or detect_text_language(text)
+
+
+language_resolver = LanguageResolver()
@@ -4,6 +4,7 @@ from flask import current_app
 from werkzeug.datastructures import FileStorage
 
 from ..utils import MediaFileHandler
+from .reference import ReferenceService
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,7 @@ class MediaService:
             media_root = current_app.config['MEDIA_ROOT']
         self.media_root = Path(media_root)
         self.file_handler = MediaFileHandler(media_root)
+        self.reference_service = ReferenceService()
     
     def _validate_path(self, filename: str) -> Path:
         """
@@ -162,6 +164,9 @@ class MediaService:
         # Delete using handler's delete_file method
         self.file_handler.delete_file(file_path)
         
+        # Cached evaluation features of the file are now useless
+        self.reference_service.evict_audio([full_path])
+        
         logger.info(f"Deleted media file: {file_path}")
         
         return {
@@ -0,0 +1,212 @@
+import hashlib
+import logging
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+from sqlalchemy import delete
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..core.database import db_manager
+from ..models.features import ExerciseReference, AudioReference
+from ..utils import audio_frontend
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceService:
+    """
+    Cache of the model outputs computed from exercises reference answers and recordings.
+
+    Each cached vector is stored as float32 bytes next to a hash of what it was
+    computed from (model name and reference), so a changed answer or model is
+    detected on read and recomputed instead of served stale. Recordings are keyed
+    by the hash of their content, so a file shared by several exercises is only
+    processed once.
+    """
+
+    def _source_hash(self, source: tuple[str, ...]) -> str:
+        return hashlib.sha256("\0".join(source).encode("utf-8")).hexdigest()
+
+    def get_vector(
+        self,
+        ex_id: str,
+        kind: str,
+        source: tuple[str, ...],
+        compute: Callable[[], np.ndarray],
+        session: Optional[Session] = None
+    ) -> np.ndarray:
+        """
+        Get a cached vector of an exercise, computing and storing it on a miss.
+
+        Args:
+            ex_id: The ID of the exercise the vector belongs to
+            kind: What the vector is, e.g. "text_embedding"
+            source: Everything the vector depends on, e.g. (model name, reference answer)
+            compute: Function computing the vector on a cache miss
+
+        Returns:
+            The vector, as a float32 array
+        """
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            source_hash = self._source_hash(source)
+            cached = session.get(ExerciseReference, (ex_id, kind))
+            if cached is not None and cached.source_hash == source_hash:
+                return np.frombuffer(cached.vector, dtype=np.float32)
+
+            vector = np.asarray(compute(), dtype=np.float32).ravel()
+
+            try:
+                if cached is None:
+                    session.add(ExerciseReference(exercise_id=ex_id, kind=kind, source_hash=source_hash, vector=vector.tobytes()))
+                else:
+                    cached.source_hash = source_hash
+                    cached.vector = vector.tobytes()
+                db_manager.commit(session)
+                logger.info(f"Cached {kind} of Exercise {ex_id} ({vector.size} floats)")
+            except SQLAlchemyError as e:
+                # The caller's transaction is broken and must see the error
+                if not owns_session:
+                    raise
+                # Otherwise a failed write only costs a recomputation next time
+                session.rollback()
+                logger.warning(f"Failed to cache {kind} of Exercise {ex_id}: {e}")
+
+            return vector
+        finally:
+            if owns_session:
+                session.close()
+
+    def get_text_embedding(
+        self,
+        ex_id: str,
+        reference_text: str,
+        model_name: str,
+        encode: Callable[[str], np.ndarray],
+        session: Optional[Session] = None
+    ) -> np.ndarray:
+        """
+        Get the embedding of an exercise's reference answer, encoding it only when not cached.
+
+        Args:
+            ex_id: The ID of the exercise
+            reference_text: The reference answer to embed
+            model_name: Name of the embedding model, part of the cache key
+            encode: The embedding model's encode function
+        """
+        return self.get_vector(
+            ex_id,
+            "text_embedding",
+            (model_name, reference_text),
+            lambda: encode(reference_text),
+            session=session
+        )
+
+    def invalidate(self, ex_id: str, session: Optional[Session] = None) -> None:
+        """
+        Drop every cached vector of an exercise, e.g. after its reference answer changed.
+
+        Given a session, the delete joins its transaction and the caller commits.
+        """
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            session.execute(delete(ExerciseReference).where(ExerciseReference.exercise_id == ex_id))
+            if owns_session:
+                session.commit()
+            logger.info(f"Invalidated cached references of Exercise {ex_id}")
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to invalidate cached references of Exercise {ex_id}: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
+    def get_audio_features(
+        self,
+        audio_path: Path,
+        model_key: str,
+        compute: Callable[[Path], tuple[int, np.ndarray, str]],
+        session: Optional[Session] = None
+    ) -> tuple[int, np.ndarray, str]:
+        """
+        Get the features of a reference recording, computing and storing them on a miss.
+
+        Args:
+            audio_path: Path of the audio file
+            model_key: Names of the models computing the features, part of the cache key
+            compute: Function from the audio path to (waveform length, embedding, transcription)
+
+        Returns:
+            The 16kHz waveform length, the float32 mean-pooled embedding and the transcription
+        """
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            with open(audio_path, "rb") as audio_file:
+                content_hash = hashlib.file_digest(audio_file, "sha256").hexdigest()
+
+            cached = session.get(AudioReference, content_hash)
+            if cached is not None and cached.model_key == model_key:
+                return cached.sample_count, np.frombuffer(cached.embedding, dtype=np.float32), cached.transcription
+
+            sample_count, embedding, transcription = compute(audio_path)
+            embedding = np.asarray(embedding, dtype=np.float32).ravel()
+
+            try:
+                if cached is None:
+                    cached = AudioReference(content_hash=content_hash)
+                    session.add(cached)
+                cached.model_key = model_key
+                cached.file_path = str(Path(audio_path).resolve())
+                cached.sample_count = int(sample_count)
+                cached.embedding = embedding.tobytes()
+                cached.transcription = transcription
+                db_manager.commit(session)
+                logger.info(f"Cached features of reference audio {audio_path}")
+            except SQLAlchemyError as e:
+                # The caller's transaction is broken and must see the error
+                if not owns_session:
+                    raise
+                # Otherwise a failed write only costs a recomputation next time
+                session.rollback()
+                logger.warning(f"Failed to cache features of reference audio {audio_path}: {e}")
+
+            return int(sample_count), embedding, transcription
+        finally:
+            if owns_session:
+                session.close()
+
+    def evict_audio(self, audio_paths: list[Path], session: Optional[Session] = None) -> None:
+        """
+        Drop the cached features and decoded waveforms of deleted audio files.
+
+        Given a session, the delete joins its transaction and the caller commits.
+        """
+        paths = [str(Path(audio_path).resolve()) for audio_path in audio_paths]
+        if not paths:
+            return
+
+        audio_frontend.evict(audio_paths)
+
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            result = session.execute(delete(AudioReference).where(AudioReference.file_path.in_(paths)))
+            if owns_session:
+                session.commit()
+            if result.rowcount:
+                logger.info(f"Evicted {result.rowcount} cached reference audio features")
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to evict cached reference audio features: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
@@ -0,0 +1,376 @@
+import logging
+from datetime import date, datetime
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from ..core.database import db_manager, ID_PREFIXES
+from ..models.containers import Unit
+from ..models.features import (
+    Vocabulary,
+    Grammar,
+    Calligraphy,
+    Exercise,
+    ExerciseVocabulary,
+    ExerciseCalligraphy,
+    ExerciseGrammar,
+)
+from ..schemas import ReviewAnswer
+from ..utils.scoring import as_dates, update_scores, update_difficulties, compute_due_dates
+from .containers import UnitService
+
+logger = logging.getLogger(__name__)
+
+unit_service = UnitService()
+
+# Feature types that can be reviewed, by the name used in the API
+REVIEW_MODELS = {
+    "vocabulary": Vocabulary,
+    "grammar": Grammar,
+    "calligraphy": Calligraphy,
+    "exercise": Exercise,
+}
+
+# Features an exercise answer is propagated to, in ExerciseService.update_score order
+EXERCISE_LINKS = [
+    ("vocabulary", ExerciseVocabulary, ExerciseVocabulary.vocabulary_id),
+    ("calligraphy", ExerciseCalligraphy, ExerciseCalligraphy.calligraphy_id),
+    ("grammar", ExerciseGrammar, ExerciseGrammar.grammar_id),
+]
+
+
+class ReviewService:
+    def _check_scope(self, language_id: Optional[str], unit_id: Optional[str], types: list[str]) -> None:
+        assert not (language_id and unit_id), f"language_id and unit_id can't be both specified, but got: {language_id} and {unit_id}"
+        if not (language_id or unit_id):
+            raise ValueError(f"Requires either language_id or unit_id but got neither: {language_id} and {unit_id}")
+        unknown = set(types) - REVIEW_MODELS.keys()
+        if unknown:
+            raise ValueError(f"Unknown review types: {sorted(unknown)}")
+
+    def _priority(self, model_class):
+        """
+        SQL expression ranking the items of a feature table for review, highest first.
+
+        The SQL counterpart of utils.helpers.compute_recency_weight, scaled by how much of
+        the item is left to learn: (100 - score) / 100 * log2(days_since_seen + 2). Features
+        have no creation date, so the maturity dampening of the helper is left out (it is 1
+        for an item created today).
+        """
+        days_since_seen = func.coalesce(
+            func.julianday(date.today().isoformat()) - func.julianday(model_class.last_seen),
+            0
+        )
+        staleness = func.log2(func.max(days_since_seen, 0) + 2)
+        return (100 - func.coalesce(model_class.score, 0)) / 100.0 * staleness
+
+    def build_session(
+        self,
+        language_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        types: Optional[list[str]] = None,
+        limit: int = 20,
+        session: Optional[Session] = None,
+        include_relations: bool = True,
+        load_profile: str = "card"
+    ) -> list[dict]:
+        """
+        Build a review session: the `limit` items of a language or unit most due for review.
+
+        Each feature table is ranked and limited in SQL, so the work and the payload stay
+        bounded by `limit` however large the deck grows.
+
+        Args:
+            language_id: The id of the language to review
+            unit_id: The id of the unit to review
+            types: Feature types to include, keys of REVIEW_MODELS (defaults to the flashcard types)
+            limit: Maximum number of items in the session
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
+
+        Returns:
+            List of serialized items, most due first, each with its "type" and "priority"
+        """
+        types = types or ["vocabulary", "grammar", "calligraphy"]
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            self._check_scope(language_id, unit_id, types)
+
+            candidates = []
+            for type_name in dict.fromkeys(types):
+                model_class = REVIEW_MODELS[type_name]
+                ranked = db_manager.find_ranked(
+                    model_class=model_class,
+                    rank=self._priority(model_class),
+                    limit=limit,
+                    filters={'unit_id': unit_id} if unit_id else None,
+                    language_id=language_id,
+                    session=session,
+                    load_relationships=load_profile
+                )
+                candidates.extend((priority, type_name, item) for item, priority in ranked)
+
+            # Each type is already limited, so this only merges at most len(types) * limit items
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+            return [
+                {**item.to_dict(include_relations=include_relations), "type": type_name, "priority": round(priority, 4)}
+                for priority, type_name, item in candidates[:limit]
+            ]
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to build review session: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
+    def get_due(
+        self,
+        language_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        types: Optional[list[str]] = None,
+        limit: int = 20,
+        as_of: Optional[date] = None,
+        session: Optional[Session] = None,
+        include_relations: bool = True,
+        load_profile: str = "card"
+    ) -> list[dict]:
+        """
+        Get the `limit` items of a language or unit whose due_at has passed, most overdue first.
+
+        The queue is read in a single query: each feature table contributes its first
+        `limit` due items through the (unit_id, due_at) index, then the union is merged and
+        cut to `limit`. Only the selected items are loaded afterwards.
+
+        Args:
+            language_id: The id of the language to review
+            unit_id: The id of the unit to review
+            types: Feature types to include, keys of REVIEW_MODELS (defaults to the flashcard types)
+            limit: Maximum number of items returned
+            as_of: Date the items must be due by, today if None
+            load_profile: Relationships to eager-load, see LOAD_PROFILES
+
+        Returns:
+            List of serialized items, most overdue first, each with its "type"
+        """
+        types = types or ["vocabulary", "grammar", "calligraphy"]
+        as_of = as_of or date.today()
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            self._check_scope(language_id, unit_id, types)
+
+            queues = []
+            for type_name in dict.fromkeys(types):
+                model_class = REVIEW_MODELS[type_name]
+                queue = select(
+                    literal(type_name).label("type"),
+                    model_class.id.label("id"),
+                    model_class.due_at.label("due_at")
+                ).where(model_class.due_at <= as_of)
+                if unit_id:
+                    queue = queue.where(model_class.unit_id == unit_id)
+                else:
+                    queue = queue.join(Unit, model_class.unit_id == Unit.id).where(Unit.language_id == language_id)
+                # SQLite only accepts LIMIT on a compound member when it is wrapped in a subquery
+                queue = queue.order_by(model_class.due_at, func.length(model_class.id), model_class.id).limit(limit).subquery()
+                queues.append(select(queue))
+
+            merged = union_all(*queues).subquery()
+            due = session.execute(
+                select(merged.c.type, merged.c.id)
+                .order_by(merged.c.due_at, merged.c.type, func.length(merged.c.id), merged.c.id)
+                .limit(limit)
+            ).all()
+
+            ids_by_type: dict[str, list[str]] = {}
+            for type_name, item_id in due:
+                ids_by_type.setdefault(type_name, []).append(item_id)
+            items = {
+                (type_name, item.id): item
+                for type_name, ids in ids_by_type.items()
+                for item in db_manager.find_by_ids(REVIEW_MODELS[type_name], ids, session=session, load_relationships=load_profile)
+            }
+
+            return [
+                {**items[(type_name, item_id)].to_dict(include_relations=include_relations), "type": type_name}
+                for type_name, item_id in due
+                if (type_name, item_id) in items
+            ]
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to get due items: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+
+    def _resolve_type(self, item_id: str) -> Optional[str]:
+        """Review type of a feature ID, from its prefix."""
+        for type_name, model_class in REVIEW_MODELS.items():
+            if item_id.startswith(ID_PREFIXES[model_class.__name__]):
+                return type_name
+        return None
+
+    def _linked_features(self, exercise_ids: list[str], session: Session) -> dict[str, list[tuple[str, str]]]:
+        """Map each exercise ID to the (type, ID) of its linked features, one query per link table."""
+        links: dict[str, list[tuple[str, str]]] = {}
+        if not exercise_ids:
+            return links
+
+        for type_name, link_model, feature_column in EXERCISE_LINKS:
+            rows = session.execute(
+                select(link_model.exercise_id, feature_column).where(link_model.exercise_id.in_(set(exercise_ids)))
+            )
+            for exercise_id, feature_id in rows:
+                links.setdefault(exercise_id, []).append((type_name, feature_id))
+        return links
+
+    def _apply_round(self, reviews: list[tuple[str, str, float, date]], items: dict) -> None:
+        """Score a set of answers to distinct items at once with the vectorized scoring functions."""
+        batch = [items[item_id] for _, item_id, _, _ in reviews]
+
+        last_seen = as_dates([item.last_seen or answered_on for item, (_, _, _, answered_on) in zip(batch, reviews)])
+        # An answer sent late never moves last_seen backwards
+        answered_on = np.maximum(as_dates([answered_on for _, _, _, answered_on in reviews]), last_seen)
+        previous_difficulties = [0.5 if item.difficulty is None else item.difficulty for item in batch]
+
+        scores = update_scores(
+            scores=[item.score or 0.0 for item in batch],
+            last_seen=last_seen,
+            similarities=[similarity for _, _, similarity, _ in reviews],
+            difficulties=previous_difficulties,
+            today=answered_on
+        )
+        difficulties = update_difficulties(
+            new_scores=scores,
+            last_seen=last_seen,
+            previous_difficulties=previous_difficulties,
+            today=answered_on
+        )
+        due_dates = compute_due_dates(scores, difficulties, answered_on)
+
+        for item, score, difficulty, seen_on, due_at in zip(
+            batch, scores.tolist(), difficulties.tolist(), answered_on.astype(object), due_dates.astype(object)
+        ):
+            item.score = score
+            item.difficulty = difficulty
+            item.last_seen = seen_on
+            item.due_at = due_at
+
+    def _answered_at(self, answer: ReviewAnswer, now: datetime) -> datetime:
+        """When an answer was given, now if unknown. ReviewAnswer already normalizes it to naive local time like now."""
+        return answer.answered_at or now
+
+    def apply_reviews(self, answers: list[ReviewAnswer], session: Optional[Session] = None) -> dict:
+        """
+        Apply a batch of review answers in a single transaction.
+
+        Gives the same result as calling each feature's update_score once per answer, in
+        answer order: an exercise answer also scores the exercise's linked features. Items
+        are loaded once per type and scored with the vectorized functions of utils.scoring,
+        one round per repeated answer to an item. Each affected unit and language aggregate
+        is then updated once.
+
+        Args:
+            answers: The answers, in any order. Those without answered_at count as answered now.
+
+        Returns:
+            Dictionary with the updated "items" (id, type, score, difficulty, last_seen, due_at),
+            the IDs of the affected "units", and the "missing" item IDs that were skipped
+
+        Raises:
+            ValueError: If an item ID is not a feature ID
+        """
+        session, owns_session = db_manager.join_session(session)
+
+        try:
+            unknown = [answer.item_id for answer in answers if self._resolve_type(answer.item_id) is None]
+            if unknown:
+                raise ValueError(f"Not reviewable item IDs: {unknown}")
+
+            now = datetime.now()
+            ordered = sorted(answers, key=lambda answer: self._answered_at(answer, now))
+            links = self._linked_features(
+                [answer.item_id for answer in ordered if self._resolve_type(answer.item_id) == "exercise"],
+                session
+            )
+
+            # (type, item ID, similarity, answer date), in answer order
+            reviews: list[tuple[str, str, float, date]] = []
+            for answer in ordered:
+                answered_on = self._answered_at(answer, now).date()
+                reviews.append((self._resolve_type(answer.item_id), answer.item_id, answer.similarity, answered_on))
+                reviews.extend(
+                    (type_name, feature_id, answer.similarity, answered_on)
+                    for type_name, feature_id in links.get(answer.item_id, [])
+                )
+
+            # Load every reviewed item once, one query per type
+            items = {}
+            for type_name, model_class in REVIEW_MODELS.items():
+                ids = list(dict.fromkeys(item_id for review_type, item_id, _, _ in reviews if review_type == type_name))
+                items.update(
+                    (item.id, item)
+                    for item in db_manager.find_by_ids(model_class, ids, session=session, load_relationships=False)
+                )
+            missing = sorted({item_id for _, item_id, _, _ in reviews if item_id not in items})
+            reviews = [review for review in reviews if review[1] in items]
+            previous_scores = {item_id: items[item_id].score or 0.0 for _, item_id, _, _ in reviews}
+
+            # The n-th answer to an item builds on the previous ones, so round n holds the n-th
+            # answer of every item: items are independent within a round and scored together
+            rounds: list[list[tuple[str, str, float, date]]] = []
+            answer_counts: dict[str, int] = {}
+            for review in reviews:
+                index = answer_counts.get(review[1], 0)
+                answer_counts[review[1]] = index + 1
+                if index == len(rounds):
+                    rounds.append([])
+                rounds[index].append(review)
+
+            for round_reviews in rounds:
+                self._apply_round(round_reviews, items)
+
+            # Update each affected unit (and its language) once
+            unit_deltas: dict[str, tuple[float, int]] = {}
+            for item_id, previous_score in previous_scores.items():
+                item = items[item_id]
+                if item.score != previous_score and item.unit_id:
+                    score_delta, _ = unit_deltas.get(item.unit_id, (0.0, 0))
+                    unit_deltas[item.unit_id] = (score_delta + item.score - previous_score, 0)
+            unit_service.apply_score_deltas(unit_deltas, session=session)
+
+            # Serialized before the commit expires the items
+            types = {item_id: type_name for type_name, item_id, _, _ in reviews}
+            result = {
+                "items": [
+                    {
+                        "id": item_id,
+                        "type": types[item_id],
+                        "score": items[item_id].score,
+                        "difficulty": items[item_id].difficulty,
+                        "last_seen": items[item_id].last_seen.isoformat(),
+                        "due_at": items[item_id].due_at.isoformat(),
+                    }
+                    for item_id in previous_scores
+                ],
+                "units": sorted(unit_deltas),
+                "missing": missing,
+            }
+
+            db_manager.commit(session)
+            logger.info(f"Applied {len(answers)} review answers to {len(previous_scores)} items ({len(unit_deltas)} units)")
+            return result
+        except Exception as e:
+            if owns_session:
+                session.rollback()
+            logger.error(f"Failed to apply review answers: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
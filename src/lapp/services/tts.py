@@ -2,10 +2,12 @@ import logging
 import random
 import uuid
 from pathlib import Path
+from typing import Optional
 import torch
 import soundfile as sf
 
 from ..utils import detect_text_language, qwen_tts_model
+from ..utils.detect_language import Language
 
 logger = logging.getLogger(__name__)
 
@@ -52,13 +54,15 @@ class TTSService:
     
     def generate_audio(
         self,
-        text: str | list[str]
+        text: str | list[str],
+        language: Optional[Language] = None
     ) -> str | list[str]:
         """
         Generate audio file from text using QwenTTS API.
         
         Args:
             text: Text to convert to speech (string or list of strings)
+            language: Language of the text, e.g. from its course (see LanguageResolver). Detected if None.
         
         Returns:
             Relative path(s) to generated audio file(s) with forward slashes
@@ -83,8 +87,9 @@ class TTSService:
         try:
             logger.info(f"Generating TTS for: {text_list}")
 
-            language = detect_text_language(text_list[0])
-            logger.info(f"Detected language: {language.name} ({language.iso1}) for text: '{text_list[0]}'")
+            if language is None:
+                language = detect_text_language(text_list[0])
+                logger.info(f"Detected language: {language.name} ({language.iso1}) for text: '{text_list[0]}'")
             
             wavs, sr = self.model.generate_custom_voice(
                 text=text_list,
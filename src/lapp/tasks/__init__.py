@@ -2,10 +2,15 @@ from .backup import register_backup_tasks
 from .text_gen import register_text_gen_tasks
 from .tts import register_tts_tasks
 from .media_cleanup import register_media_cleanup_tasks
+from .rescore import recompute_table, recompute_features
+from .reference_audio import schedule_reference_audio
 
 __all__ = [
     "register_backup_tasks",
     "register_text_gen_tasks",
     "register_tts_tasks",
     "register_media_cleanup_tasks",
+    "recompute_table",
+    "recompute_features",
+    "schedule_reference_audio",
 ]
\ No newline at end of file
@@ -8,9 +8,12 @@ from flask import Flask
 
 from ..core.database import db_manager
 from ..models import Vocabulary, Grammar, Calligraphy, Exercise, Character, Word, Passage
+from ..services import ReferenceService
 
 logger = logging.getLogger(__name__)
 
+reference_service = ReferenceService()
+
 def register_media_cleanup_tasks(scheduler: BackgroundScheduler, app: Flask):
     """
     Register media cleanup scheduled tasks.
@@ -73,6 +76,7 @@ def cleanup_orphaned_media(app: Flask):
                                 referenced.add(str((media_root / path_str.lstrip("/").removeprefix("media/").removeprefix("media_dev/").removeprefix("media_test/")).resolve()))
 
             scanned = orphaned = errors = 0
+            deleted: list[Path] = []
 
             logger.info(f"🔍 Referenced paths in DB: {len(referenced)}")
 
@@ -93,11 +97,15 @@ def cleanup_orphaned_media(app: Flask):
                     orphaned += 1
                     try:
                         path.unlink()
+                        deleted.append(path)
                         logger.info(f"✅ Deleted orphaned file: {path.name}")
                     except Exception as e:
                         errors += 1
                         logger.error(f"❌ Failed to handle orphaned file {path.name}: {e}")
 
+            # Drop the cached evaluation features of the deleted recordings
+            reference_service.evict_audio(deleted)
+
             logger.info(f"✅ Media cleanup task completed: {scanned} scanned, {orphaned} orphaned, {errors} errors")
 
         except Exception as e:
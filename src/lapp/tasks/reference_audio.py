@@ -0,0 +1,41 @@
+import logging
+from flask import Flask
+
+from ..core.scheduler import app_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_reference_audio(ex_id: str, audio_files: list[str]) -> None:
+    """
+    Precompute the reference cache of an exercise's audio files in the background.
+
+    The file paths are passed to the job, so it does not depend on the exercise
+    changes being committed yet when it runs.
+
+    Args:
+        ex_id: The ID of the exercise the audio files were attached to
+        audio_files: The exercise's audio_files, e.g. ["/media/audio/abc.mp3"]
+    """
+    if not audio_files:
+        return
+
+    if app_scheduler.run_once(precompute_reference_audio, f"precompute_reference_audio_{ex_id}", ex_id, list(audio_files)):
+        logger.info(f"Scheduled reference audio precomputation for Exercise {ex_id}")
+
+
+def precompute_reference_audio(app: Flask, ex_id: str, audio_files: list[str]):
+    """
+    Background task computing the reference features of an exercise's audio files.
+    """
+    logger.info(f"🎧 Starting reference audio precomputation for Exercise {ex_id}")
+
+    with app.app_context():
+        try:
+            # Loading the evaluator loads the speech models, keep it out of import time
+            from ..services import EvaluatorService
+
+            processed = EvaluatorService().precompute_reference_audio(audio_files)
+            logger.info(f"✅ Reference audio precomputed for Exercise {ex_id}: {processed}/{len(audio_files)} files")
+        except Exception as e:
+            logger.error(f"❌ Reference audio precomputation failed for Exercise {ex_id}: {e}", exc_info=True)
@@ -0,0 +1,128 @@
+import logging
+from datetime import date
+from typing import Callable, Optional
+
+import numpy as np
+import sqlalchemy
+from sqlalchemy import bindparam, func, select, tuple_, update
+
+from ..core.database import db_manager
+from ..models import Vocabulary, Grammar, Calligraphy, Exercise
+from ..utils.scoring import as_dates, compute_due_dates
+
+logger = logging.getLogger(__name__)
+
+FEATURE_MODELS = [Vocabulary, Grammar, Calligraphy, Exercise]
+
+# A recomputation receives one chunk of rows as column arrays (keyed by column
+# name, "id" included) and returns the arrays of the columns to write back.
+Recompute = Callable[[dict[str, np.ndarray]], dict[str, np.ndarray]]
+
+
+def reschedule_reviews(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Re-derive due_at from the stored score, difficulty and last review date."""
+    today = date.today()
+    last_seen = as_dates([value or today for value in columns["last_seen"]])
+    difficulty = np.array([0.5 if value is None else value for value in columns["difficulty"]], dtype=np.float64)
+    score = np.array([value or 0 for value in columns["score"]], dtype=np.float64)
+
+    return {"due_at": compute_due_dates(score, difficulty, last_seen)}
+
+
+# Recomputations runnable from the CLI, by name: (function, columns it reads, columns it writes)
+RECOMPUTES: dict[str, tuple[Recompute, list[str], list[str]]] = {
+    "schedule": (reschedule_reviews, ["score", "difficulty", "last_seen"], ["due_at"]),
+}
+
+
+def _to_python(values: np.ndarray) -> list:
+    """Convert an array back to values the DBAPI accepts (date, float, ...)."""
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[D]").astype(object).tolist()
+    return values.tolist()
+
+
+def recompute_table(
+    model_class,
+    recompute: Recompute,
+    columns: list[str],
+    chunk_size: int = 2000,
+    connection: Optional[sqlalchemy.Connection] = None
+) -> int:
+    """
+    Recompute columns of a whole table in chunks, writing each chunk back with a single executemany.
+
+    Rows are streamed in ID creation order with a keyset condition, so memory stays
+    bounded by chunk_size and no cursor stays open while the chunk is written.
+
+    Args:
+        model_class: The SQLAlchemy model class whose table is recomputed
+        recompute: Function from the chunk's column arrays to the arrays to write back
+        columns: Columns read for each row, besides the ID
+        chunk_size: Number of rows per chunk
+        connection: Optional connection. If None, the table is recomputed in its own transaction.
+
+    Returns:
+        The number of rows recomputed
+    """
+    if connection is None:
+        with db_manager.engine.begin() as connection:
+            return recompute_table(model_class, recompute, columns, chunk_size, connection)
+
+    table = model_class.__table__
+    # IDs share a prefix per model, so (length, id) sorts them numerically
+    order_key = (func.length(table.c.id), table.c.id)
+    statement = select(table.c.id, *(table.c[column] for column in columns)).order_by(*order_key).limit(chunk_size)
+
+    total = 0
+    last_id = None
+    while True:
+        chunk_statement = statement
+        if last_id is not None:
+            chunk_statement = statement.where(tuple_(*order_key) > tuple_(len(last_id), last_id))
+        rows = connection.execute(chunk_statement).all()
+        if not rows:
+            break
+
+        chunk = {name: np.array(values, dtype=object) for name, values in zip(["id", *columns], zip(*rows))}
+        results = recompute(chunk)
+
+        if results:
+            write = update(table).where(table.c.id == bindparam("_id")).values({name: bindparam(name) for name in results})
+            values = {name: _to_python(array) for name, array in results.items()}
+            connection.execute(write, [
+                {"_id": row_id, **{name: column[index] for name, column in values.items()}}
+                for index, row_id in enumerate(chunk["id"].tolist())
+            ])
+
+        total += len(rows)
+        last_id = rows[-1][0]
+
+    logger.info(f"Recomputed {total} rows of {table.name}")
+    return total
+
+
+def recompute_features(name: str, chunk_size: int = 2000) -> int:
+    """
+    Run a named recomputation of RECOMPUTES over every feature table, in one transaction.
+
+    Unit and language aggregates are rebuilt afterwards when scores were rewritten.
+
+    Returns:
+        The number of rows recomputed
+    """
+    from ..core.migrations import rebuild_score_aggregates
+
+    if name not in RECOMPUTES:
+        raise ValueError(f"Unknown recomputation: {name}")
+    recompute, columns, written = RECOMPUTES[name]
+
+    total = 0
+    with db_manager.engine.begin() as connection:
+        for model_class in FEATURE_MODELS:
+            total += recompute_table(model_class, recompute, columns, chunk_size, connection)
+
+        if "score" in written:
+            rebuild_score_aggregates(connection)
+
+    return total
@@ -6,6 +6,7 @@ logger = logging.getLogger(__name__)
 
 from ..core.database import db_manager
 from ..services import TTSService, PassageService, WordService, CharacterService
+from ..services.language_resolver import language_resolver
 from ..schemas.components import CharacterDict, PassageDict, WordDict
 from ..models.components import Passage, Character, Word
 
@@ -13,6 +14,20 @@ passage_service = PassageService()
 word_service = WordService()
 character_service = CharacterService()
 
+
+def _component_unit_id(component) -> str | None:
+    """Get the unit of a feature using the component, whose course gives the component's language."""
+    if isinstance(component, Character):
+        features = component.calligraphy
+    elif isinstance(component, Word):
+        features = [*component.vocabulary, *component.calligraphy]
+    else:
+        features = [component.vocabulary, component.grammar]
+
+    if not isinstance(features, list):
+        features = [features]
+    return next((feature.unit_id for feature in features if feature is not None), None)
+
 def register_tts_tasks(scheduler: BackgroundScheduler, app: Flask):
     """
     Register TTS-related scheduled tasks.
@@ -105,7 +120,8 @@ def generate_missing_component_audio(app: Flask):
                         logger.warning(f"⚠️  Component ID {component.id} has no text to generate audio from")
                         continue
 
-                    relative_path = tts_service.generate_audio(text=text)
+                    language = language_resolver.resolve(text, unit_id=_component_unit_id(component), session=session)
+                    relative_path = tts_service.generate_audio(text=text, language=language)
                     component_id = component.id
 
                     updated_component = component.to_dict(include_relations=False)
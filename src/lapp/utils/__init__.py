@@ -1,9 +1,15 @@
 from .file_handler import MediaFileHandler
-from .helpers import update_score
-from .detect_language import detect_audio_language, detect_text_language
-from .spacy_model import load_spacy_model
+from .helpers import update_score, update_difficulty, compute_due_date
+from .detect_language import detect_audio_language, detect_text_language, language_from_course
+from .spacy_model import load_spacy_model, spacy_registry
 from .offline import is_offline
+from .audio import AudioFrontend, audio_frontend
+from .inference import InferenceScheduler, inference_scheduler
+from .language_tool import LanguageToolPool, StubLanguageTool, language_tool_pool
 from .models import (
+    TEXT_EMBEDDING_MODEL_NAME,
+    AUDIO_EMBEDDING_MODEL_NAME,
+    STT_MODEL_NAME,
     text_embedding_model,
     audio_embedding_model,
     audio_embedding_processor,
@@ -19,10 +25,24 @@ from .models import (
 __all__ = [
     MediaFileHandler,
     update_score,
+    update_difficulty,
+    compute_due_date,
     detect_text_language,
     detect_audio_language,
+    language_from_course,
     load_spacy_model,
+    spacy_registry,
     is_offline,
+    AudioFrontend,
+    audio_frontend,
+    InferenceScheduler,
+    inference_scheduler,
+    LanguageToolPool,
+    StubLanguageTool,
+    language_tool_pool,
+    TEXT_EMBEDDING_MODEL_NAME,
+    AUDIO_EMBEDDING_MODEL_NAME,
+    STT_MODEL_NAME,
     text_embedding_model,
     audio_embedding_model,
     audio_embedding_processor,
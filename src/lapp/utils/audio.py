@@ -0,0 +1,109 @@
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import torchaudio
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+class AudioFrontend:
+    """
+    Decodes audio files once into the 16kHz mono float32 waveform every speech model takes.
+
+    The waveform is decoded a single time and the same buffer is handed to the
+    embedding model, the STT model and the language detection. Resampling kernels
+    are built once per source rate. Reference recordings, decoded again each time
+    their features are recomputed, are also saved to cache_dir and memory-mapped
+    from there afterwards.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._resamplers: dict[int, torchaudio.transforms.Resample] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """Configure the decoded reference cache directory from the app config."""
+        cache_dir = app.config.get("AUDIO_CACHE_ROOT")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _resampler(self, orig_freq: int) -> torchaudio.transforms.Resample:
+        with self._lock:
+            resampler = self._resamplers.get(orig_freq)
+            if resampler is None:
+                resampler = self._resamplers[orig_freq] = torchaudio.transforms.Resample(orig_freq=orig_freq, new_freq=SAMPLE_RATE)
+            return resampler
+
+    def decode(self, audio_path: str | Path) -> np.ndarray:
+        """Decode an audio file to a 16kHz mono float32 waveform."""
+        waveform, sr = torchaudio.load(str(audio_path))
+        # Downmixed first, so only one channel is resampled
+        waveform = waveform.mean(dim=0)
+        if sr != SAMPLE_RATE:
+            waveform = self._resampler(sr)(waveform)
+        return waveform.numpy().astype(np.float32, copy=False)
+
+    def _cache_prefix(self, audio_path: str | Path) -> str:
+        return hashlib.sha1(str(Path(audio_path).resolve()).encode("utf-8")).hexdigest()
+
+    def load_reference(self, audio_path: str | Path) -> np.ndarray:
+        """
+        Get the waveform of a reference recording, memory-mapped from the cache when already decoded.
+
+        Cache files are named after the file path, size and modification time, so a
+        replaced recording is decoded again. The returned array may be read-only.
+        """
+        if self.cache_dir is None:
+            return self.decode(audio_path)
+
+        stat = os.stat(audio_path)
+        prefix = self._cache_prefix(audio_path)
+        cache_file = self.cache_dir / f"{prefix}-{stat.st_size}-{stat.st_mtime_ns}.npy"
+
+        if cache_file.exists():
+            try:
+                return np.load(cache_file, mmap_mode="r")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Unreadable decoded audio {cache_file.name}, decoding again: {e}")
+
+        waveform = self.decode(audio_path)
+        try:
+            # Drop the decodings of previous versions of the file
+            self._evict_prefix(prefix)
+            # Written aside then renamed, so readers never map a partial file
+            partial = cache_file.with_name(f"{cache_file.name}.{uuid.uuid4().hex}.tmp")
+            with open(partial, "wb") as partial_file:
+                np.save(partial_file, waveform)
+            os.replace(partial, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to cache decoded audio of {audio_path}: {e}")
+        return waveform
+
+    def _evict_prefix(self, prefix: str) -> int:
+        evicted = 0
+        for cache_file in self.cache_dir.glob(f"{prefix}-*.npy"):
+            cache_file.unlink(missing_ok=True)
+            evicted += 1
+        return evicted
+
+    def evict(self, audio_paths: list[Path]) -> None:
+        """Drop the decoded waveforms of deleted audio files."""
+        if self.cache_dir is None:
+            return
+        evicted = sum(self._evict_prefix(self._cache_prefix(audio_path)) for audio_path in audio_paths)
+        if evicted:
+            logger.info(f"Evicted {evicted} decoded reference audio files")
+
+
+audio_frontend = AudioFrontend()
@@ -1,8 +1,15 @@
-from langdetect import detect
+from langdetect import DetectorFactory, detect
+import numpy as np
 import whisper
 import os
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Optional
+
+from .audio import audio_frontend
 
 logger = logging.getLogger(__name__)
 
@@ -43,10 +50,34 @@ _LANGUAGES: dict[str, Language] = {
 
 _UNKNOWN = Language("unknown", "unknown", "unknown", "Unknown")
 
+_BY_NAME: dict[str, Language] = {language.name.lower(): language for language in _LANGUAGES.values()}
+
+# langdetect is random by default: seeded, a text always gets the same language
+DetectorFactory.seed = 0
+
+# Texts already detected, by hash, as the same answers and sentences come back often
+_DETECTION_CACHE_SIZE = 4096
+_detection_cache: OrderedDict[bytes, "Language"] = OrderedDict()
+_detection_lock = threading.Lock()
+
 def _lookup(iso1: str) -> Language:
     # langdetect sometimes returns "zh-cn" / "zh-tw" — normalise to bare code
     return _LANGUAGES.get(iso1.split("-")[0], _UNKNOWN)
 
+def language_from_course(iso1: Optional[str], name: Optional[str]) -> Optional[Language]:
+    """
+    Get the Language of a course from its ISO 639-1 code, or else its English name.
+
+    Returns None when neither is known, e.g. a course named "Klingon" without a code.
+    """
+    if iso1:
+        language = _LANGUAGES.get(iso1.strip().lower())
+        if language:
+            return language
+    if name:
+        return _BY_NAME.get(name.strip().lower())
+    return None
+
 audio_detection_model = whisper.load_model("base")
 
 def detect_text_language(text: str) -> Language:
@@ -54,7 +85,10 @@ def detect_text_language(text: str) -> Language:
     Detect the language of a text string.
 
     Returns a Language dataclass with iso1, iso2t, spacy_model, and name.
-    Falls back to Language("unknown", ...) on error.
+    Falls back to Language("unknown", ...) on error. Results are memoized by text hash.
+
+    Prefer the language of the course when known (see LanguageResolver): langdetect
+    is slow and unreliable on short texts such as single words.
 
     Example:
         lang = detect_text_language("Bonjour le monde")
@@ -63,18 +97,33 @@ def detect_text_language(text: str) -> Language:
         lang.spacy_model # "fr_core_news_sm"
         lang.name        # "French"
     """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    with _detection_lock:
+        lang = _detection_cache.get(key)
+        if lang is not None:
+            _detection_cache.move_to_end(key)
+            return lang
+
     try:
         lang = _lookup(detect(text))
         logger.debug(f"Detected text language: {lang}")
-        return lang
     except Exception as e:
         logger.error(f"Error detecting text language: {e}")
         return _UNKNOWN
 
+    with _detection_lock:
+        _detection_cache[key] = lang
+        if len(_detection_cache) > _DETECTION_CACHE_SIZE:
+            _detection_cache.popitem(last=False)
+    return lang
+
 
-def detect_audio_language(audio_file_path: str) -> tuple[Language, float]:
+def detect_audio_language(audio: str | np.ndarray) -> tuple[Language, float]:
     """
-    Detect the language of an audio file using Whisper.
+    Detect the language of an audio file, or of an already decoded 16kHz mono waveform, using Whisper.
+
+    Pass the waveform when the caller decoded it anyway (see AudioFrontend), so the
+    file is not decoded again.
 
     Returns (Language, confidence) or (_UNKNOWN, 0.0) on error.
 
@@ -84,11 +133,14 @@ def detect_audio_language(audio_file_path: str) -> tuple[Language, float]:
         confidence   # 0.97
     """
     try:
-        if not os.path.isfile(audio_file_path):
-            logger.error(f"Audio file does not exist: {audio_file_path}")
+        if isinstance(audio, np.ndarray):
+            audio = np.asarray(audio, dtype=np.float32)
+        elif not os.path.isfile(audio):
+            logger.error(f"Audio file does not exist: {audio}")
             return _UNKNOWN, 0.0
+        else:
+            audio = audio_frontend.decode(audio)
 
-        audio = whisper.load_audio(audio_file_path)
         audio = whisper.pad_or_trim(audio)
         mel = whisper.log_mel_spectrogram(
             audio, n_mels=audio_detection_model.dims.n_mels
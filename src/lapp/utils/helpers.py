@@ -1,4 +1,5 @@
-from datetime import date
+from datetime import date, timedelta
+from typing import Optional
 from math import log2
 
 
@@ -84,4 +85,29 @@ def update_difficulty(
     # Exponential moving average for stability across sessions
     new_difficulty = (1 - alpha) * previous_difficulty + alpha * (previous_difficulty + difficulty_delta)
 
-    return min(max(0.0, new_difficulty), 1.0)
\ No newline at end of file
+    return min(max(0.0, new_difficulty), 1.0)
+
+def compute_due_date(
+    score: float,
+    difficulty: float,
+    reviewed_on: Optional[date] = None,
+    max_interval: int = 64
+) -> date:
+    """
+    Computes when a Feature is next due for review, from its score and difficulty after a review.
+
+    The interval grows exponentially with mastery (1 day at score 0, max_interval
+    days at score 100) and is shortened by up to half for the hardest items.
+
+    Args:
+        score:        Score after calling update_score() (0–100)
+        difficulty:   Difficulty after calling update_difficulty() (0.0 = easy, 1.0 = hard)
+        reviewed_on:  Date of the review, today if None
+        max_interval: Interval in days for a fully mastered, easy item
+    """
+    reviewed_on = reviewed_on or date.today()
+
+    mastery  = min(max(0.0, score), 100.0) / 100.0
+    interval = max_interval ** mastery * (1 - difficulty / 2)
+
+    return reviewed_on + timedelta(days=max(1, round(interval)))
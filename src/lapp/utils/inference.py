@@ -0,0 +1,137 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+# Runs a model on a list of inputs and returns one output per input, in order
+BatchFunction = Callable[[list[Any]], list[Any]]
+
+
+class MicroBatcher:
+    """
+    Request queue of one model, run in micro-batches by a dedicated worker thread.
+
+    The worker waits for a first request, then keeps collecting requests for at
+    most max_latency_ms or until max_batch_size are queued, and runs them with a
+    single call of the batch function. Under load, batches fill up and throughput
+    follows the batch size; a lone request only waits max_latency_ms. The model
+    is only ever called from the worker, so it needs not be thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: BatchFunction,
+        max_batch_size: int,
+        max_latency_ms: float,
+        slots: threading.Semaphore
+    ):
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+        self._slots = slots
+        self._queue: queue.Queue[tuple[Any, Future]] = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, item: Any) -> Future:
+        """Queue an input, returning the future of its output."""
+        future = Future()
+        self._queue.put((item, future))
+        self._ensure_worker()
+        return future
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name=f"inference-{self.name}", daemon=True)
+                self._worker.start()
+
+    def _collect(self) -> list[tuple[Any, Future]]:
+        """Block for a first request, then gather more until the batch is full or the window closes."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_latency_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            # Drop the requests whose caller gave up
+            batch = [(item, future) for item, future in self._collect() if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            # Bounds the number of models running at once, across all queues
+            with self._slots:
+                started = time.monotonic()
+                try:
+                    outputs = list(self.batch_fn([item for item, _ in batch]))
+                    if len(outputs) != len(batch):
+                        raise RuntimeError(f"{self.name} returned {len(outputs)} outputs for {len(batch)} inputs")
+                except Exception as e:
+                    logger.error(f"Inference batch of {len(batch)} failed on {self.name}: {e}")
+                    for _, future in batch:
+                        future.set_exception(e)
+                    continue
+
+            logger.debug(f"Ran a batch of {len(batch)} on {self.name} in {time.monotonic() - started:.3f}s")
+            for (_, future), output in zip(batch, outputs):
+                future.set_result(output)
+
+
+class InferenceScheduler:
+    """
+    In-process scheduler of the evaluation models.
+
+    Each registered model gets its own request queue, batched by a MicroBatcher.
+    At most max_concurrency batches run at once over all models, so a burst of
+    evaluations does not oversubscribe the CPU/GPU.
+    """
+
+    def __init__(self, max_concurrency: int = 2, max_latency_ms: float = 10.0):
+        self.max_concurrency = max_concurrency
+        self.max_latency_ms = max_latency_ms
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._batchers: dict[str, MicroBatcher] = {}
+
+    def init_app(self, app: Flask) -> None:
+        """Configure the scheduler from the app config, before any request is submitted."""
+        self.max_concurrency = app.config.get("INFERENCE_MAX_CONCURRENCY", self.max_concurrency)
+        self.max_latency_ms = app.config.get("INFERENCE_MAX_LATENCY_MS", self.max_latency_ms)
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        for batcher in self._batchers.values():
+            batcher.max_latency_ms = self.max_latency_ms
+            batcher._slots = self._slots
+
+    def register(self, name: str, batch_fn: BatchFunction, max_batch_size: int = 16) -> MicroBatcher:
+        """Register the batch function of a model. Registering a name twice keeps the first one."""
+        if name not in self._batchers:
+            self._batchers[name] = MicroBatcher(name, batch_fn, max_batch_size, self.max_latency_ms, self._slots)
+        return self._batchers[name]
+
+    def submit(self, name: str, item: Any) -> Future:
+        """Queue an input for a registered model, returning the future of its output."""
+        if name not in self._batchers:
+            raise KeyError(f"No model registered for inference: {name}")
+        return self._batchers[name].submit(item)
+
+    def run(self, name: str, item: Any, timeout: Optional[float] = None) -> Any:
+        """Queue an input and wait for its output."""
+        return self.submit(name, item).result(timeout=timeout)
+
+
+inference_scheduler = InferenceScheduler()
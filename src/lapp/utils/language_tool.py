@@ -0,0 +1,176 @@
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+
+class StubLanguageTool:
+    """
+    In-process stand-in for a LanguageTool instance, which starts no Java server.
+
+    Returns the canned matches given for a text, none otherwise. Used by the
+    "stub" backend so grammar scoring and the pool can run in tests.
+    """
+
+    def __init__(self, language: str, matches: Optional[dict[str, list]] = None):
+        self.language = language
+        self.matches = matches or {}
+        self.closed = False
+
+    def check(self, text: str) -> list:
+        if self.closed:
+            raise RuntimeError(f"Stub LanguageTool for '{self.language}' is closed")
+        return list(self.matches.get(text, []))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _start_server_tool(language: str):
+    """Start (or attach to) a LanguageTool Java server for a language."""
+    import language_tool_python
+    return language_tool_python.LanguageTool(language)
+
+
+LANGUAGE_TOOL_BACKENDS: dict[str, Callable[[str], Any]] = {
+    "server": _start_server_tool,
+    "stub": StubLanguageTool,
+}
+
+
+class _PooledTool:
+    def __init__(self, tool):
+        self.tool = tool
+        self.checked_at = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class LanguageToolPool:
+    """
+    Long-lived LanguageTool instances, one per language.
+
+    Instances are started on the first check of their language and kept for the
+    following ones, as starting one loads a Java server and a language model.
+    At most max_languages are loaded at once: the least recently used one is
+    closed to make room for a new language. An instance idle for longer than
+    health_check_interval is probed before use, and one that fails (e.g. its
+    server crashed) is restarted and the check retried once.
+    """
+
+    def __init__(self, backend: str = "server", max_languages: int = 2, health_check_interval: float = 300.0):
+        self.backend = backend
+        self.max_languages = max_languages
+        self.health_check_interval = health_check_interval
+        self._tools: OrderedDict[str, _PooledTool] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """Configure the pool from the app config, closing the instances of a previous configuration."""
+        self.close()
+        self.backend = app.config.get("LANGUAGE_TOOL_BACKEND", self.backend)
+        self.max_languages = app.config.get("LANGUAGE_TOOL_MAX_LANGUAGES", self.max_languages)
+        self.health_check_interval = app.config.get("LANGUAGE_TOOL_HEALTH_CHECK_SECONDS", self.health_check_interval)
+        if self.backend not in LANGUAGE_TOOL_BACKENDS:
+            raise ValueError(f"Unknown LanguageTool backend: {self.backend}")
+
+    def _start(self, language: str) -> _PooledTool:
+        started = time.monotonic()
+        tool = LANGUAGE_TOOL_BACKENDS[self.backend](language)
+        logger.info(f"Started LanguageTool ({self.backend}) for '{language}' in {time.monotonic() - started:.2f}s")
+        return _PooledTool(tool)
+
+    def _close_pooled(self, language: str, pooled: _PooledTool) -> None:
+        with pooled.lock:
+            if pooled.tool is None:
+                return
+            try:
+                pooled.tool.close()
+                logger.info(f"Closed LanguageTool for '{language}'")
+            except Exception as err:
+                logger.warning(f"Failed to close LanguageTool for '{language}': {err}")
+            pooled.tool = None
+
+    def _acquire(self, language: str) -> _PooledTool:
+        """Get the instance of a language, starting it and evicting the least recently used one if needed."""
+        evicted = []
+        with self._lock:
+            pooled = self._tools.get(language)
+            if pooled is not None:
+                self._tools.move_to_end(language)
+                return pooled
+
+            while self._tools and len(self._tools) >= self.max_languages:
+                evicted.append(self._tools.popitem(last=False))
+
+            # Started under the lock so concurrent first checks start a single server
+            pooled = self._tools[language] = self._start(language)
+
+        for evicted_language, evicted_pooled in evicted:
+            self._close_pooled(evicted_language, evicted_pooled)
+        return pooled
+
+    def _restart(self, language: str, failed: _PooledTool) -> _PooledTool:
+        """Replace a failed instance, unless another thread already did."""
+        with self._lock:
+            if self._tools.get(language) is failed:
+                del self._tools[language]
+        self._close_pooled(language, failed)
+        return self._acquire(language)
+
+    def _check(self, pooled: _PooledTool, text: str) -> list:
+        with pooled.lock:
+            if pooled.tool is None:
+                raise RuntimeError("LanguageTool instance was closed")
+
+            now = time.monotonic()
+            if now - pooled.checked_at >= self.health_check_interval:
+                # Idle for long: a cheap probe tells a crashed server from a bad text
+                pooled.tool.check("ok")
+
+            matches = pooled.tool.check(text)
+            pooled.checked_at = now
+            return matches
+
+    def check(self, language: str, text: str) -> list:
+        """
+        Check a text with the LanguageTool instance of a language.
+
+        Args:
+            language: ISO 639-1 code of the language, e.g. "fr"
+            text: The text to check
+
+        Returns:
+            The LanguageTool matches of the text
+
+        Raises:
+            Exception: When the instance cannot be started, or fails again after a restart
+        """
+        pooled = self._acquire(language)
+        try:
+            return self._check(pooled, text)
+        except Exception as err:
+            logger.warning(f"LanguageTool for '{language}' failed, restarting it: {err}")
+            return self._check(self._restart(language, pooled), text)
+
+    def loaded_languages(self) -> list[str]:
+        """Languages with a started instance, from least to most recently used."""
+        with self._lock:
+            return list(self._tools)
+
+    def close(self, language: Optional[str] = None) -> None:
+        """Close the instance of a language, or all of them."""
+        with self._lock:
+            languages = [language] if language is not None else list(self._tools)
+            closed = [(lang, self._tools.pop(lang)) for lang in languages if lang in self._tools]
+        for lang, pooled in closed:
+            self._close_pooled(lang, pooled)
+
+
+language_tool_pool = LanguageToolPool()
+atexit.register(language_tool_pool.close)
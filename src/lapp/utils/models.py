@@ -37,30 +37,33 @@ from transformers import (
 from qwen_tts import Qwen3TTSModel
 
 # Text-to-representation model (for clustering, retrieval, etc.)
+TEXT_EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
 text_embedding_model = SentenceTransformer(
-    "all-MiniLM-L6-v2",
+    TEXT_EMBEDDING_MODEL_NAME,
     local_files_only=OFFLINE,
 )
 
 # Audio-to-representation model (for clustering, retrieval, etc.)
+AUDIO_EMBEDDING_MODEL_NAME = "facebook/wav2vec2-large-xlsr-53"
 audio_embedding_model = Wav2Vec2Model.from_pretrained(
-    "facebook/wav2vec2-large-xlsr-53",
+    AUDIO_EMBEDDING_MODEL_NAME,
     local_files_only=OFFLINE,
 )
 audio_embedding_processor = Wav2Vec2FeatureExtractor.from_pretrained(
-    "facebook/wav2vec2-large-xlsr-53",
+    AUDIO_EMBEDDING_MODEL_NAME,
     local_files_only=OFFLINE,
 )
 
 # Speech-to-text model
+STT_MODEL_NAME = "openai/whisper-medium"
 stt_model = AutoModelForSpeechSeq2Seq.from_pretrained(
-    "openai/whisper-medium",
+    STT_MODEL_NAME,
     dtype=torch.float16,
     use_safetensors=True,
     local_files_only=OFFLINE,
 )
 stt_processor = AutoProcessor.from_pretrained(
-    "openai/whisper-medium",
+    STT_MODEL_NAME,
     local_files_only=OFFLINE,
 )
 stt_pipe = pipeline(
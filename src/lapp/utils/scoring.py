@@ -0,0 +1,152 @@
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+# Array versions of the scoring functions of helpers.py. They compute the same
+# values element-wise over whole columns, for bulk recomputations where calling
+# the scalar functions row by row is too slow. Keep both in sync.
+
+ArrayLike = np.ndarray | list | float
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def as_dates(values: ArrayLike | date) -> np.ndarray:
+    """
+    Convert dates to a datetime64[D] array, converting each column only once.
+
+    NumPy parses date objects one by one, so go through their ordinals instead,
+    which is an order of magnitude faster on large columns.
+    """
+    if isinstance(values, np.datetime64) or (isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64)):
+        return values.astype("datetime64[D]")
+    if isinstance(values, date):
+        return np.datetime64(values, "D")
+    ordinals = np.fromiter((value.toordinal() for value in values), dtype=np.int64, count=len(values))
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def _reference_dates(today: Optional[date | ArrayLike]) -> np.ndarray:
+    """The reference date(s) computations are made at: today, or one date per item."""
+    return np.datetime64(date.today(), "D") if today is None else as_dates(today)
+
+
+def _days_before(today: Optional[date | ArrayLike], dates: ArrayLike) -> np.ndarray:
+    """Number of days from each date to today, as a float array."""
+    return (_reference_dates(today) - as_dates(dates)).astype(np.float64)
+
+
+def compute_recency_weights(
+    created_at: ArrayLike,
+    last_seen: ArrayLike,
+    today: Optional[date | ArrayLike] = None
+) -> np.ndarray:
+    """
+    Vectorized helpers.compute_recency_weight.
+
+    Args:
+        created_at: Dates the items were first created/added
+        last_seen:  Dates the items were last reviewed
+        today:      Reference date, or one per item, today if None
+    """
+    staleness       = np.log2(_days_before(today, last_seen) + 2)
+    maturity_dampen = np.log2(_days_before(today, created_at) + 2)
+
+    return staleness / maturity_dampen
+
+
+def update_scores(
+    scores: ArrayLike,
+    last_seen: ArrayLike,
+    similarities: ArrayLike,
+    created_at: Optional[ArrayLike] = None,
+    difficulties: ArrayLike = 0.5,
+    scale: float = 5.0,
+    today: Optional[date | ArrayLike] = None
+) -> np.ndarray:
+    """
+    Vectorized helpers.update_score.
+
+    Args:
+        scores:       Current scores (0–100)
+        last_seen:    Dates the items were last reviewed
+        similarities: Answer qualities (0.0 = wrong, 1.0 = perfect)
+        created_at:   Dates the items were first created/added, today if None
+        difficulties: Current difficulty ratios (0.0 = easy, 1.0 = hard)
+        scale:        Score given for a perfect answer on day one
+        today:        Reference date, or one per item (e.g. answer dates), today if None
+    """
+    today = _reference_dates(today)
+    created_at = today if created_at is None else as_dates(created_at)
+    last_seen = as_dates(last_seen)
+    scores = np.asarray(scores, dtype=np.float64)
+    similarities = np.asarray(similarities, dtype=np.float64)
+
+    remaining_days = _days_before(today, last_seen)
+    recency_weight = compute_recency_weights(created_at, last_seen, today)
+
+    time_weight = np.log2(remaining_days + 2) * scale * (1 + np.asarray(difficulties, dtype=np.float64)) * recency_weight
+    scores = scores + similarities * time_weight - (1 - similarities) * time_weight * 0.5
+
+    return np.round(np.clip(scores, 0.0, 100.0), 4)
+
+
+def update_difficulties(
+    new_scores: ArrayLike,
+    last_seen: ArrayLike,
+    previous_difficulties: ArrayLike,
+    created_at: Optional[ArrayLike] = None,
+    scale: float = 1.0,
+    alpha: float = 0.3,
+    today: Optional[date | ArrayLike] = None
+) -> np.ndarray:
+    """
+    Vectorized helpers.update_difficulty.
+
+    Args:
+        new_scores:            Scores after calling update_scores() (0–100)
+        last_seen:             Dates the items were last reviewed
+        previous_difficulties: Prior difficulties (0.0 = easy, 1.0 = hard)
+        created_at:            Dates the items were first created/added, today if None
+        scale:                 Sensitivity of difficulty shift
+        alpha:                 EMA learning rate (0.0 = ignore new signal, 1.0 = fully reactive)
+        today:                 Reference date, or one per item, today if None
+    """
+    today = _reference_dates(today)
+    created_at = today if created_at is None else as_dates(created_at)
+    previous_difficulties = np.asarray(previous_difficulties, dtype=np.float64)
+
+    recency_weight = compute_recency_weights(created_at, last_seen, today)
+    performance = np.asarray(new_scores, dtype=np.float64) / 100.0
+
+    difficulty_delta = (0.5 - performance) * scale * recency_weight * 0.1
+    new_difficulties = (1 - alpha) * previous_difficulties + alpha * (previous_difficulties + difficulty_delta)
+
+    return np.clip(new_difficulties, 0.0, 1.0)
+
+
+def compute_due_dates(
+    scores: ArrayLike,
+    difficulties: ArrayLike,
+    reviewed_on: ArrayLike,
+    max_interval: int = 64
+) -> np.ndarray:
+    """
+    Vectorized helpers.compute_due_date.
+
+    Args:
+        scores:       Scores after calling update_scores() (0–100)
+        difficulties: Difficulties after calling update_difficulties() (0.0 = easy, 1.0 = hard)
+        reviewed_on:  Dates of the reviews
+        max_interval: Interval in days for a fully mastered, easy item
+
+    Returns:
+        Array of datetime64[D] due dates
+    """
+    mastery  = np.clip(np.asarray(scores, dtype=np.float64), 0.0, 100.0) / 100.0
+    interval = float(max_interval) ** mastery * (1 - np.asarray(difficulties, dtype=np.float64) / 2)
+
+    # np.rint rounds half to even like round()
+    days = np.maximum(1, np.rint(interval)).astype("timedelta64[D]")
+    return as_dates(reviewed_on) + days
@@ -1,19 +1,115 @@
 import spacy
 import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable
+
+from flask import Flask
 
 logger = logging.getLogger(__name__)
 
+# Pipeline components never used: only the tokenizer is run, for token texts and
+# lexical attributes (is_punct, is_space). Excluded components are not even loaded.
+EXCLUDED_COMPONENTS = [
+    "tok2vec",
+    "transformer",
+    "tagger",
+    "morphologizer",
+    "parser",
+    "senter",
+    "attribute_ruler",
+    "lemmatizer",
+    "trainable_lemmatizer",
+    "ner",
+]
+
+
+class SpacyRegistry:
+    """
+    Process-wide cache of tokenizer-only spaCy pipelines.
+
+    Each model is loaded once, without its pipeline components and with its word
+    vectors dropped, as tokenization needs neither. At most max_models pipelines
+    are kept: the least recently used one is released to load a new one.
+    """
+
+    def __init__(self, max_models: int = 4):
+        self.max_models = max_models
+        self._models: OrderedDict[str, spacy.language.Language] = OrderedDict()
+        self._loading: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """Configure the registry from the app config and load the pipelines of the languages to warm."""
+        from .detect_language import _lookup
+
+        self.max_models = app.config.get("SPACY_MAX_MODELS", self.max_models)
+        self.warm(_lookup(iso1).spacy_model for iso1 in app.config.get("SPACY_WARM_LANGUAGES", []))
+
+    def _load(self, spacy_model_id: str) -> spacy.language.Language:
+        started = time.monotonic()
+        nlp = spacy.load(spacy_model_id, exclude=EXCLUDED_COMPONENTS)
+        # md models ship word vectors, which the tokenizer never reads
+        nlp.vocab.reset_vectors(width=0)
+        logger.info(f"Loaded spaCy model '{spacy_model_id}' in {time.monotonic() - started:.2f}s")
+        return nlp
+
+    def get(self, spacy_model_id: str) -> spacy.language.Language:
+        """Get the pipeline of a model, loading it on first use."""
+        with self._lock:
+            nlp = self._models.get(spacy_model_id)
+            if nlp is not None:
+                self._models.move_to_end(spacy_model_id)
+                return nlp
+            loading = self._loading.setdefault(spacy_model_id, threading.Lock())
+
+        # Loading takes seconds: only the callers of this model wait for it
+        with loading:
+            with self._lock:
+                nlp = self._models.get(spacy_model_id)
+            if nlp is None:
+                nlp = self._load(spacy_model_id)
+
+            with self._lock:
+                self._models[spacy_model_id] = nlp
+                self._models.move_to_end(spacy_model_id)
+                self._loading.pop(spacy_model_id, None)
+                while len(self._models) > self.max_models:
+                    evicted, _ = self._models.popitem(last=False)
+                    logger.info(f"Released spaCy model '{evicted}'")
+        return nlp
+
+    def warm(self, spacy_model_ids: Iterable[str]) -> None:
+        """Load pipelines ahead of their first use, e.g. at startup. Failures are logged, not raised."""
+        for spacy_model_id in spacy_model_ids:
+            try:
+                self.get(spacy_model_id)
+            except Exception as e:
+                logger.warning(f"Failed to warm spaCy model '{spacy_model_id}': {e}")
+
+    def loaded_models(self) -> list[str]:
+        """Loaded models, from least to most recently used."""
+        with self._lock:
+            return list(self._models)
+
+
+spacy_registry = SpacyRegistry()
+
+
 def load_spacy_model(spacy_model_id: str):
     """Loads the appropriate spaCy model based on the detected language code.
-    
+
+    Models are cached in spacy_registry, so only the first call for a model loads it.
+
     Args:
-        lang_code: Language code from langdetect (e.g., 'en', 'fr', 'de')
-        
+        spacy_model_id: spaCy model of the language (e.g., 'fr_core_news_md')
+
     Returns:
-        Loaded spaCy model
+        Loaded tokenizer-only spaCy model
     """
-    
+
     if not spacy_model_id:
         raise ValueError(f"No spaCy model found for language code '{spacy_model_id}'")
-    
-    return spacy.load(spacy_model_id)
\ No newline at end of file
+
+    return spacy_registry.get(spacy_model_id)
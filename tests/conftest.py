@@ -0,0 +1,44 @@
+import pytest
+from flask import Flask
+
+from config import TestingConfig
+from lapp.core.database import db_manager, init_db
+from lapp.models import Language, Unit, Exercise
+
+
+@pytest.fixture
+def app():
+    """
+    A bare app on TestingConfig, with a fresh in-memory database.
+
+    Only the database is initialized: tests set up the components they exercise,
+    so no model, LanguageTool server or scheduler is started.
+    """
+    app = Flask("lapp_tests")
+    app.config.from_object(TestingConfig)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    init_db(app)
+
+    with app.app_context():
+        yield app
+
+    db_manager.close_session()
+    db_manager.engine.dispose()
+
+
+@pytest.fixture
+def session(app):
+    """The scoped session of the test thread."""
+    return db_manager.get_session()
+
+
+@pytest.fixture
+def course(session):
+    """A French language with one unit and one text exercise."""
+    session.add_all([
+        Language(id="lang_L1", name="French", iso1="fr"),
+        Unit(id="unit_U1", title="Greetings", language_id="lang_L1"),
+        Exercise(id="ex_E1", unit_id="unit_U1", exercise_type="translate", question="Hello", answer="Bonjour"),
+    ])
+    session.commit()
+    return {"language_id": "lang_L1", "unit_id": "unit_U1", "ex_id": "ex_E1"}
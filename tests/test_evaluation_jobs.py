@@ -0,0 +1,127 @@
+import json
+import threading
+
+import pytest
+
+from lapp.services import evaluation_jobs
+from lapp.services.evaluation_jobs import EvaluationJobService
+
+
+class FakeEvaluator:
+    """Stands in for EvaluatorService. Feedback is held until released, so a job can be caught mid-way."""
+
+    def __init__(self, score_error=None):
+        self.score_error = score_error
+        self.feedback_release = threading.Event()
+
+    def score(self, ex_id, user_input, input_type, correct_audio_index=0):
+        if self.score_error:
+            raise self.score_error
+        return {"correct": True, "score": 0.9}
+
+    def generate_feedback(self, ex_id, user_input, input_type, scored, correct_audio_index=0):
+        assert self.feedback_release.wait(5)
+        return f"Well done on {ex_id}"
+
+
+@pytest.fixture
+def evaluator(monkeypatch):
+    evaluator = FakeEvaluator()
+    monkeypatch.setattr(evaluation_jobs, "evaluator_service", evaluator)
+    yield evaluator
+    # Never leave a job thread waiting
+    evaluator.feedback_release.set()
+
+
+def _parse(message):
+    """Split a server-sent event into (event name, data), None for a keepalive comment."""
+    if message.startswith(":"):
+        return None
+    event_line, data_line = message.strip().split("\n")
+    return event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))
+
+
+def _events(service, job_id, keepalive=5.0):
+    return [_parse(message) for message in service.stream(job_id, keepalive=keepalive)]
+
+
+def test_stream_publishes_the_score_before_the_feedback(app, evaluator):
+    service = EvaluationJobService()
+    job_id = service.submit("ex_E1", "Bonjour", "text")
+    stream = service.stream(job_id)
+
+    # The score is out while the feedback is still being generated
+    assert _parse(next(stream)) == ("score", {"job_id": job_id, "status": "scored", "correct": True, "score": 0.9})
+    assert service.get(job_id)["status"] == "scored"
+
+    evaluator.feedback_release.set()
+    assert _parse(next(stream)) == ("feedback", {"job_id": job_id, "status": "done", "feedback": "Well done on ex_E1"})
+    # The stream ends with the job
+    assert next(stream, None) is None
+
+    assert service.get(job_id) == {
+        "job_id": job_id,
+        "status": "done",
+        "correct": True,
+        "score": 0.9,
+        "feedback": "Well done on ex_E1",
+        "error": None,
+    }
+
+
+def test_late_subscribers_get_every_event_replayed(app, evaluator):
+    service = EvaluationJobService()
+    evaluator.feedback_release.set()
+    job_id = service.submit("ex_E1", "Bonjour", "text")
+
+    first = _events(service, job_id)
+    # Subscribing after the job finished replays the same events, then ends
+    assert _events(service, job_id) == first
+    assert [event for event, _ in first] == ["score", "feedback"]
+
+
+def test_stream_sends_keepalives_while_waiting(app, evaluator):
+    service = EvaluationJobService()
+    job_id = service.submit("ex_E1", "Bonjour", "text")
+    stream = service.stream(job_id, keepalive=0.05)
+
+    assert _parse(next(stream))[0] == "score"
+    assert next(stream) == ": keepalive\n\n"
+
+    evaluator.feedback_release.set()
+    assert [_parse(message)[0] for message in stream if not message.startswith(":")] == ["feedback"]
+
+
+def test_failed_scoring_publishes_an_error_and_ends_the_job(app, evaluator):
+    evaluator.score_error = RuntimeError("model unavailable")
+    service = EvaluationJobService()
+    job_id = service.submit("ex_E1", "Bonjour", "text")
+
+    assert _events(service, job_id) == [("error", {"job_id": job_id, "status": "failed", "error": "model unavailable"})]
+    assert service.get(job_id)["status"] == "failed"
+
+
+def test_unknown_jobs_have_no_state_nor_events(app):
+    service = EvaluationJobService()
+
+    assert service.get("missing") is None
+    assert _events(service, "missing") == []
+
+
+def test_invalid_input_type_is_rejected(app):
+    with pytest.raises(ValueError):
+        EvaluationJobService().submit("ex_E1", "Bonjour", "video")
+
+
+def test_finished_jobs_expire_after_their_ttl(app, evaluator):
+    app.config["EVALUATION_JOB_TTL_SECONDS"] = 0
+    evaluator.feedback_release.set()
+    service = EvaluationJobService()
+
+    first = service.submit("ex_E1", "Bonjour", "text")
+    _events(service, first)
+    # Expired jobs are pruned when the next one is submitted
+    second = service.submit("ex_E1", "Salut", "text")
+
+    assert service.get(first) is None
+    assert service.get(second) is not None
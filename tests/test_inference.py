@@ -0,0 +1,141 @@
+import threading
+import time
+
+import pytest
+
+from lapp.utils.inference import InferenceScheduler, MicroBatcher
+
+
+class GatedModel:
+    """Batch function recording its batches, held on its first batch until released."""
+
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.fail_on = fail_on
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        self.started.set()
+        assert self.release.wait(5)
+        if self.fail_on in items:
+            raise ValueError(f"cannot run {self.fail_on}")
+        return [item * 2 for item in items]
+
+    def hold_worker(self, batcher):
+        """Submit a first request and wait for the worker to be busy with it, so the next ones queue up."""
+        future = batcher.submit(0)
+        assert self.started.wait(5)
+        return future
+
+
+def _batcher(model, max_batch_size=4, max_latency_ms=50.0):
+    return MicroBatcher("double", model, max_batch_size, max_latency_ms, threading.BoundedSemaphore(1))
+
+
+def test_queued_requests_run_in_batches_of_at_most_max_batch_size():
+    model = GatedModel()
+    batcher = _batcher(model)
+
+    first = model.hold_worker(batcher)
+    futures = [batcher.submit(item) for item in range(1, 11)]
+    model.release.set()
+
+    assert first.result(timeout=5) == 0
+    assert [future.result(timeout=5) for future in futures] == [item * 2 for item in range(1, 11)]
+    assert model.batches == [[0], [1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+
+def test_lone_request_only_waits_for_the_latency_window():
+    model = GatedModel()
+    model.release.set()
+    batcher = _batcher(model, max_latency_ms=20.0)
+
+    started = time.monotonic()
+    assert batcher.submit(21).result(timeout=5) == 42
+
+    assert model.batches == [[21]]
+    assert time.monotonic() - started < 1.0
+
+
+def test_cancelled_requests_are_not_run():
+    model = GatedModel()
+    batcher = _batcher(model)
+
+    model.hold_worker(batcher)
+    kept, cancelled, also_kept = batcher.submit(1), batcher.submit(2), batcher.submit(3)
+    assert cancelled.cancel()
+    model.release.set()
+
+    assert kept.result(timeout=5) == 2
+    assert also_kept.result(timeout=5) == 6
+    assert cancelled.cancelled()
+    assert model.batches[1:] == [[1, 3]]
+
+
+def test_failed_batch_fails_each_of_its_requests_only():
+    model = GatedModel(fail_on=2)
+    batcher = _batcher(model, max_batch_size=2)
+
+    model.hold_worker(batcher)
+    futures = [batcher.submit(item) for item in (1, 2, 3)]
+    model.release.set()
+
+    for future in futures[:2]:
+        with pytest.raises(ValueError, match="cannot run 2"):
+            future.result(timeout=5)
+    # The worker survives and runs the next batch
+    assert futures[2].result(timeout=5) == 6
+    assert model.batches[1:] == [[1, 2], [3]]
+
+
+def test_wrong_number_of_outputs_fails_the_batch():
+    batcher = _batcher(lambda items: items[:-1])
+
+    with pytest.raises(RuntimeError, match="returned 0 outputs for 1 inputs"):
+        batcher.submit(1).result(timeout=5)
+
+
+def test_scheduler_bounds_the_batches_running_at_once():
+    scheduler = InferenceScheduler(max_concurrency=1, max_latency_ms=1.0)
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow_model(items):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return items
+
+    scheduler.register("a", slow_model)
+    scheduler.register("b", slow_model)
+    futures = [scheduler.submit(name, item) for item in range(5) for name in ("a", "b")]
+
+    assert [future.result(timeout=5) for future in futures] == [item for item in range(5) for _ in ("a", "b")]
+    assert peak[0] == 1
+
+
+def test_scheduler_keeps_the_first_registration():
+    scheduler = InferenceScheduler()
+    scheduler.register("model", lambda items: ["first"] * len(items))
+    scheduler.register("model", lambda items: ["second"] * len(items))
+
+    assert scheduler.run("model", "text", timeout=5) == "first"
+    with pytest.raises(KeyError):
+        scheduler.submit("unknown", "text")
+
+
+def test_scheduler_init_app_reconfigures_registered_models(app):
+    app.config.update(INFERENCE_MAX_CONCURRENCY=3, INFERENCE_MAX_LATENCY_MS=5.0)
+    scheduler = InferenceScheduler()
+    batcher = scheduler.register("model", lambda items: items)
+
+    scheduler.init_app(app)
+
+    assert scheduler.max_concurrency == 3
+    assert batcher.max_latency_ms == 5.0
+    assert scheduler.run("model", "text", timeout=5) == "text"
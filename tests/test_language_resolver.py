@@ -0,0 +1,125 @@
+import pytest
+from sqlalchemy import event
+
+from lapp.core.database import db_manager
+from lapp.models import Language, Unit
+from lapp.schemas import LanguageDict, UnitDict
+from lapp.services import language_resolver as language_resolver_module
+from lapp.services.containers import LanguageService, UnitService
+from lapp.services.language_resolver import LanguageResolver, language_resolver
+from lapp.utils.detect_language import Language as LanguageDescriptor
+
+DETECTED = LanguageDescriptor("en", "eng", "en_core_web_md", "English")
+
+
+@pytest.fixture
+def detections(monkeypatch):
+    """Texts sent to langdetect, which always answers English here."""
+    texts = []
+
+    def detect(text):
+        texts.append(text)
+        return DETECTED
+
+    monkeypatch.setattr(language_resolver_module, "detect_text_language", detect)
+    return texts
+
+
+@pytest.fixture
+def queries(app):
+    """SELECT statements sent to the database."""
+    statements = []
+
+    @event.listens_for(db_manager.engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.fixture
+def shared_resolver():
+    """The resolver the services invalidate, emptied around each test."""
+    language_resolver.clear()
+    yield language_resolver
+    language_resolver.clear()
+
+
+def test_unit_language_is_resolved_from_its_iso1_code(course):
+    assert LanguageResolver().for_unit("unit_U1").iso1 == "fr"
+
+
+def test_unit_language_falls_back_to_the_language_name(course, session):
+    session.add_all([Language(id="lang_L2", name="German"), Unit(id="unit_U2", title="Numbers", language_id="lang_L2")])
+    session.commit()
+
+    assert LanguageResolver().for_unit("unit_U2").iso1 == "de"
+
+
+def test_resolved_units_are_served_from_the_cache(course, queries):
+    resolver = LanguageResolver()
+    resolver.for_unit("unit_U1")
+    count = len(queries)
+
+    assert resolver.for_unit("unit_U1").iso1 == "fr"
+    assert len(queries) == count
+
+
+def test_missing_units_are_not_cached(course, session):
+    resolver = LanguageResolver()
+    assert resolver.for_unit("unit_U2") is None
+
+    session.add(Unit(id="unit_U2", title="Numbers", language_id="lang_L1"))
+    session.commit()
+
+    assert resolver.for_unit("unit_U2").iso1 == "fr"
+
+
+def test_exercise_language_comes_from_its_unit(course, detections):
+    resolver = LanguageResolver()
+
+    assert resolver.for_exercise("ex_E1").iso1 == "fr"
+    assert resolver.resolve("Bonjour", ex_id="ex_E1").iso1 == "fr"
+    assert resolver.for_exercise("ex_E404") is None
+    assert detections == []
+
+
+def test_texts_outside_a_supported_course_are_detected(course, session, detections):
+    session.add_all([Language(id="lang_L2", name="Klingon"), Unit(id="unit_U2", title="Battle cries", language_id="lang_L2")])
+    session.commit()
+    resolver = LanguageResolver()
+
+    assert resolver.resolve("Hello there") is DETECTED
+    assert resolver.resolve("Qapla'", unit_id="unit_U2") is DETECTED
+    assert detections == ["Hello there", "Qapla'"]
+
+
+def test_language_update_invalidates_the_cache(course, shared_resolver):
+    assert shared_resolver.for_unit("unit_U1").iso1 == "fr"
+
+    LanguageService().update("lang_L1", LanguageDict(name="Spanish", iso1="es"))
+
+    assert shared_resolver.for_unit("unit_U1").iso1 == "es"
+
+
+def test_unit_moved_to_another_language_invalidates_the_cache(course, session, shared_resolver):
+    session.add(Language(id="lang_L2", name="Italian", iso1="it"))
+    session.commit()
+    assert shared_resolver.for_unit("unit_U1").iso1 == "fr"
+
+    UnitService().update("unit_U1", UnitDict(language_id="lang_L2", title="Greetings"))
+
+    assert shared_resolver.for_unit("unit_U1").iso1 == "it"
+
+
+def test_clear_forgets_cached_languages(course, session, shared_resolver):
+    assert shared_resolver.for_unit("unit_U1").iso1 == "fr"
+
+    # Changed behind the services' back, only an explicit clear() sees it
+    session.get(Language, "lang_L1").iso1 = "pt"
+    session.commit()
+    assert shared_resolver.for_unit("unit_U1").iso1 == "fr"
+
+    shared_resolver.clear()
+    assert shared_resolver.for_unit("unit_U1").iso1 == "pt"
@@ -0,0 +1,164 @@
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lapp.utils import language_tool
+from lapp.utils.language_tool import LANGUAGE_TOOL_BACKENDS, LanguageToolPool, StubLanguageTool
+
+
+class RecordingTool(StubLanguageTool):
+    """Stub instance recording the texts it checks, whose check raises while crashed."""
+
+    def __init__(self, language, crashed=False):
+        super().__init__(language, matches={"Je suis allé": ["match"]})
+        self.crashed = crashed
+        self.checked = []
+
+    def check(self, text):
+        self.checked.append(text)
+        if self.crashed:
+            raise RuntimeError("LanguageTool server crashed")
+        return super().check(text)
+
+
+class RecordingBackend:
+    """Backend factory keeping every instance it starts. The next `crashes` instances start crashed."""
+
+    def __init__(self):
+        self.started = []
+        self.crashes = 0
+
+    def __call__(self, language):
+        tool = RecordingTool(language, crashed=self.crashes > 0)
+        self.crashes = max(0, self.crashes - 1)
+        self.started.append(tool)
+        return tool
+
+    def languages(self):
+        return [tool.language for tool in self.started]
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = RecordingBackend()
+    monkeypatch.setitem(LANGUAGE_TOOL_BACKENDS, "recording", backend)
+    return backend
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manual clock, replacing time.monotonic() in the pool module only."""
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(language_tool, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_init_app_configures_the_stub_backend(app):
+    pool = LanguageToolPool()
+    pool.init_app(app)
+
+    assert pool.backend == "stub"
+    assert pool.check("fr", "Je suis allé") == []
+    assert pool.loaded_languages() == ["fr"]
+
+
+def test_init_app_rejects_an_unknown_backend(app):
+    app.config["LANGUAGE_TOOL_BACKEND"] = "missing"
+
+    with pytest.raises(ValueError):
+        LanguageToolPool().init_app(app)
+
+
+def test_instances_start_on_first_check_and_are_reused(backend):
+    pool = LanguageToolPool(backend="recording")
+    assert backend.started == []
+    assert pool.loaded_languages() == []
+
+    assert pool.check("fr", "Je suis allé") == ["match"]
+    assert pool.check("fr", "Bonjour") == []
+
+    assert backend.languages() == ["fr"]
+    assert backend.started[0].checked == ["Je suis allé", "Bonjour"]
+
+
+def test_concurrent_first_checks_start_a_single_instance(backend):
+    pool = LanguageToolPool(backend="recording")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: pool.check("fr", "Je suis allé"), range(32)))
+
+    assert results == [["match"]] * 32
+    assert backend.languages() == ["fr"]
+
+
+def test_least_recently_used_language_is_evicted(backend):
+    pool = LanguageToolPool(backend="recording", max_languages=2)
+
+    pool.check("fr", "a")
+    pool.check("de", "b")
+    pool.check("fr", "c")
+    pool.check("es", "d")
+
+    assert pool.loaded_languages() == ["fr", "es"]
+    fr, de, es = backend.started
+    assert de.closed and not fr.closed and not es.closed
+
+    # An evicted language is started again on its next check
+    pool.check("de", "e")
+    assert backend.languages() == ["fr", "de", "es", "de"]
+    assert pool.loaded_languages() == ["es", "de"]
+    assert fr.closed
+
+
+def test_idle_instance_is_probed_after_the_health_check_interval(backend, clock):
+    pool = LanguageToolPool(backend="recording", health_check_interval=60)
+
+    pool.check("fr", "a")
+    clock.now += 30
+    pool.check("fr", "b")
+    clock.now += 60
+    pool.check("fr", "c")
+    pool.check("fr", "d")
+
+    # Only the check coming 60s after the previous one is probed
+    assert backend.started[0].checked == ["a", "b", "ok", "c", "d"]
+
+
+def test_crashed_instance_is_restarted_and_the_check_retried(backend):
+    backend.crashes = 1
+    pool = LanguageToolPool(backend="recording")
+
+    assert pool.check("fr", "Je suis allé") == ["match"]
+
+    crashed, restarted = backend.started
+    assert crashed.closed and crashed.checked == ["Je suis allé"]
+    assert restarted.checked == ["Je suis allé"]
+    assert pool.loaded_languages() == ["fr"]
+
+
+def test_failed_probe_restarts_the_instance(backend, clock):
+    pool = LanguageToolPool(backend="recording", health_check_interval=60)
+    pool.check("fr", "a")
+
+    # The server dies while idle: the probe fails instead of the check
+    backend.started[0].crashed = True
+    clock.now += 60
+    assert pool.check("fr", "Je suis allé") == ["match"]
+
+    crashed, restarted = backend.started
+    assert crashed.checked == ["a", "ok"] and crashed.closed
+    assert restarted.checked == ["Je suis allé"]
+
+
+def test_check_fails_when_the_restarted_instance_fails_too(backend):
+    backend.crashes = 2
+    pool = LanguageToolPool(backend="recording")
+
+    with pytest.raises(RuntimeError, match="crashed"):
+        pool.check("fr", "a")
+
+    assert len(backend.started) == 2
+    # The next check replaces the failed instance
+    assert pool.check("fr", "Je suis allé") == ["match"]
+    assert len(backend.started) == 3
@@ -0,0 +1,57 @@
+import numpy as np
+from sqlalchemy import func, select
+
+from lapp.models.features import ExerciseReference
+from lapp.schemas import ExerciseDict
+from lapp.services.features.exercise import ExerciseService
+from lapp.services.reference import ReferenceService
+
+
+class CountingEncoder:
+    """Stands in for the embedding model, recording the texts it encodes."""
+
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, text):
+        self.texts.append(text)
+        return np.arange(4, dtype=np.float64) + len(text)
+
+
+def _update_answer(ex_id, answer):
+    ExerciseService().update(ex_id, ExerciseDict(unit_id="unit_U1", exercise_type="translate", question="Hello", answer=answer))
+
+
+def test_text_embedding_is_encoded_once(course):
+    service, encode = ReferenceService(), CountingEncoder()
+
+    first = service.get_text_embedding("ex_E1", "Bonjour", "model", encode)
+    second = service.get_text_embedding("ex_E1", "Bonjour", "model", encode)
+
+    assert encode.texts == ["Bonjour"]
+    assert second.dtype == np.float32
+    np.testing.assert_array_equal(first, second)
+
+
+def test_changed_reference_or_model_is_encoded_again(course, session):
+    service, encode = ReferenceService(), CountingEncoder()
+
+    service.get_text_embedding("ex_E1", "Bonjour", "model", encode)
+    salut = service.get_text_embedding("ex_E1", "Salut", "model", encode)
+    service.get_text_embedding("ex_E1", "Salut", "other-model", encode)
+
+    assert encode.texts == ["Bonjour", "Salut", "Salut"]
+    np.testing.assert_array_equal(salut, np.arange(4) + len("Salut"))
+    # The stale vector is replaced, not kept next to the new one
+    assert session.scalar(select(func.count()).select_from(ExerciseReference)) == 1
+
+
+def test_answer_change_invalidates_the_cached_embedding(course, session):
+    ReferenceService().get_text_embedding("ex_E1", "Bonjour", "model", CountingEncoder())
+
+    _update_answer("ex_E1", "Bonjour")
+    assert session.get(ExerciseReference, ("ex_E1", "text_embedding")) is not None
+
+    _update_answer("ex_E1", "Salut")
+    session.expire_all()
+    assert session.get(ExerciseReference, ("ex_E1", "text_embedding")) is None
@@ -0,0 +1,56 @@
+import numpy as np
+from sqlalchemy import event, select
+
+from lapp.core.database import db_manager
+from lapp.models import Exercise
+from lapp.tasks.rescore import recompute_table
+
+
+def _add_exercises(session, count):
+    session.add_all(
+        Exercise(id=f"ex_E{number}", unit_id="unit_U1", exercise_type="translate", question="Hello", answer="Bonjour", score=0)
+        for number in range(2, count + 1)
+    )
+    session.commit()
+
+
+def test_recompute_table_streams_every_row_once_across_chunks(course, session):
+    # 23 rows in chunks of 7: three full chunks and a partial one, with ex_E9 -> ex_E10
+    # crossing an ID length, where plain string order would go wrong
+    _add_exercises(session, 23)
+    chunks = []
+
+    def number_rows(columns):
+        chunks.append(columns["id"].tolist())
+        return {"score": np.array([int(row_id.removeprefix("ex_E")) for row_id in columns["id"]])}
+
+    # Number of rows written by each UPDATE sent to the database
+    writes = []
+
+    @event.listens_for(db_manager.engine, "before_cursor_execute")
+    def count_writes(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE"):
+            writes.append(len(parameters) if executemany else 1)
+
+    total = recompute_table(Exercise, number_rows, ["score"], chunk_size=7)
+
+    assert total == 23
+    assert [len(chunk) for chunk in chunks] == [7, 7, 7, 2]
+    seen = [row_id for chunk in chunks for row_id in chunk]
+    assert seen == [f"ex_E{number}" for number in range(1, 24)]
+    # One executemany per chunk, one row each
+    assert writes == [7, 7, 7, 2]
+
+    session.expire_all()
+    scores = dict(session.execute(select(Exercise.id, Exercise.score)).all())
+    assert scores == {f"ex_E{number}": number for number in range(1, 24)}
+
+
+def test_recompute_table_stops_on_an_exact_last_chunk(course, session):
+    _add_exercises(session, 14)
+    chunks = []
+
+    total = recompute_table(Exercise, lambda columns: chunks.append(len(columns["id"])) or {}, ["score"], chunk_size=7)
+
+    assert total == 14
+    assert chunks == [7, 7]
@@ -0,0 +1,141 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from lapp.utils import helpers, scoring
+
+TODAY = date(2026, 3, 15)
+
+
+class PinnedDate(date):
+    @classmethod
+    def today(cls):
+        return TODAY
+
+
+@pytest.fixture
+def pinned_today(monkeypatch):
+    """Pin date.today() in helpers, which computes from today with no way to pass it."""
+    monkeypatch.setattr(helpers, "date", PinnedDate)
+    return TODAY
+
+
+@pytest.fixture
+def pinned_scoring_today(monkeypatch, pinned_today):
+    """
+    Also pin date.today() in scoring, for its defaults when no reference date is given.
+
+    scoring checks isinstance(value, date) against the patched class, so tests using
+    this fixture only pass date columns, never a single date.
+    """
+    monkeypatch.setattr(scoring, "date", PinnedDate)
+    return TODAY
+
+
+@pytest.fixture
+def items():
+    """Random review columns, with the bounds of every range included."""
+    rng = np.random.default_rng(42)
+    size = 1000
+
+    created_days = rng.integers(0, 800, size)
+    seen_days = (created_days * rng.uniform(0, 1, size)).astype(int)
+    return {
+        "scores": np.concatenate([[0.0, 100.0, 0.0, 100.0], rng.uniform(0, 100, size - 4)]),
+        "similarities": np.concatenate([[0.0, 1.0, 1.0, 0.0], rng.uniform(0, 1, size - 4)]),
+        "difficulties": np.concatenate([[0.0, 1.0, 0.0, 1.0], rng.uniform(0, 1, size - 4)]),
+        "created_at": [TODAY - timedelta(days=int(days)) for days in created_days],
+        "last_seen": [TODAY - timedelta(days=int(days)) for days in seen_days],
+    }
+
+
+def test_compute_recency_weights_matches_scalar(pinned_today, items):
+    expected = [
+        helpers.compute_recency_weight(created_at, last_seen)
+        for created_at, last_seen in zip(items["created_at"], items["last_seen"])
+    ]
+
+    actual = scoring.compute_recency_weights(items["created_at"], items["last_seen"], today=TODAY)
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+
+def test_compute_recency_weights_default_to_today(pinned_scoring_today, items):
+    expected = scoring.compute_recency_weights(items["created_at"], items["last_seen"], today=[TODAY] * len(items["created_at"]))
+
+    np.testing.assert_allclose(scoring.compute_recency_weights(items["created_at"], items["last_seen"]), expected, rtol=1e-12)
+
+
+def test_update_scores_matches_scalar(pinned_today, items):
+    expected = [
+        helpers.update_score(score, last_seen, similarity, created_at=created_at, difficulty=difficulty)
+        for score, last_seen, similarity, created_at, difficulty in zip(
+            items["scores"], items["last_seen"], items["similarities"], items["created_at"], items["difficulties"]
+        )
+    ]
+
+    actual = scoring.update_scores(
+        items["scores"], items["last_seen"], items["similarities"],
+        created_at=items["created_at"], difficulties=items["difficulties"], today=TODAY
+    )
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-4)
+
+
+def test_update_scores_default_to_today(pinned_scoring_today, items):
+    expected = [
+        helpers.update_score(score, last_seen, similarity, created_at=TODAY, difficulty=difficulty, scale=3.0)
+        for score, last_seen, similarity, difficulty in zip(
+            items["scores"], items["last_seen"], items["similarities"], items["difficulties"]
+        )
+    ]
+
+    actual = scoring.update_scores(
+        items["scores"], items["last_seen"], items["similarities"], difficulties=items["difficulties"], scale=3.0
+    )
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-4)
+
+
+def test_update_difficulties_matches_scalar(pinned_today, items):
+    expected = [
+        helpers.update_difficulty(score, last_seen, difficulty, created_at=created_at, scale=2.0, alpha=0.5)
+        for score, last_seen, difficulty, created_at in zip(
+            items["scores"], items["last_seen"], items["difficulties"], items["created_at"]
+        )
+    ]
+
+    actual = scoring.update_difficulties(
+        items["scores"], items["last_seen"], items["difficulties"],
+        created_at=items["created_at"], scale=2.0, alpha=0.5, today=TODAY
+    )
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_update_difficulties_default_to_today(pinned_scoring_today, items):
+    expected = [
+        helpers.update_difficulty(score, last_seen, difficulty, created_at=TODAY)
+        for score, last_seen, difficulty in zip(items["scores"], items["last_seen"], items["difficulties"])
+    ]
+
+    actual = scoring.update_difficulties(items["scores"], items["last_seen"], items["difficulties"])
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_compute_due_dates_matches_scalar(pinned_today, items):
+    expected = [
+        helpers.compute_due_date(score, difficulty, reviewed_on=last_seen)
+        for score, difficulty, last_seen in zip(items["scores"], items["difficulties"], items["last_seen"])
+    ]
+
+    actual = scoring.compute_due_dates(items["scores"], items["difficulties"], items["last_seen"])
+    assert actual.dtype == np.dtype("datetime64[D]")
+    assert actual.astype(object).tolist() == expected
+
+
+def test_compute_due_dates_matches_scalar_reviewed_today(pinned_today, items):
+    expected = [
+        helpers.compute_due_date(score, difficulty, max_interval=30)
+        for score, difficulty in zip(items["scores"], items["difficulties"])
+    ]
+
+    actual = scoring.compute_due_dates(items["scores"], items["difficulties"], [TODAY] * len(expected), max_interval=30)
+    assert actual.astype(object).tolist() == expected